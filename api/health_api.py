@@ -1,52 +1,66 @@
 # api/health_api.py
-from fastapi import APIRouter
+import asyncio
+import time
+from fastapi import APIRouter, Depends
 from datetime import datetime
 from typing import Dict
 
-from services.database_service import get_database_service
+from services.database_service import DatabaseService, get_db
 
 # 누락된 router 정의 추가
 router = APIRouter()
 
+# 초 단위로 캐시한 ISO 타임스탬프 [문자열, 기준 epoch 초] (헬스체크 폴링마다 datetime 생성 방지)
+_timestamp_cache = ["", -1]
+
+def _current_timestamp() -> str:
+    """현재 시각 ISO 문자열 (같은 초 안에서는 캐시된 값 재사용)"""
+    now_s = int(time.time())
+    if now_s != _timestamp_cache[1]:
+        _timestamp_cache[0] = datetime.fromtimestamp(now_s).isoformat()
+        _timestamp_cache[1] = now_s
+    return _timestamp_cache[0]
+
 @router.get("/health")
-async def health_check():
+async def health_check(db_service: DatabaseService = Depends(get_db)):
     """API 서버와 데이터베이스 상태를 확인합니다."""
     
     components = {}
     
+    # DB 연결 확인과 파이프라인 로그 조회를 동시에 실행 (응답 시간 = 가장 느린 probe)
+    db_result, log_result = await asyncio.gather(
+        db_service.test_connection(),
+        db_service.get_latest_pipeline_log(),
+        return_exceptions=True
+    )
+    
     # 데이터베이스 상태 확인
-    try:
-        db_service = get_database_service()
-        db_service.test_connection()  # await 제거 (동기 함수)
+    if isinstance(db_result, BaseException):
         components["mysql_database"] = {
-            "status": "ok",
-            "message": "MySQL 연결 정상"
+            "status": "error",
+            "message": f"MySQL 연결 실패: {db_result}"
         }
-    except Exception as e:
+    else:
         components["mysql_database"] = {
-            "status": "error",
-            "message": f"MySQL 연결 실패: {e}"
+            "status": "ok",
+            "message": "MySQL 연결 정상"
         }
     
     # 백그라운드 파이프라인 상태 확인
-    try:
-        db_service = get_database_service()
-        latest_log = db_service.get_latest_pipeline_log()  # await 제거
-        
-        if latest_log and latest_log.get("final_status") == "success":
-            components["background_pipeline"] = {
-                "status": "ok",
-                "message": f"최근 실행 성공: {latest_log.get('completed_at')}"
-            }
-        else:
-            components["background_pipeline"] = {
-                "status": "warning",
-                "message": "최근 실행 로그 없음 또는 실패"
-            }
-    except Exception as e:
+    if isinstance(log_result, BaseException):
         components["background_pipeline"] = {
             "status": "error",
-            "message": f"파이프라인 상태 확인 실패: {e}"
+            "message": f"파이프라인 상태 확인 실패: {log_result}"
+        }
+    elif log_result and log_result.get("final_status") == "success":
+        components["background_pipeline"] = {
+            "status": "ok",
+            "message": f"최근 실행 성공: {log_result.get('completed_at')}"
+        }
+    else:
+        components["background_pipeline"] = {
+            "status": "warning",
+            "message": "최근 실행 로그 없음 또는 실패"
         }
     
     # 전체 상태 결정
@@ -55,7 +69,7 @@ async def health_check():
     
     return {
         "status": overall_status,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _current_timestamp(),
         "components": components,
         "message": "모든 서비스 정상" if all_ok else "일부 서비스에 문제가 있습니다."
     }
\ No newline at end of file
@@ -1,26 +1,36 @@
 # api/news_api.py (안전한 버전)
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Dict, Optional
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
-import json
 from pathlib import Path
 import pandas as pd
 
-from services.database_service import get_database_service
+from config import CACHE_TTL_LATEST_NEWS, CACHE_TTL_PIPELINE_STATUS, DATA2_DIR
+from services.database_service import DatabaseService, get_db
+from services.response_cache import (
+    CACHE_CONTROL_HEADER, compute_data_etag, etag_matches, response_cache
+)
+from services.result_files import find_latest_result_file, load_result_file
 
 router = APIRouter()
 
 CSV_FILE_PATH = Path(__file__).parent.parent / "data" / "Past_news.csv"
 df_past_news = None
+# 검색용 소문자 "제목\n요약" 텍스트 (df_past_news와 같은 인덱스, 로드 시 한 번만 생성)
+past_news_search_text = None
 
 def load_csv_data():
-    """서버 시작 시 CSV 파일을 안전하게 로드하고, 컬럼명을 표준화하는 함수"""
-    global df_past_news
+    """서버 시작 시 CSV 파일을 안전하게 로드하고, 컬럼명을 표준화하는 함수
+    동기 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출할 것"""
+    global df_past_news, past_news_search_text
     try:
         if not CSV_FILE_PATH.is_file():
             raise FileNotFoundError(f"{CSV_FILE_PATH} 파일을 찾을 수 없습니다.")
         
-        df = pd.read_csv(CSV_FILE_PATH)
+        # 모든 컬럼을 문자열로, 빈 칸은 NaN 대신 ''로 바로 읽음 (타입 추론/float NaN 컬럼/fillna 복사본 생략)
+        # utf-8-sig: 파일 앞의 BOM이 첫 컬럼명('ID')에 붙지 않도록 제거
+        df = pd.read_csv(CSV_FILE_PATH, dtype=str, keep_default_na=False, encoding='utf-8-sig')
         
         print("✅ Past_news.csv에서 원본 그대로 읽은 컬럼명:", df.columns.tolist())
 
@@ -39,7 +49,6 @@ def load_csv_data():
         df.rename(columns=column_mapping, inplace=True)
         # --- ▲▲▲ 핵심 수정 부분 끝 ▲▲▲ ---
         
-        df = df.fillna('')
         if 'id' not in df.columns or df['id'].astype(str).duplicated().any():
             df['id'] = df.index.astype(str)
         
@@ -48,6 +57,8 @@ def load_csv_data():
             df['source'] = '과거 이슈 DB'
 
         df_past_news = df
+        # 요청마다 두 컬럼을 lower() 하지 않도록 검색 대상 텍스트를 미리 합쳐 둠
+        past_news_search_text = (df['title'] + '\n' + df['summary']).str.lower()
         print(f"✅ Past_news.csv 데이터 표준화 및 로드 성공. 총 {len(df_past_news)}개 뉴스.")
         print("   -> 코드에서 사용할 컬럼명:", df_past_news.columns.tolist())
 
@@ -55,63 +66,101 @@ def load_csv_data():
         df_past_news = pd.DataFrame()
         print(f"❌ Past_news.csv 파일 로드/처리 실패: {e}")
 
-load_csv_data()
+# CSV 로드는 import 시점이 아니라 main.py lifespan에서 스레드로 실행 (다른 초기화와 동시에 진행)
 
 @router.get("/latest")
-async def get_latest_news_issues():
+async def get_latest_news_issues(request: Request, response: Response, db: DatabaseService = Depends(get_db)):
     """최신 뉴스 이슈들을 MySQL에서 조회하고 RAG 분석 상세 정보를 포함합니다."""
+    cache_key = "news:latest"
+    if_none_match = request.headers.get("if-none-match")
+    
+    cached = response_cache.get_fresh(cache_key, CACHE_TTL_LATEST_NEWS)
+    if cached is not None:
+        etag, body = cached
+        return _conditional_response(response, if_none_match, etag, body, "HIT")
+    
     try:
-        db_service = get_database_service()
+        # 데이터 버전이 같으면 본문 조회/가공 없이 304 반환
+        etag = await compute_data_etag(db)
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
         
-        news_issues = await db_service.get_latest_news_issues()
+        body = await _build_latest_news_response(db)
+        response_cache.set(cache_key, (etag, body))
+        return _conditional_response(response, if_none_match, etag, body, "MISS")
         
-        if not news_issues:
-            # MySQL에 데이터가 없으면 fallback: 최신 JSON 파일에서 로드
-            fallback_data = _load_fallback_data()
-            if fallback_data:
-                # 백업 데이터에도 상세 정보 추가
-                enriched_fallback = _enrich_with_rag_details(fallback_data)
-                return {
-                    "success": True,
-                    "data": {
-                        "issues": enriched_fallback,
-                        "count": len(enriched_fallback),
-                        "source": "파일 백업 데이터",
-                        "last_updated": "백그라운드 업데이트 대기 중"
-                    }
-                }
-            else:
-                return {
-                    "success": True,
-                    "data": {
-                        "issues": [],
-                        "count": 0,
-                        "source": "데이터 없음",
-                        "message": "백그라운드 파이프라인이 첫 실행을 완료할 때까지 기다려주세요."
-                    }
+    except Exception as e:
+        # DB 장애 시 마지막으로 성공한 응답을 대신 반환
+        stale = response_cache.get_stale(cache_key)
+        if stale is not None:
+            etag, body = stale
+            return _conditional_response(response, if_none_match, etag, body, "STALE")
+        raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {e}")
+
+def _not_modified(etag: str) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL_HEADER})
+
+def _conditional_response(response: Response, if_none_match: Optional[str], etag: Optional[str], body: Dict, cache_status: str):
+    """ETag가 일치하면 304, 아니면 캐시 헤더를 붙여 본문 반환"""
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    
+    response.headers["X-Cache"] = cache_status
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL_HEADER
+    return body
+
+async def _build_latest_news_response(db: DatabaseService) -> Dict:
+    """/latest 응답 본문 생성 (MySQL 우선, 없으면 파일 백업 데이터)
+    DB 오류는 그대로 전달해 호출자가 캐시를 덮어쓰지 않고 마지막 응답을 반환하도록 함"""
+    news_issues = await db.get_latest_news_issues(raise_errors=True)
+    
+    if not news_issues:
+        # MySQL에 데이터가 없으면 fallback: 최신 JSON 파일에서 로드
+        fallback_data = await _load_fallback_data()
+        if fallback_data:
+            # 백업 데이터에도 상세 정보 추가
+            enriched_fallback = _enrich_with_rag_details(fallback_data)
+            return {
+                "success": True,
+                "data": {
+                    "issues": enriched_fallback,
+                    "count": len(enriched_fallback),
+                    "source": "파일 백업 데이터",
+                    "last_updated": "백그라운드 업데이트 대기 중"
                 }
-        
-        # MySQL 데이터에 RAG 상세 정보 추가
-        enriched_issues = _enrich_with_rag_details(news_issues)
-        
-        return {
-            "success": True,
-            "data": {
-                "issues": enriched_issues,
-                "count": len(enriched_issues),
-                "source": "MySQL 실시간 데이터",
-                "last_updated": news_issues[0].get("updated_at") if news_issues else None,
-                # 추가: RAG 분석 메타데이터
-                "rag_metadata": {
-                    "verification_enabled": True,
-                    "confidence_calculation": "multi_dimensional",
-                    "scoring_method": "hybrid_vector_ai"
+            }
+        else:
+            return {
+                "success": True,
+                "data": {
+                    "issues": [],
+                    "count": 0,
+                    "source": "데이터 없음",
+                    "message": "백그라운드 파이프라인이 첫 실행을 완료할 때까지 기다려주세요."
                 }
             }
+    
+    # MySQL 데이터에 RAG 상세 정보 추가
+    enriched_issues = _enrich_with_rag_details(news_issues)
+    
+    return {
+        "success": True,
+        "data": {
+            "issues": enriched_issues,
+            "count": len(enriched_issues),
+            "source": "MySQL 실시간 데이터",
+            "last_updated": news_issues[0].get("updated_at") if news_issues else None,
+            # 추가: RAG 분석 메타데이터
+            "rag_metadata": {
+                "verification_enabled": True,
+                "confidence_calculation": "multi_dimensional",
+                "scoring_method": "hybrid_vector_ai"
+            }
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {e}")
+    }
 
 @router.get("/past", summary="과거 뉴스 목록 조회(CSV 기반)", description="data/Past_news.csv 파일에서 과거 뉴스 데이터를 조회합니다.")
 async def get_past_news(
@@ -125,165 +174,182 @@ async def get_past_news(
         raise HTTPException(status_code=500, detail="서버에 과거 뉴스 데이터(CSV)가 로드되지 않았습니다.")
     
     try:
-        df_filtered = df_past_news.copy()
+        # 불리언 인덱싱은 항상 새 DataFrame을 만들고 이후 단계는 원본을 수정하지 않으므로 전체 복사 불필요
+        df_filtered = df_past_news
 
         if search:
-            search_term = search.lower()
-            df_filtered = df_filtered[
-                df_filtered['title'].str.lower().str.contains(search_term, na=False) |
-                df_filtered['summary'].str.lower().str.contains(search_term, na=False)
-            ]
+            # 정규식이 아닌 단순 부분 문자열 검색 (특수문자 입력에도 안전)
+            search_mask = past_news_search_text.str.contains(search.lower(), regex=False)
+            df_filtered = df_filtered[search_mask]
 
+        # 산업 필터는 검색으로 이미 좁혀진 행에만 적용 (둘 다 주어지면 작은 집합에서 두 번째 스캔)
         if industry:
             df_filtered = df_filtered[
-                df_filtered['related_industries'].str.contains(industry, na=False)
+                df_filtered['related_industries'].str.contains(industry, regex=False)
             ]
 
         total_count = len(df_filtered)
         df_result = df_filtered.head(limit)
-        data_to_return = df_result.to_dict(orient='records')
+        # 행마다 dict를 만들지 않고 pandas의 C JSON writer로 바로 직렬화 (모든 컬럼이 문자열이라 결과 동일)
+        data_json = df_result.to_json(orient='records', force_ascii=False)
 
-        return {
-            "success": True,
-            "total": total_count,
-            "data": data_to_return
-        }
+        body = f'{{"success":true,"total":{total_count},"data":{data_json}}}'
+        return Response(content=body.encode('utf-8'), media_type="application/json")
     except Exception as e:
         print(f"❌ 과거 뉴스 처리 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
-    """이슈 데이터에 RAG 분석의 상세 정보를 추가합니다."""
-    enriched = []
+# 점수 구성 상세 (가중치가 고정이라 항목마다 새로 만들지 않고 모듈 상수를 참조로 재사용)
+_SCORE_BREAKDOWN_PENALTY = {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": True}
+_SCORE_BREAKDOWN_NO_PENALTY = {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": False}
+
+# 검증 정보가 없을 때의 기본값 (읽기 전용으로 참조 공유)
+_DEFAULT_VERIFICATION = {"is_grounded": False, "supporting_quote": ""}
+
+# 문자열 등 dict가 아닌 항목을 변환할 때 쓰는 템플릿 (name만 덮어써서 복사)
+_FALLBACK_INDUSTRY_TEMPLATE = {
+    "name": "",
+    "final_score": 0,
+    "vector_score": 0,
+    "ai_score": 0,
+    "ai_reason": "구조 변환됨",
+    "description": "",
+    "verification": _DEFAULT_VERIFICATION,
+    "score_breakdown": _SCORE_BREAKDOWN_PENALTY
+}
+_FALLBACK_PAST_ISSUE_TEMPLATE = dict(_FALLBACK_INDUSTRY_TEMPLATE, period="N/A")
+
+def _score_breakdown(verification: Optional[Dict]) -> Dict:
+    """검증 결과에 따라 패널티 적용 여부가 다른 점수 구성 반환 (검증 정보가 없으면 패널티 없음)"""
+    if verification is None or verification.get("is_grounded", True):
+        return _SCORE_BREAKDOWN_NO_PENALTY
+    return _SCORE_BREAKDOWN_PENALTY
+
+def _detail_industry(industry) -> Dict:
+    """관련 산업 항목 하나를 상세 구조로 변환"""
+    if not isinstance(industry, dict):
+        # 문자열이나 다른 형태인 경우 기본 구조로 변환
+        return dict(_FALLBACK_INDUSTRY_TEMPLATE, name=str(industry))
     
-    for issue in issues:
-        enriched_issue = issue.copy()
-        
-        # 🔥 안전한 관련 산업 상세 정보 추가
-        raw_industries = issue.get("관련산업", [])
-        if isinstance(raw_industries, list):
-            detailed_industries = []
-            for industry in raw_industries:
-                if isinstance(industry, dict):
-                    detailed_industry = {
-                        "name": industry.get("name", "산업명 없음"),
-                        "final_score": industry.get("final_score", 0),
-                        "vector_score": industry.get("vector_score", 0),
-                        "ai_score": industry.get("ai_score", 0),
-                        "ai_reason": industry.get("ai_reason", ""),
-                        "description": industry.get("description", ""),
-                        # 검증 정보 안전하게 추가
-                        "verification": industry.get("verification", {
-                            "is_grounded": False,
-                            "supporting_quote": ""
-                        }),
-                        # 점수 구성 상세
-                        "score_breakdown": {
-                            "vector_weight": 0.3,
-                            "ai_weight": 0.7,
-                            "penalty_applied": not industry.get("verification", {}).get("is_grounded", True)
-                        }
-                    }
-                    detailed_industries.append(detailed_industry)
-                else:
-                    # 문자열이나 다른 형태인 경우 기본 구조로 변환
-                    detailed_industries.append({
-                        "name": str(industry),
-                        "final_score": 0,
-                        "vector_score": 0,
-                        "ai_score": 0,
-                        "ai_reason": "구조 변환됨",
-                        "description": "",
-                        "verification": {"is_grounded": False, "supporting_quote": ""},
-                        "score_breakdown": {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": True}
-                    })
-            enriched_issue["관련산업_상세"] = detailed_industries
-        
-        # 🔥 안전한 관련 과거 이슈 상세 정보 추가
-        raw_past_issues = issue.get("관련과거이슈", [])
-        if isinstance(raw_past_issues, list):
-            detailed_past_issues = []
-            for past_issue in raw_past_issues:
-                if isinstance(past_issue, dict):
-                    detailed_past_issue = {
-                        "name": past_issue.get("name", "이슈명 없음"),
-                        "final_score": past_issue.get("final_score", 0),
-                        "vector_score": past_issue.get("vector_score", 0),
-                        "ai_score": past_issue.get("ai_score", 0),
-                        "ai_reason": past_issue.get("ai_reason", ""),
-                        "description": past_issue.get("description", ""),
-                        "period": past_issue.get("period", "N/A"),
-                        # 검증 정보 안전하게 추가
-                        "verification": past_issue.get("verification", {
-                            "is_grounded": False,
-                            "supporting_quote": ""
-                        }),
-                        # 점수 구성 상세
-                        "score_breakdown": {
-                            "vector_weight": 0.3,
-                            "ai_weight": 0.7,
-                            "penalty_applied": not past_issue.get("verification", {}).get("is_grounded", True)
-                        }
-                    }
-                    detailed_past_issues.append(detailed_past_issue)
-                else:
-                    # 문자열이나 다른 형태인 경우 기본 구조로 변환
-                    detailed_past_issues.append({
-                        "name": str(past_issue),
-                        "final_score": 0,
-                        "vector_score": 0,
-                        "ai_score": 0,
-                        "ai_reason": "구조 변환됨",
-                        "description": "",
-                        "period": "N/A",
-                        "verification": {"is_grounded": False, "supporting_quote": ""},
-                        "score_breakdown": {"vector_weight": 0.3, "ai_weight": 0.7, "penalty_applied": True}
-                    })
-            enriched_issue["관련과거이슈_상세"] = detailed_past_issues
-        
+    verification = industry.get("verification")
+    return {
+        "name": industry.get("name", "산업명 없음"),
+        "final_score": industry.get("final_score", 0),
+        "vector_score": industry.get("vector_score", 0),
+        "ai_score": industry.get("ai_score", 0),
+        "ai_reason": industry.get("ai_reason", ""),
+        "description": industry.get("description", ""),
+        # 검증 정보 안전하게 추가
+        "verification": verification if verification is not None else _DEFAULT_VERIFICATION,
+        # 점수 구성 상세
+        "score_breakdown": _score_breakdown(verification)
+    }
+
+def _detail_past_issue(past_issue) -> Dict:
+    """관련 과거 이슈 항목 하나를 상세 구조로 변환"""
+    if not isinstance(past_issue, dict):
+        # 문자열이나 다른 형태인 경우 기본 구조로 변환
+        return dict(_FALLBACK_PAST_ISSUE_TEMPLATE, name=str(past_issue))
+    
+    verification = past_issue.get("verification")
+    return {
+        "name": past_issue.get("name", "이슈명 없음"),
+        "final_score": past_issue.get("final_score", 0),
+        "vector_score": past_issue.get("vector_score", 0),
+        "ai_score": past_issue.get("ai_score", 0),
+        "ai_reason": past_issue.get("ai_reason", ""),
+        "description": past_issue.get("description", ""),
+        "period": past_issue.get("period", "N/A"),
+        # 검증 정보 안전하게 추가
+        "verification": verification if verification is not None else _DEFAULT_VERIFICATION,
+        # 점수 구성 상세
+        "score_breakdown": _score_breakdown(verification)
+    }
+
+def _detail_items(raw_items, detail_fn) -> Tuple[List[Dict], int]:
+    """항목 목록을 상세 구조로 변환하면서 검증 통과(is_grounded) 개수도 한 번에 계산"""
+    if not isinstance(raw_items, list):
+        return [], 0
+    
+    details = []
+    verified_count = 0
+    for item in raw_items:
+        detail = detail_fn(item)
+        if detail["verification"].get("is_grounded", False):
+            verified_count += 1
+        details.append(detail)
+    return details, verified_count
+
+def _confidence_detail(issue: Dict, total_verified_items: int) -> Dict:
+    """RAG 신뢰도 상세 정보 구성"""
+    rag_confidence = issue.get("RAG분석신뢰도", {})
+    if isinstance(rag_confidence, dict):
+        consistency_score = rag_confidence.get("consistency_score", 0)
+        peak_relevance_score = rag_confidence.get("peak_relevance_score", 0)
+    elif isinstance(rag_confidence, (int, float)):
+        # 구 버전 호환
+        consistency_score = float(rag_confidence)
+        peak_relevance_score = float(rag_confidence)
+    else:
+        consistency_score = 0
+        peak_relevance_score = 0
+    
+    return {
+        "consistency_score": consistency_score,
+        "peak_relevance_score": peak_relevance_score,
+        "calculation_method": "평균 일관성 + 최고 연관도",
+        "total_verified_items": total_verified_items
+    }
+
+def _enrich_issue(issue: Dict) -> Dict:
+    """이슈 하나에 RAG 상세 정보를 붙인 새 dict 생성 (원본 이슈는 수정하지 않음)"""
+    # 🔥 안전한 관련 산업 / 과거 이슈 상세 정보 (리스트가 아니면 빈 목록)
+    detailed_industries, industries_verified = _detail_items(issue.get("관련산업", []), _detail_industry)
+    detailed_past_issues, past_verified = _detail_items(issue.get("관련과거이슈", []), _detail_past_issue)
+    
+    return {
+        **issue,
+        "관련산업_상세": detailed_industries,
+        "관련과거이슈_상세": detailed_past_issues,
         # 🔥 안전한 RAG 신뢰도 상세 정보 추가
-        rag_confidence = issue.get("RAG분석신뢰도", {})
-        if isinstance(rag_confidence, dict):
-            consistency_score = rag_confidence.get("consistency_score", 0)
-            peak_relevance_score = rag_confidence.get("peak_relevance_score", 0)
-        elif isinstance(rag_confidence, (int, float)):
-            # 구 버전 호환
-            consistency_score = float(rag_confidence)
-            peak_relevance_score = float(rag_confidence)
-        else:
-            consistency_score = 0
-            peak_relevance_score = 0
-        
-        enriched_issue["RAG분석신뢰도_상세"] = {
-            "consistency_score": consistency_score,
-            "peak_relevance_score": peak_relevance_score,
-            "calculation_method": "평균 일관성 + 최고 연관도",
-            "total_verified_items": sum(1 for ind in detailed_industries 
-                                      if ind.get("verification", {}).get("is_grounded", False)) +
-                                  sum(1 for past in detailed_past_issues 
-                                      if past.get("verification", {}).get("is_grounded", False))
-        }
-        
-        enriched.append(enriched_issue)
+        "RAG분석신뢰도_상세": _confidence_detail(issue, industries_verified + past_verified)
+    }
+
+# 마지막 보강 결과 (입력 지문, 결과) - 데이터가 그대로면 보강 루프를 다시 돌지 않음
+_enrichment_cache = [None, None]
+
+def _enrichment_key(issues: List[Dict]) -> tuple:
+    """입력 이슈 목록 지문 (DB 행은 id/updated_at, 파일 데이터는 제목/추출시간으로 구분)"""
+    return tuple(
+        (issue.get("id"), issue.get("updated_at"), issue.get("제목"), issue.get("추출시간"))
+        if isinstance(issue, dict) else issue
+        for issue in issues
+    )
+
+def _enrich_with_rag_details(issues: List[Dict]) -> List[Dict]:
+    """이슈 데이터에 RAG 분석의 상세 정보를 추가합니다. (반환 목록은 캐시와 공유되므로 수정 금지)"""
+    key = _enrichment_key(issues)
+    if _enrichment_cache[0] == key:
+        return _enrichment_cache[1]
     
+    enriched = [_enrich_issue(issue) for issue in issues]
+    _enrichment_cache[0], _enrichment_cache[1] = key, enriched
     return enriched
 
-def _load_fallback_data():
+async def _load_fallback_data():
+    """JSON 파일에서 백업 데이터를 로드합니다 (파일 탐색/파싱은 스레드에서 실행)."""
+    return await asyncio.to_thread(_read_fallback_data)
+
+def _read_fallback_data():
     """JSON 파일에서 백업 데이터를 로드합니다 (안전한 버전)."""
     try:
-        data_dir = Path("data2")
-        if not data_dir.exists():
-            return []
-        
-        # 가장 최근 파이프라인 결과 파일 찾기
-        pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
-        if not pipeline_files:
+        # 가장 최근 파이프라인 결과 파일 찾기 (디렉토리 mtime 기준 캐시)
+        latest_file = find_latest_result_file(DATA2_DIR)
+        if latest_file is None:
             return []
         
-        latest_file = max(pipeline_files, key=lambda p: p.stat().st_mtime)
-        
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # 파일 mtime이 그대로면 이전 파싱 결과 재사용 (orjson)
+        data = load_result_file(latest_file)
         
         # 🔥 다양한 파일 구조 처리
         issues = []
@@ -302,20 +368,43 @@ def _load_fallback_data():
         print(f"백업 데이터 로드 실패: {e}")
         return []
 
+# 캐시 만료 직후 동시에 들어온 상태 조회를 한 번의 DB 조회로 합치기 위한 락
+_pipeline_status_lock = asyncio.Lock()
+
 @router.get("/pipeline-status")
-async def get_pipeline_status():
+async def get_pipeline_status(response: Response, db: DatabaseService = Depends(get_db)):
     """백그라운드 파이프라인의 최근 실행 상태를 조회합니다."""
+    cache_key = "news:pipeline-status"
+    cached = response_cache.get_fresh(cache_key, CACHE_TTL_PIPELINE_STATUS)
+    if cached is not None:
+        response.headers["X-Cache"] = "HIT"
+        return cached
+    
     try:
-        db_service = get_database_service()
-        latest_log = await db_service.get_latest_pipeline_log()
-        
-        return {
-            "success": True,
-            "data": latest_log or {
-                "status": "대기 중",
-                "message": "백그라운드 파이프라인이 아직 실행되지 않았습니다."
+        async with _pipeline_status_lock:
+            # 락을 기다리는 동안 다른 요청이 채웠으면 그대로 사용
+            cached = response_cache.get_fresh(cache_key, CACHE_TTL_PIPELINE_STATUS)
+            if cached is not None:
+                response.headers["X-Cache"] = "HIT"
+                return cached
+            
+            # DB 오류는 "대기 중" 본문으로 바꾸지 않고 예외로 받아 마지막 응답(stale)을 반환
+            latest_log = await db.get_latest_pipeline_log(raise_errors=True)
+            
+            body = {
+                "success": True,
+                "data": latest_log or {
+                    "status": "대기 중",
+                    "message": "백그라운드 파이프라인이 아직 실행되지 않았습니다."
+                }
             }
-        }
+            response_cache.set(cache_key, body)
+        response.headers["X-Cache"] = "MISS"
+        return body
         
     except Exception as e:
+        stale = response_cache.get_stale(cache_key)
+        if stale is not None:
+            response.headers["X-Cache"] = "STALE"
+            return stale
         raise HTTPException(status_code=500, detail=f"파이프라인 상태 조회 실패: {e}")
\ No newline at end of file
@@ -1,48 +1,94 @@
 # api/pipeline_api.py (수정된 버전)
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+import asyncio
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
 from typing import List
+from pydantic import TypeAdapter
 
-from services import pipeline_service
+from services import get_pipeline_service
+from config import CACHE_TTL_TODAY_ISSUES, DATA2_DIR, PIPELINE_RUN_LOCK_FILE
 from models.schemas import CurrentIssue
+from services.database_service import DatabaseService, get_db
+from services.response_cache import (
+    CACHE_CONTROL_HEADER, compute_data_etag, etag_matches, response_cache
+)
+from services.process_lock import acquire_file_lock, is_file_locked, release_file_lock
+from services.result_files import find_latest_result_file, load_result_file
 
 router = APIRouter()
 
+# 동시에 들어온 캐시 미스 요청을 한 번의 조회로 합치기 위한 락
+_today_issues_lock = asyncio.Lock()
+
+# List[CurrentIssue] 검증/직렬화기 (모듈 로드 시 한 번만 생성)
+_current_issues_adapter = TypeAdapter(List[CurrentIssue])
+
 @router.get("/today-issues", response_model=List[CurrentIssue])
-async def get_today_issues():
+async def get_today_issues(request: Request, db: DatabaseService = Depends(get_db)):
     """
     오늘의 주요 이슈 5개를 RAG 분석 결과와 함께 반환합니다.
     캐시된 최신 데이터를 반환하며, 데이터가 없으면 파이프라인을 실행합니다.
     """
     try:
-        # 🔥 수정: get_latest_analyzed_issues는 async 함수가 아님
-        issues = pipeline_service.get_latest_analyzed_issues()
-        if not issues:
-            return []
-        return issues
+        cached = response_cache.get_fresh("pipeline:today-issues", CACHE_TTL_TODAY_ISSUES)
+        if cached is None:
+            async with _today_issues_lock:
+                # 락을 기다리는 동안 다른 요청이 채웠으면 그대로 사용
+                cached = response_cache.get_fresh("pipeline:today-issues", CACHE_TTL_TODAY_ISSUES)
+                if cached is None:
+                    etag = await compute_data_etag(db)
+                    # 🔥 수정: 싱글톤 파이프라인 서비스 사용 (DB 커넥션 풀 공유)
+                    issues = await get_pipeline_service().get_latest_analyzed_issues()
+                    # 캐시를 채울 때 한 번만 검증 + JSON 직렬화 (캐시 히트 시 response_model 재검증 생략)
+                    body = _current_issues_adapter.dump_json(
+                        _current_issues_adapter.validate_python(issues or [])
+                    )
+                    cached = (etag, body)
+                    response_cache.set("pipeline:today-issues", cached)
+        
+        etag, body = cached
+        
+        # 데이터 버전이 바뀌지 않았으면 본문 없이 304 반환
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL_HEADER})
+        
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL_HEADER} if etag else None
+        return Response(content=body, media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이슈 조회 실패: {e}")
 
+def _run_refresh_pipeline(run_lock):
+    """파이프라인 워커 스레드에서 싱글톤 파이프라인 서비스로 전체 파이프라인 실행 (끝나면 실행 락 해제)"""
+    try:
+        # 워커 스레드에는 실행 중인 이벤트 루프가 없으므로 새 루프에서 실행
+        result = asyncio.run(get_pipeline_service().execute_full_pipeline())
+        print(f"✅ 백그라운드 파이프라인 완료: {result.get('pipeline_id', 'unknown')}")
+    except Exception as e:
+        print(f"❌ 백그라운드 파이프라인 실패: {e}")
+    finally:
+        release_file_lock(run_lock)
+
 @router.post("/refresh-issues")
-async def refresh_all_issues(background_tasks: BackgroundTasks):
+async def refresh_all_issues(request: Request, background_tasks: BackgroundTasks):
     """
     백그라운드에서 전체 데이터 파이프라인을 실행하여 오늘의 이슈를 새로고침합니다.
     (크롤링 -> 필터링 -> 분석)
     """
+    # 이미 실행 중이면 새로 시작하지 않음 (워커 프로세스 전체에서 공유하는 파일 락, non-blocking)
+    run_lock = acquire_file_lock(PIPELINE_RUN_LOCK_FILE)
+    if run_lock is None:
+        return {
+            "success": False,
+            "message": "이미 새로고침이 진행 중입니다. 완료 후 다시 시도해주세요.",
+            "status": "파이프라인이 백그라운드에서 실행 중입니다."
+        }
+    
     try:
-        # 🔥 수정: pipeline_service 인스턴스를 얻어서 올바른 메서드 호출
-        from services.pipeline_service import PipelineService
-        
-        def run_pipeline():
-            try:
-                pipeline = PipelineService()
-                result = pipeline.execute_full_pipeline()
-                print(f"✅ 백그라운드 파이프라인 완료: {result.get('pipeline_id', 'unknown')}")
-                return result
-            except Exception as e:
-                print(f"❌ 백그라운드 파이프라인 실패: {e}")
-                raise e
-        
-        background_tasks.add_task(run_pipeline)
+        # 파이프라인 전용 단일 워커 실행기에서 실행 (락은 이미 잡았으므로 같은 워커의 스케줄 실행은 건너뜀)
+        executor = getattr(request.app.state, "pipeline_executor", None)
+        if executor is not None:
+            asyncio.get_running_loop().run_in_executor(executor, _run_refresh_pipeline, run_lock)
+        else:
+            background_tasks.add_task(_run_refresh_pipeline, run_lock)
         
         return {
             "success": True,
@@ -51,24 +97,21 @@ async def refresh_all_issues(background_tasks: BackgroundTasks):
         }
         
     except Exception as e:
+        release_file_lock(run_lock)
         raise HTTPException(status_code=500, detail=f"파이프라인 시작 실패: {e}")
 
 @router.get("/status")
 async def get_pipeline_status():
     """파이프라인 실행 상태 조회"""
     try:
-        # 최신 파이프라인 결과 파일 확인
-        from pathlib import Path
-        import json
+        # 실행 여부는 응답한 워커가 아니라 모든 워커가 공유하는 실행 락 기준
+        is_refreshing = await asyncio.to_thread(is_file_locked, PIPELINE_RUN_LOCK_FILE)
         
-        data_dir = Path("data2")
-        pipeline_files = list(data_dir.glob("*Pipeline_Results.json"))
+        # 최신 파이프라인 결과 파일 확인 (scandir + mtime 캐시)
+        latest_file = await asyncio.to_thread(find_latest_result_file, DATA2_DIR)
         
-        if pipeline_files:
-            latest_file = max(pipeline_files, key=lambda f: f.stat().st_mtime)
-            
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if latest_file is not None:
+            data = await asyncio.to_thread(load_result_file, latest_file)
             
             return {
                 "success": True,
@@ -77,7 +120,8 @@ async def get_pipeline_status():
                     "status": data.get("pipeline_metadata", {}).get("final_status", "unknown"),
                     "file_path": str(latest_file),
                     "issues_count": data.get("total_issues", 0),
-                    "average_confidence": data.get("average_confidence", 0)
+                    "average_confidence": data.get("average_confidence", 0),
+                    "is_refreshing": is_refreshing
                 }
             }
         else:
@@ -85,7 +129,8 @@ async def get_pipeline_status():
                 "success": True,
                 "data": {
                     "status": "no_executions",
-                    "message": "아직 실행된 파이프라인이 없습니다."
+                    "message": "아직 실행된 파이프라인이 없습니다.",
+                    "is_refreshing": is_refreshing
                 }
             }
             
@@ -21,24 +21,19 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 try:
-    from services.pipeline_service import PipelineService
+    from services import get_pipeline_service
     from services.database_service import DatabaseService
+    from services.response_cache import response_cache
+    from logging_setup import setup_logging
 except ImportError as e:
     print(f"❌ 서비스 import 실패: {e}")
     print(f"현재 경로: {os.getcwd()}")
     print(f"프로젝트 루트: {project_root}")
     sys.exit(1)
 
-# 로깅 설정
+# 로깅 설정 (큐 기반: 파일/콘솔 출력은 리스너 스레드에서 처리)
 log_file = project_root / 'background_pipeline.log'
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+setup_logging(logging.FileHandler(log_file, encoding='utf-8'))
 
 logger = logging.getLogger(__name__)
 
@@ -52,17 +47,16 @@ class BackgroundPipelineExecutor:
         self.current_loop = None
         
         try:
-            # 항상 headless 모드로 실행 (백그라운드 환경)
-            self.pipeline_service = PipelineService(headless=True)
-            self.db_service = DatabaseService()
-            
-            # 데이터베이스 초기화
-            self.db_service.initialize()
+            # 수동 새로고침 API와 같은 싱글톤 파이프라인 서비스 사용 (기본 headless 모드)
+            # 서버 안에서는 이미 초기화된 인스턴스를 재사용해 RAG/LLM 클라이언트를 중복 생성하지 않음
+            self.pipeline_service = get_pipeline_service()
+            if self.pipeline_service is None:
+                raise RuntimeError("PipelineService를 불러올 수 없습니다.")
             
             logger.info("✅ 백그라운드 파이프라인 실행기 초기화 완료")
             
         except Exception as e:
-            logger.error(f"❌ 초기화 실패: {e}")
+            logger.error("❌ 초기화 실패: %s", e)
             raise
     
     async def run_scheduled_update(self):
@@ -78,40 +72,53 @@ class BackgroundPipelineExecutor:
             start_time = datetime.now()
             
             # 🔥 수정: 파이프라인 실행 시 파라미터 제거 (execute_full_pipeline에 파라미터가 없음)
-            result = self.pipeline_service.execute_full_pipeline()
+            result = await self.pipeline_service.execute_full_pipeline()
             
             execution_time = datetime.now() - start_time
             
             if result.get("final_status") == "success":
                 # MySQL에 결과 저장 시도
+                # aiomysql 풀은 생성한 이벤트 루프에 묶이므로, 이 스레드의 루프에서 작은 풀을 열고 닫음
+                self.db_service = DatabaseService(minsize=1, maxsize=2)
                 try:
+                    await self.db_service.initialize()
                     await self.db_service.save_pipeline_result(result)
-                    logger.info(f"✅ MySQL 저장 완료")
+                    logger.info("✅ MySQL 저장 완료")
+                    # 새 결과가 바로 보이도록 API 응답 캐시 만료
+                    # (이 프로세스는 즉시, 다른 워커는 신호 파일 mtime을 보고 다음 조회 때 만료)
+                    response_cache.invalidate()
                 except Exception as db_error:
-                    logger.warning(f"⚠️ MySQL 저장 실패 (파일은 저장됨): {db_error}")
+                    logger.warning("⚠️ MySQL 저장 실패 (파일은 저장됨): %s", db_error)
+                finally:
+                    await self.db_service.close()
                 
-                logger.info(f"✅ 백그라운드 파이프라인 완료: {result.get('pipeline_id', 'unknown')} (소요시간: {execution_time})")
+                logger.info("✅ 백그라운드 파이프라인 완료: %s (소요시간: %s)", result.get('pipeline_id', 'unknown'), execution_time)
                 
                 # 🔥 추가: 결과 파일 경로 로깅
                 saved_file = result.get("saved_file", "")
                 if saved_file:
-                    logger.info(f"💾 결과 파일 저장: {saved_file}")
+                    logger.info("💾 결과 파일 저장: %s", saved_file)
                 
                 # 🔥 추가: 분석 결과 요약 로깅
                 final_summary = result.get("final_summary", {})
                 if final_summary:
                     processing_details = final_summary.get("processing_details", {})
-                    logger.info(f"📊 처리 요약: 크롤링 {processing_details.get('crawled', 0)}개 → 필터링 {processing_details.get('filtered', 0)}개 → 분석 {processing_details.get('analyzed', 0)}개")
-                    logger.info(f"📊 평균 신뢰도: {final_summary.get('average_confidence', 0)}")
+                    logger.info(
+                        "📊 처리 요약: 크롤링 %s개 → 필터링 %s개 → 분석 %s개",
+                        processing_details.get('crawled', 0),
+                        processing_details.get('filtered', 0),
+                        processing_details.get('analyzed', 0)
+                    )
+                    logger.info("📊 평균 신뢰도: %s", final_summary.get('average_confidence', 0))
                 
             else:
-                logger.error(f"❌ 파이프라인 실행 실패: {result.get('errors', [])}")
+                logger.error("❌ 파이프라인 실행 실패: %s", result.get('errors', []))
                 
         except Exception as e:
-            logger.error(f"❌ 백그라운드 파이프라인 실패: {e}")
+            logger.error("❌ 백그라운드 파이프라인 실패: %s", e)
             # 스택 트레이스도 로깅
             import traceback
-            logger.error(f"스택 트레이스:\n{traceback.format_exc()}")
+            logger.error("스택 트레이스:\n%s", traceback.format_exc())
             
         finally:
             self.is_running = False
@@ -141,9 +148,9 @@ class BackgroundPipelineExecutor:
                     self.current_loop = None
                     
         except Exception as e:
-            logger.error(f"❌ 즉시 실행 실패: {e}")
+            logger.error("❌ 즉시 실행 실패: %s", e)
             import traceback
-            logger.error(f"스택 트레이스:\n{traceback.format_exc()}")
+            logger.error("스택 트레이스:\n%s", traceback.format_exc())
     
     def shutdown(self):
         """안전한 종료 처리"""
@@ -153,7 +160,7 @@ class BackgroundPipelineExecutor:
             try:
                 self.current_loop.stop()
             except Exception as e:
-                logger.warning(f"⚠️ 이벤트 루프 종료 실패: {e}")
+                logger.warning("⚠️ 이벤트 루프 종료 실패: %s", e)
         
         # 🔥 추가: 크롤링 서비스 안전 종료
         try:
@@ -163,13 +170,13 @@ class BackgroundPipelineExecutor:
                     crawling_service.cleanup()
                     logger.info("✅ 크롤링 서비스 정리 완료")
         except Exception as e:
-            logger.warning(f"⚠️ 크롤링 서비스 정리 실패: {e}")
+            logger.warning("⚠️ 크롤링 서비스 정리 실패: %s", e)
         
         logger.info("✅ 백그라운드 파이프라인 종료 완료")
 
 def signal_handler(signum, frame):
     """시그널 핸들러 (Ctrl+C 등)"""
-    logger.info(f"🔔 종료 시그널 수신: {signum}")
+    logger.info("🔔 종료 시그널 수신: %s", signum)
     sys.exit(0)
 
 def run_scheduled_wrapper(executor: BackgroundPipelineExecutor):
@@ -183,7 +190,7 @@ def run_scheduled_wrapper(executor: BackgroundPipelineExecutor):
         finally:
             loop.close()
     except Exception as e:
-        logger.error(f"❌ 스케줄 실행 실패: {e}")
+        logger.error("❌ 스케줄 실행 실패: %s", e)
 
 def main():
     """메인 실행 함수"""
@@ -195,7 +202,7 @@ def main():
     try:
         executor = BackgroundPipelineExecutor()
     except Exception as e:
-        logger.error(f"❌ 실행기 초기화 실패: {e}")
+        logger.error("❌ 실행기 초기화 실패: %s", e)
         sys.exit(1)
     
     # 명령행 인자 처리
@@ -206,7 +213,7 @@ def main():
         except KeyboardInterrupt:
             logger.info("🔔 사용자에 의해 중단됨")
         except Exception as e:
-            logger.error(f"❌ 즉시 실행 실패: {e}")
+            logger.error("❌ 즉시 실행 실패: %s", e)
         finally:
             executor.shutdown()
         return
@@ -227,7 +234,7 @@ def main():
         try:
             executor.run_once()
         except Exception as e:
-            logger.error(f"❌ 초기 실행 실패: {e}")
+            logger.error("❌ 초기 실행 실패: %s", e)
     
     # 스케줄 유지
     try:
@@ -239,7 +246,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("🔔 사용자에 의해 중단됨")
     except Exception as e:
-        logger.error(f"❌ 스케줄러 실행 실패: {e}")
+        logger.error("❌ 스케줄러 실행 실패: %s", e)
     finally:
         executor.shutdown()
 
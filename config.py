@@ -25,6 +25,10 @@ DATABASE_CONFIG = {
     "autocommit": True
 }
 
+# MySQL 커넥션 풀 설정 (앱 전체에서 하나의 풀을 공유)
+DATABASE_POOL_MIN_SIZE = int(os.getenv("MYSQL_POOL_MIN_SIZE", "5"))
+DATABASE_POOL_MAX_SIZE = int(os.getenv("MYSQL_POOL_MAX_SIZE", "25"))
+
 # yfinance 종목 코드 설정 (추가)
 YFINANCE_TICKER_SUFFIX_KOSPI = ".KS"     # 코스피 종목 접미사
 YFINANCE_TICKER_SUFFIX_KOSDAQ = ".KQ"    # 코스닥 종목 접미사
@@ -42,6 +46,9 @@ DATA_DIR = "data"
 DATA2_DIR = "data2"
 STATIC_DIR = "static"
 
+# 결과 JSON 파일 들여쓰기 여부 (운영에서 false로 두면 직렬화가 더 빠르고 파일도 작아짐)
+JSON_INDENT_OUTPUT = os.getenv("JSON_INDENT_OUTPUT", "true").lower() == "true"
+
 # 로깅 설정
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = "application.log"
@@ -50,6 +57,23 @@ LOG_FILE = "application.log"
 PIPELINE_SCHEDULE_MINUTES = int(os.getenv("PIPELINE_SCHEDULE_MINUTES", "60"))
 PIPELINE_ISSUES_PER_CATEGORY = int(os.getenv("PIPELINE_ISSUES_PER_CATEGORY", "10"))
 PIPELINE_TARGET_FILTERED_COUNT = int(os.getenv("PIPELINE_TARGET_FILTERED_COUNT", "5"))
+# 여러 워커 중 스케줄러를 돌릴 수 있는 프로세스인지 (API 전용 컨테이너는 0으로 설정)
+RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "1") == "1"
+
+# 서버 설정
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "4"))  # uvicorn 워커 프로세스 수 (≈ 2 * 코어 수)
+
+# API 응답 캐시 설정 (초)
+CACHE_TTL_LATEST_NEWS = int(os.getenv("CACHE_TTL_LATEST_NEWS", "30"))
+CACHE_TTL_PIPELINE_STATUS = int(os.getenv("CACHE_TTL_PIPELINE_STATUS", "15"))
+CACHE_TTL_TODAY_ISSUES = int(os.getenv("CACHE_TTL_TODAY_ISSUES", "60"))
+# 캐시 무효화 신호 파일 (파이프라인 워커가 갱신하면 다른 워커 프로세스도 mtime 변화로 캐시 만료)
+CACHE_VERSION_FILE = os.path.join(DATA2_DIR, ".response_cache_version")
+# 파이프라인 실행 락 파일 (스케줄 실행과 수동 새로고침이 워커 프로세스 전체에서 한 번에 하나만 돌도록)
+PIPELINE_RUN_LOCK_FILE = os.path.join(DATA2_DIR, ".pipeline_run.lock")
+
+# 정적 파일 캐시 설정 (해시가 없는 파일의 브라우저 캐시 시간, 초)
+STATIC_CACHE_MAX_AGE = int(os.getenv("STATIC_CACHE_MAX_AGE", "60"))
 
 # 크롤링 설정
 CRAWLING_HEADLESS = os.getenv("CRAWLING_HEADLESS", "true").lower() == "true"
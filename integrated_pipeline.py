@@ -4,11 +4,16 @@ Complete Integrated Pipeline for BigKinds News Analysis with RAG
 전체 프로세스: 크롤링 → AI 필터링 → 실제 RAG 분석 → API 준비
 """
 
+import asyncio
+import hashlib
 import os
-import json
+import orjson
+import pickle
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import traceback
 import pandas as pd
@@ -16,9 +21,115 @@ import pandas as pd
 # 환경 변수 및 AI 모델 설정
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_pinecone import PineconeVectorStore
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers import BaseOutputParser
+
+# Pinecone 직접 질의 클라이언트 (gRPC extra가 설치되어 있으면 gRPC, 아니면 REST)
+try:
+    from pinecone.grpc import PineconeGRPC as PineconeClient
+    PINECONE_GRPC_AVAILABLE = True
+except ImportError:
+    from pinecone import Pinecone as PineconeClient
+    PINECONE_GRPC_AVAILABLE = False
+
+# 결과 파일 직렬화 옵션 (모듈 로드 시 한 번만 구성, 기존 json.dump(indent=2, ensure_ascii=False)와 같은 형태)
+RESULT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# 동시에 RAG 분석할 이슈 수 (이슈당 LLM 2회 + Pinecone 2회 호출, OpenAI rate limit 고려)
+RAG_MAX_CONCURRENCY = 8
+
+# AI 후보 추출 프롬프트에 넣을 최대 후보 수 (너무 많으면 제한)
+PROMPT_CANDIDATE_LIMIT = 50
+
+# 벡터 검색 후보 수와 REST 클라이언트 사용 시 동시 질의 스레드 수
+VECTOR_SEARCH_TOP_K = 10
+VECTOR_SEARCH_MAX_WORKERS = 8
+
+# 상위 벡터 후보가 모두 이 유사도(코사인 유사도 × 100) 이상이면 AI 후보 추출(LLM 호출)을 생략하고 벡터 점수로 순위 결정
+VECTOR_CONFIDENT_SIMILARITY = 85.0
+VECTOR_CONFIDENT_TOP_N = 3
+
+# 임베딩/AI 후보 추출 캐시 설정 (정규화한 쿼리 해시 기준, 재실행·중복 뉴스에서 유료 API 호출 생략)
+RAG_CACHE_MAX_ENTRIES = 4096
+RAG_CACHE_TTL_SECONDS = 6 * 3600
+
+def _vector_candidates_confident(vector_candidates: List[Dict]) -> bool:
+    """상위 벡터 후보들이 모두 충분히 유사한지 (Pinecone 매치 순서 = 코사인 유사도 내림차순)"""
+    top = vector_candidates[:VECTOR_CONFIDENT_TOP_N]
+    return bool(top) and all(c["similarity"] >= VECTOR_CONFIDENT_SIMILARITY for c in top)
+
+def _vector_only_ai_candidates(vector_candidates: List[Dict], field: str) -> List[Dict]:
+    """AI 후보 추출을 생략할 때 벡터 유사도(10점 만점 환산)를 AI 점수 자리에 채운 후보 목록"""
+    return [
+        {field: c["name"], "score": round(c["similarity"] / 10, 1), "reason": "벡터 유사도 기준 선정 (AI 재평가 생략)"}
+        for c in vector_candidates
+    ]
+
+def _normalized_query_key(text: str) -> str:
+    """공백/대소문자 차이를 무시한 쿼리 캐시 키"""
+    return hashlib.sha1(" ".join(text.split()).lower().encode("utf-8")).hexdigest()
+
+class _TTLCache:
+    """만료 시간과 최대 크기가 있는 LRU 캐시 (적중/미스 횟수 기록)"""
+    
+    def __init__(self, maxsize: int = RAG_CACHE_MAX_ENTRIES, ttl: float = RAG_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def get(self, key: str):
+        entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: str, value):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+# 산업/과거 이슈 CSV 경로와 CSV→dict 변환 결과 캐시 (scripts 폴더에서 실행되므로 ../data/ 경로 사용)
+INDUSTRY_CSV_PATH = Path("../data/산업DB.v.0.3.csv")
+PAST_NEWS_CSV_PATH = Path("../data/Past_news.csv")
+DATABASE_CACHE_PATH = Path("../data/_cache.pkl")
+
+def _csv_source_signature() -> Optional[str]:
+    """원본 CSV들의 (경로, mtime, 크기) 해시 (파일이 없으면 None)"""
+    try:
+        parts = [f"{path}:{path.stat().st_mtime_ns}:{path.stat().st_size}" for path in (INDUSTRY_CSV_PATH, PAST_NEWS_CSV_PATH)]
+    except OSError:
+        return None
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+def _load_database_cache(signature: Optional[str]) -> Optional[Dict]:
+    """원본 CSV가 바뀌지 않았으면 캐시된 DB dict 반환"""
+    if signature is None or not DATABASE_CACHE_PATH.exists():
+        return None
+    try:
+        with open(DATABASE_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ DB 캐시 로드 실패 (CSV에서 다시 생성): {e}")
+        return None
+    if not isinstance(cached, dict) or cached.get("signature") != signature:
+        return None
+    return cached
+
+def _save_database_cache(signature: str, data: Dict):
+    """DB dict를 pickle로 저장 (임시 파일에 쓴 뒤 교체해 읽는 쪽이 깨진 파일을 보지 않게 함)"""
+    tmp_path = DATABASE_CACHE_PATH.with_suffix(".pkl.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"signature": signature, **data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, DATABASE_CACHE_PATH)
+    except Exception as e:
+        print(f"⚠️ DB 캐시 저장 실패: {e}")
 
 # 모듈 임포트
 try:
@@ -30,6 +141,16 @@ except ImportError as e:
     print("- crawling_bigkinds.py")
     print("- stock_market_filter.py")
 
+class _OrjsonOutputParser(BaseOutputParser):
+    """json_llm(JSON 모드) 응답 본문을 orjson.loads로 곧바로 dict 변환"""
+    
+    def parse(self, text: str):
+        return orjson.loads(text)
+    
+    @property
+    def _type(self) -> str:
+        return "orjson"
+
 class RealRAGAnalysisExecutor:
     """실제 RAG 분석을 실행하고 결과를 파싱하는 클래스"""
     
@@ -45,81 +166,149 @@ class RealRAGAnalysisExecutor:
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
         self.embedding = OpenAIEmbeddings(model=self.EMBEDDING_MODEL)
         
-        # 벡터 스토어 초기화
-        self.industry_store = PineconeVectorStore(
-            index_name=self.INDEX_NAME,
-            embedding=self.embedding,
-            namespace="industry"
-        )
+        # 산업/과거 이슈 후보를 한 번에 받는 호출용 (JSON 모드)
+        self.json_llm = self.llm.bind(response_format={"type": "json_object"})
+        self.json_parser = _OrjsonOutputParser()
         
-        self.past_issue_store = PineconeVectorStore(
-            index_name=self.INDEX_NAME,
-            embedding=self.embedding,
-            namespace="past_issue"
-        )
+        # 쿼리 임베딩 / AI 후보 추출 결과 캐시 (+ 같은 쿼리로 진행 중인 후보 추출 작업)
+        self.embedding_cache = _TTLCache()
+        self.candidate_cache = _TTLCache()
+        self._inflight_candidates: Dict[str, asyncio.Future] = {}
+        
+        # Pinecone 인덱스 직접 연결 (미리 계산한 벡터로만 질의하므로 LangChain 벡터 스토어 래퍼 불필요)
+        self.pinecone_index = PineconeClient(api_key=os.getenv("PINECONE_API_KEY")).Index(self.INDEX_NAME)
         
 
+        # 산업 DB / 과거 이슈 DB 로딩 (CSV 변환 결과는 pickle 캐시에서 재사용, 프롬프트 후보 목록도 함께 구성)
+        self._load_databases()
+        
+        print("✅ 실제 RAG 분석 시스템 초기화 완료 (GPT-4o-mini)")
+    
+    def _load_databases(self):
+        """산업 DB 및 과거 이슈 DB 로딩 (원본 CSV가 그대로면 pickle 캐시에서 바로 로드)"""
+        self._load_lookup_tables()
+        
+        # AI 후보 추출 프롬프트에 넣을 후보 목록 문자열은 LLM 호출마다 join하지 않도록 로드 시 한 번만 구성
+        self.krx_prompt_list = ", ".join(self.valid_krx_names[:PROMPT_CANDIDATE_LIMIT])
+        self.issue_prompt_list = ", ".join(self.valid_issue_names[:PROMPT_CANDIDATE_LIMIT])
+    
+    def _load_lookup_tables(self):
+        """산업/과거 이슈 dict와 이름 목록 로딩 (캐시 → CSV 순)"""
+        signature = _csv_source_signature()
+        cached = _load_database_cache(signature)
+        if cached is not None:
+            self.industry_dict = cached["industry"]
+            self.issue_dict = cached["issues"]
+            self.valid_krx_names = cached["krx"]
+            self.valid_issue_names = cached["iss"]
+            print(f"✅ DB 캐시 로드: {len(self.valid_krx_names)}개 업종, {len(self.valid_issue_names)}개 과거 이슈")
+            return
+        
+        loaded = True
+        
         # 산업 DB 로딩 (상대 경로 수정)
         try:
             # scripts 폴더에서 실행되므로 ../data/ 경로 사용
-            self.industry_df = pd.read_csv("../data/산업DB.v.0.3.csv")
-            self.industry_dict = dict(zip(self.industry_df["KRX 업종명"], self.industry_df["상세내용"]))
-            self.valid_krx_names = list(self.industry_df["KRX 업종명"].unique())
+            # 필요한 컬럼만 읽고 DataFrame은 dict/이름 목록을 만든 뒤 버림 (utf-8-sig: 첫 컬럼명 앞의 BOM 제거)
+            industry_df = pd.read_csv(INDUSTRY_CSV_PATH, usecols=["KRX 업종명", "상세내용"], encoding="utf-8-sig")
+            self.industry_dict = dict(zip(industry_df["KRX 업종명"], industry_df["상세내용"]))
+            self.valid_krx_names = list(industry_df["KRX 업종명"].unique())
+            del industry_df
             print(f"✅ 산업 DB 로드: {len(self.valid_krx_names)}개 업종")
         except Exception as e:
             print(f"⚠️ 산업 DB 로드 실패: {e}")
             self.industry_dict = {}
             self.valid_krx_names = []
+            loaded = False
         
         # 과거 이슈 DB 로딩 (상대 경로 수정)
         try:
-            # scripts 폴더에서 실행되므로 ../data/ 경로 사용
-            self.past_df = pd.read_csv("../data/Past_news.csv")
-            self.issue_dict = dict(zip(self.past_df["Issue_name"], self.past_df["Contents"] + "\n\n상세: " + self.past_df["Contentes(Spec)"]))
-            self.valid_issue_names = list(self.past_df["Issue_name"].unique())
+            past_df = pd.read_csv(PAST_NEWS_CSV_PATH, usecols=["Issue_name", "Contents", "Contentes(Spec)"])
+            self.issue_dict = dict(zip(past_df["Issue_name"], past_df["Contents"] + "\n\n상세: " + past_df["Contentes(Spec)"]))
+            self.valid_issue_names = list(past_df["Issue_name"].unique())
+            del past_df
             print(f"✅ 과거 이슈 DB 로드: {len(self.valid_issue_names)}개 이슈")
         except Exception as e:
             print(f"⚠️ 과거 이슈 DB 로드 실패: {e}")
             self.issue_dict = {}
             self.valid_issue_names = []
+            loaded = False
         
-        print("✅ 실제 RAG 분석 시스템 초기화 완료 (GPT-4o-mini)")
+        # 두 CSV 모두 정상 로드된 경우에만 캐시 저장 (실패한 빈 결과가 캐시에 남지 않도록)
+        if loaded and signature is not None:
+            _save_database_cache(signature, {
+                "industry": self.industry_dict,
+                "issues": self.issue_dict,
+                "krx": self.valid_krx_names,
+                "iss": self.valid_issue_names,
+            })
+    
+    @staticmethod
+    def build_query(issue: Dict) -> str:
+        """이슈의 벡터 검색/AI 분석용 쿼리 텍스트"""
+        return f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
+    
+    def embed_queries(self, issues: List[Dict]) -> List[Optional[List[float]]]:
+        """모든 이슈의 쿼리를 한 번의 임베딩 API 요청으로 계산 (산업/과거 이슈 검색이 같은 벡터를 공유, 캐시된 쿼리는 제외)"""
+        if not issues:
+            return []
+        
+        keys = [_normalized_query_key(self.build_query(issue)) for issue in issues]
+        vectors = [self.embedding_cache.get(key) for key in keys]
+        missing = [idx for idx, vector in enumerate(vectors) if vector is None]
+        if not missing:
+            return vectors
+        
+        try:
+            embedded = self.embedding.embed_documents([self.build_query(issues[idx]) for idx in missing])
+        except Exception as e:
+            # 일괄 임베딩 실패 시 이슈별 분석에서 각자 임베딩하도록 None 유지
+            print(f"⚠️ 일괄 쿼리 임베딩 실패 - 이슈별 임베딩으로 전환: {e}")
+            return vectors
+        
+        for idx, vector in zip(missing, embedded):
+            vectors[idx] = vector
+            self.embedding_cache.set(keys[idx], vector)
+        return vectors
     
-    def analyze_industry_for_issue(self, issue: Dict) -> List[Dict]:
-        """특정 이슈에 대한 관련 산업 분석 (실제 RAG)"""
+    async def _aembed_query_cached(self, query: str) -> List[float]:
+        """단건 쿼리 임베딩 (캐시 우선)"""
+        key = _normalized_query_key(query)
+        vector = self.embedding_cache.get(key)
+        if vector is None:
+            vector = await self.embedding.aembed_query(query)
+            self.embedding_cache.set(key, vector)
+        return vector
+    
+    def cache_summary(self) -> str:
+        """캐시 적중/미스 요약 (로그용)"""
+        return (f"임베딩 {self.embedding_cache.hits}적중/{self.embedding_cache.misses}미스, "
+                f"AI 후보 {self.candidate_cache.hits}적중/{self.candidate_cache.misses}미스")
+    
+    async def analyze_industry_for_issue(self, issue: Dict, query_vector: Optional[List[float]] = None,
+                                         vector_candidates: Optional[List[Dict]] = None) -> List[Dict]:
+        """특정 이슈에 대한 관련 산업 분석 (실제 RAG, 미리 계산한 쿼리 벡터/일괄 검색 결과가 있으면 재사용)"""
         try:
-            query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
+            query = self.build_query(issue)
             print(f"🏭 산업 분석 중: {issue.get('제목', 'N/A')[:30]}...")
             
-            # Step 1: 벡터 검색으로 후보 추출
-            results = self.industry_store.similarity_search_with_score(query, k=10)
-            
-            vector_candidates = []
-            for doc, score in results:
-                content = doc.page_content.replace('\ufeff', '').replace('﻿', '')
+            if vector_candidates is None:
+                if query_vector is None:
+                    query_vector = await self._aembed_query_cached(query)
                 
-                if "KRX 업종명:" in content:
-                    lines = content.split("\n")
-                    for line in lines:
-                        if "KRX 업종명:" in line:
-                            industry_name = line.replace("KRX 업종명:", "").strip()
-                            if industry_name in self.industry_dict:
-                                # 중복 체크
-                                if not any(c["name"] == industry_name for c in vector_candidates):
-                                    similarity_percentage = round((1 - score) * 100, 1)
-                                    
-                                    content_parts = content.split("상세내용:")
-                                    industry_detail = content_parts[1].strip() if len(content_parts) > 1 else self.industry_dict[industry_name]
-                                    
-                                    vector_candidates.append({
-                                        "name": industry_name,
-                                        "similarity": similarity_percentage,
-                                        "description": industry_detail
-                                    })
-                            break
-            
-            # Step 2: AI Agent로 관련 산업 후보 추출
-            ai_candidates = self._extract_candidate_industries(query, self.valid_krx_names, top_k=10)
+                # Step 1~2: 벡터 검색과 AI Agent 후보 추출은 서로 독립적이므로 동시에 실행
+                #           (AI 후보 추출은 산업/과거 이슈를 한 번에 받는 호출을 두 분석이 공유)
+                vector_candidates, extracted = await asyncio.gather(
+                    asyncio.to_thread(self._vector_search_industries, query_vector),
+                    self._extract_candidates(query, top_k=10)
+                )
+                ai_candidates = extracted["industries"]
+            elif _vector_candidates_confident(vector_candidates):
+                # 일괄 검색 결과 상위 후보가 모두 충분히 유사하면 LLM 호출 없이 벡터 점수로 결정
+                ai_candidates = _vector_only_ai_candidates(vector_candidates, "industry")
+            else:
+                extracted = await self._extract_candidates(query, top_k=10)
+                ai_candidates = extracted["industries"]
             
             # Step 3: 결과 결합 및 검증
             final_candidates = self._combine_and_validate_industry_results(
@@ -133,51 +322,97 @@ class RealRAGAnalysisExecutor:
             print(f"❌ 산업 분석 실패: {e}")
             return []
     
-    def analyze_past_issues_for_issue(self, issue: Dict) -> List[Dict]:
-        """특정 이슈에 대한 관련 과거 이슈 분석 (실제 RAG)"""
+    def _query_index(self, query_vector: List[float], namespace: str):
+        """Pinecone 인덱스에 벡터 하나로 직접 질의해 매치 목록 반환"""
+        return self.pinecone_index.query(
+            vector=query_vector, top_k=VECTOR_SEARCH_TOP_K, namespace=namespace, include_metadata=True
+        ).matches
+    
+    def batch_vector_search(self, query_vectors: List[Optional[List[float]]]) -> Tuple[List[Optional[List[Dict]]], List[Optional[List[Dict]]]]:
+        """모든 이슈 벡터의 산업/과거 이슈 검색을 한꺼번에 질의 (gRPC는 한 채널에 비동기 요청, REST는 스레드로 동시 요청)
+        벡터가 없거나 질의에 실패한 이슈는 None으로 두어 이슈별 분석에서 다시 검색"""
+        queries = [(idx, namespace, vector)
+                    for namespace in ("industry", "past_issue")
+                    for idx, vector in enumerate(query_vectors) if vector is not None]
+        found = {"industry": [None] * len(query_vectors), "past_issue": [None] * len(query_vectors)}
+        if not queries:
+            return found["industry"], found["past_issue"]
+        
+        if PINECONE_GRPC_AVAILABLE:
+            pending = [
+                self.pinecone_index.query(vector=vector, top_k=VECTOR_SEARCH_TOP_K, namespace=namespace,
+                                          include_metadata=True, async_req=True)
+                for _, namespace, vector in queries
+            ]
+            fetch = lambda future: future.result().matches
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(VECTOR_SEARCH_MAX_WORKERS, len(queries)))
+            pending = [executor.submit(self._query_index, vector, namespace) for _, namespace, vector in queries]
+            executor.shutdown(wait=False)
+            fetch = lambda future: future.result()
+        
+        for (idx, namespace, _), future in zip(queries, pending):
+            try:
+                matches = fetch(future)
+            except Exception as e:
+                print(f"⚠️ {namespace} 일괄 벡터 검색 실패 (이슈 {idx + 1}, 개별 검색으로 전환): {e}")
+                continue
+            if namespace == "industry":
+                found[namespace][idx] = self._industry_candidates_from_matches(matches)
+            else:
+                found[namespace][idx] = self._past_issue_candidates_from_matches(matches)
+        
+        return found["industry"], found["past_issue"]
+    
+    def _vector_search_industries(self, query_vector: List[float]) -> List[Dict]:
+        """벡터 검색으로 관련 산업 후보 추출 (쿼리 임베딩 재계산 없이 벡터로 바로 검색)"""
+        return self._industry_candidates_from_matches(self._query_index(query_vector, "industry"))
+    
+    def _industry_candidates_from_matches(self, matches) -> List[Dict]:
+        """Pinecone 매치 목록을 산업 후보 목록으로 변환"""
+        vector_candidates = []
+        seen_names = set()  # 중복 체크용 (리스트 전체를 훑지 않도록 이름 집합 유지)
+        for match in matches:
+            score = match.score
+            # 업종명/상세내용은 업로드 시 metadata에 저장되어 있으므로 본문 문자열을 파싱하지 않고 바로 조회
+            meta = match.metadata or {}
+            industry_name = meta.get("name", "")
+            if industry_name not in self.industry_dict or industry_name in seen_names:
+                continue
+            seen_names.add(industry_name)
+            
+            vector_candidates.append({
+                "name": industry_name,
+                "similarity": round(score * 100, 1),
+                "description": meta.get("description") or self.industry_dict[industry_name]
+            })
+        
+        return vector_candidates
+    
+    async def analyze_past_issues_for_issue(self, issue: Dict, query_vector: Optional[List[float]] = None,
+                                            vector_candidates: Optional[List[Dict]] = None) -> List[Dict]:
+        """특정 이슈에 대한 관련 과거 이슈 분석 (실제 RAG, 미리 계산한 쿼리 벡터/일괄 검색 결과가 있으면 재사용)"""
         try:
-            query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
+            query = self.build_query(issue)
             print(f"📚 과거 이슈 분석 중: {issue.get('제목', 'N/A')[:30]}...")
             
-            # Step 1: 벡터 검색으로 후보 추출
-            results = self.past_issue_store.similarity_search_with_score(query, k=10)
-            
-            vector_candidates = []
-            for doc, score in results:
-                content = doc.page_content.replace('\ufeff', '').replace('﻿', '')
+            if vector_candidates is None:
+                if query_vector is None:
+                    query_vector = await self._aembed_query_cached(query)
                 
-                if "Issue_name:" in content:
-                    lines = content.split("\n")
-                    for line in lines:
-                        if "Issue_name:" in line:
-                            issue_name = line.replace("Issue_name:", "").strip()
-                            if issue_name in self.issue_dict:
-                                # 중복 체크
-                                if not any(c["name"] == issue_name for c in vector_candidates):
-                                    similarity_percentage = round((1 - score) * 100, 1)
-                                    
-                                    content_parts = content.split("Contents:")
-                                    issue_detail = content_parts[1].strip() if len(content_parts) > 1 else self.issue_dict[issue_name]
-                                    
-                                    # 기간 정보 추출
-                                    period = "N/A"
-                                    for line in lines:
-                                        if "Start_date:" in line and "Fin_date:" in line:
-                                            start = line.split("Start_date:")[1].split("Fin_date:")[0].strip()
-                                            end = line.split("Fin_date:")[1].strip()
-                                            period = f"{start} ~ {end}"
-                                            break
-                                    
-                                    vector_candidates.append({
-                                        "name": issue_name,
-                                        "similarity": similarity_percentage,
-                                        "description": issue_detail,
-                                        "period": period
-                                    })
-                            break
-            
-            # Step 2: AI Agent로 관련 과거 이슈 후보 추출
-            ai_candidates = self._extract_candidate_past_issues(query, self.valid_issue_names, top_k=10)
+                # Step 1~2: 벡터 검색과 AI Agent 후보 추출은 서로 독립적이므로 동시에 실행
+                #           (AI 후보 추출은 산업/과거 이슈를 한 번에 받는 호출을 두 분석이 공유)
+                vector_candidates, extracted = await asyncio.gather(
+                    asyncio.to_thread(self._vector_search_past_issues, query_vector),
+                    self._extract_candidates(query, top_k=10)
+                )
+                ai_candidates = extracted["past_issues"]
+            elif _vector_candidates_confident(vector_candidates):
+                # 일괄 검색 결과 상위 후보가 모두 충분히 유사하면 LLM 호출 없이 벡터 점수로 결정
+                ai_candidates = _vector_only_ai_candidates(vector_candidates, "issue")
+            else:
+                extracted = await self._extract_candidates(query, top_k=10)
+                ai_candidates = extracted["past_issues"]
             
             # Step 3: 결과 결합 및 검증
             final_candidates = self._combine_and_validate_past_issue_results(
@@ -191,99 +426,114 @@ class RealRAGAnalysisExecutor:
             print(f"❌ 과거 이슈 분석 실패: {e}")
             return []
     
-    def _extract_candidate_industries(self, news_content: str, industry_list: List[str], top_k: int = 10) -> List[Dict]:
-        """AI Agent가 뉴스 내용을 보고 관련 가능성이 높은 산업들을 추출"""
-        if not industry_list:
-            return []
-            
+    def _vector_search_past_issues(self, query_vector: List[float]) -> List[Dict]:
+        """벡터 검색으로 관련 과거 이슈 후보 추출 (쿼리 임베딩 재계산 없이 벡터로 바로 검색)"""
+        return self._past_issue_candidates_from_matches(self._query_index(query_vector, "past_issue"))
+    
+    def _past_issue_candidates_from_matches(self, matches) -> List[Dict]:
+        """Pinecone 매치 목록을 과거 이슈 후보 목록으로 변환"""
+        vector_candidates = []
+        seen_names = set()  # 중복 체크용 (리스트 전체를 훑지 않도록 이름 집합 유지)
+        for match in matches:
+            score = match.score
+            # 이슈명/내용/기간은 업로드 시 metadata에 저장되어 있으므로 본문 문자열을 파싱하지 않고 바로 조회
+            meta = match.metadata or {}
+            issue_name = meta.get("name", "")
+            if issue_name not in self.issue_dict or issue_name in seen_names:
+                continue
+            seen_names.add(issue_name)
+            
+            start, end = meta.get("start_date"), meta.get("end_date")
+            vector_candidates.append({
+                "name": issue_name,
+                "similarity": round(score * 100, 1),
+                "description": meta.get("description") or self.issue_dict[issue_name],
+                "period": f"{start} ~ {end}" if start and end else "N/A"
+            })
+        
+        return vector_candidates
+    
+    async def _extract_candidates(self, news_content: str, top_k: int = 10) -> Dict[str, List[Dict]]:
+        """AI Agent가 관련 산업과 관련 과거 이슈 후보를 한 번의 LLM 호출로 함께 추출
+        (같은 이슈의 산업/과거 이슈 분석이 동시에 요청해도 호출은 한 번만 나가도록 진행 중인 작업 공유)"""
+        cache_key = f"candidates:{top_k}:{_normalized_query_key(news_content)}"
+        cached = self.candidate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        task = self._inflight_candidates.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_candidates(news_content, top_k, cache_key))
+            self._inflight_candidates[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight_candidates.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _request_candidates(self, news_content: str, top_k: int, cache_key: str) -> Dict[str, List[Dict]]:
+        """산업 + 과거 이슈 후보 추출 LLM 호출 (실패한 쪽은 빈 리스트)"""
+        empty = {"industries": [], "past_issues": []}
+        if not self.krx_prompt_list and not self.issue_prompt_list:
+            return empty
+        
         prompt = ChatPromptTemplate.from_messages([
-            ("system", """너는 뉴스와 산업의 관련성을 판단하는 전문 애널리스트야.
-주어진 뉴스 내용을 분석하고, 제공된 KRX 업종 리스트에서 관련 가능성이 높은 산업들을 선별해야 해.
+            ("system", """너는 뉴스와 산업, 그리고 현재 뉴스와 과거 이슈의 관련성을 판단하는 전문 애널리스트야.
+주어진 뉴스 내용을 분석하고, 제공된 KRX 업종 리스트와 과거 이슈 리스트에서 각각 관련 가능성이 높은 항목들을 선별해야 해.
 
-관련성 판단 기준:
+산업 관련성 판단 기준:
 1. 직접적 영향: 뉴스가 해당 산업에 직접적인 영향을 미치는가?
 2. 공급망 관계: 뉴스 관련 기업/산업과 공급망 관계가 있는가?
 3. 시장 동향: 뉴스가 해당 산업의 시장 동향에 영향을 미치는가?
-4. 정책/규제: 뉴스가 해당 산업 관련 정책이나 규제와 연관되는가?"""),
-            ("human", """
-[뉴스 내용]
-{news}
-
-[KRX 업종 리스트]  
-{industries}
-
-위 뉴스와 관련 가능성이 높은 산업을 {top_k}개 선별해주세요.
-각 산업에 대해 관련성 점수(1-10점)와 간단한 이유를 제시해주세요.
+4. 정책/규제: 뉴스가 해당 산업 관련 정책이나 규제와 연관되는가?
 
-출력 형식 (JSON):
-{{
-  "candidates": [
-    {{"industry": "산업명", "score": 점수, "reason": "관련성 이유"}},
-    ...
-  ]
-}}""")
-        ])
-        
-        parser = JsonOutputParser()
-        chain = prompt | self.llm | parser
-        
-        try:
-            result = chain.invoke({
-                "news": news_content,
-                "industries": ", ".join(industry_list[:50]),  # 너무 많으면 제한
-                "top_k": top_k
-            })
-            return result.get("candidates", [])
-        except Exception as e:
-            print(f"❌ AI 산업 후보 추출 실패: {e}")
-            return []
-    
-    def _extract_candidate_past_issues(self, news_content: str, issue_list: List[str], top_k: int = 10) -> List[Dict]:
-        """AI Agent가 뉴스 내용을 보고 관련 가능성이 높은 과거 이슈들을 추출"""
-        if not issue_list:
-            return []
-            
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """너는 현재 뉴스와 과거 이슈의 관련성을 판단하는 전문 애널리스트야.
-주어진 현재 뉴스 내용을 분석하고, 제공된 과거 이슈 리스트에서 관련 가능성이 높은 이슈들을 선별해야 해.
-
-관련성 판단 기준:
+과거 이슈 관련성 판단 기준:
 1. 유사한 시장 상황: 과거 이슈와 현재 상황이 유사한 시장 환경인가?
 2. 동일한 산업/기업 영향: 같은 산업이나 유사한 기업들에 영향을 미치는가?
 3. 정책/경제적 유사성: 정책 변화나 경제적 요인이 유사한가?
 4. 투자자 심리: 투자자들의 반응이나 시장 심리가 비슷한가?"""),
             ("human", """
-[현재 뉴스 내용]
+[뉴스 내용]
 {news}
 
+[KRX 업종 리스트]
+{industries}
+
 [과거 이슈 리스트]
 {issues}
 
-위 현재 뉴스와 관련 가능성이 높은 과거 이슈를 {top_k}개 선별해주세요.
-각 과거 이슈에 대해 관련성 점수(1-10점)와 간단한 이유를 제시해주세요.
+위 뉴스와 관련 가능성이 높은 산업과 과거 이슈를 각각 {top_k}개 선별해주세요.
+각 항목에 대해 관련성 점수(1-10점)와 간단한 이유를 제시해주세요.
 
 출력 형식 (JSON):
 {{
-  "candidates": [
+  "industries": [
+    {{"industry": "산업명", "score": 점수, "reason": "관련성 이유"}},
+    ...
+  ],
+  "past_issues": [
     {{"issue": "이슈명", "score": 점수, "reason": "관련성 이유"}},
     ...
   ]
 }}""")
         ])
         
-        parser = JsonOutputParser()
-        chain = prompt | self.llm | parser
+        chain = prompt | self.json_llm | self.json_parser
         
         try:
-            result = chain.invoke({
+            result = await chain.ainvoke({
                 "news": news_content,
-                "issues": ", ".join(issue_list[:50]),  # 너무 많으면 제한
+                "industries": self.krx_prompt_list,
+                "issues": self.issue_prompt_list,
                 "top_k": top_k
             })
-            return result.get("candidates", [])
+            candidates = {
+                "industries": result.get("industries", []) if self.krx_prompt_list else [],
+                "past_issues": result.get("past_issues", []) if self.issue_prompt_list else []
+            }
+            if candidates["industries"] or candidates["past_issues"]:
+                self.candidate_cache.set(cache_key, candidates)
+            return candidates
         except Exception as e:
-            print(f"❌ AI 과거 이슈 후보 추출 실패: {e}")
-            return []
+            print(f"❌ AI 산업/과거 이슈 후보 추출 실패: {e}")
+            return empty
     
     def _combine_and_validate_industry_results(self, news_content: str, vector_candidates: List[Dict], 
                                              ai_candidates: List[Dict], industry_dict: Dict) -> List[Dict]:
@@ -301,9 +551,13 @@ class RealRAGAnalysisExecutor:
                 "description": candidate["description"]
             }
         
-        # AI 후보 추가/업데이트
+        # AI 후보 추가/업데이트 (LLM이 같은 이름을 여러 번 내보내면 첫 항목만 사용)
+        seen_ai = set()
         for candidate in ai_candidates:
             name = candidate["industry"]
+            if name in seen_ai:
+                continue
+            seen_ai.add(name)
             if name in all_candidates:
                 all_candidates[name]["ai_score"] = candidate["score"]
                 all_candidates[name]["ai_reason"] = candidate["reason"]
@@ -350,9 +604,13 @@ class RealRAGAnalysisExecutor:
                 "period": candidate.get("period", "N/A")
             }
         
-        # AI 후보 추가/업데이트
+        # AI 후보 추가/업데이트 (LLM이 같은 이름을 여러 번 내보내면 첫 항목만 사용)
+        seen_ai = set()
         for candidate in ai_candidates:
             name = candidate["issue"]
+            if name in seen_ai:
+                continue
+            seen_ai.add(name)
             if name in all_candidates:
                 all_candidates[name]["ai_score"] = candidate["score"]
                 all_candidates[name]["ai_reason"] = candidate["reason"]
@@ -580,30 +838,16 @@ class IntegratedNewsPipeline:
             
             print(f"📊 실제 RAG 분석 대상: {len(selected_issues)}개 선별 이슈")
             
-            # 각 이슈별로 실제 RAG 분석 실행
-            enriched_issues = []
+            # 모든 이슈의 쿼리 임베딩을 한 번의 API 요청으로 계산 (이슈당 2회 → 전체 1회)
+            query_vectors = self.rag_executor.embed_queries(selected_issues)
             
-            for i, issue in enumerate(selected_issues, 1):
-                print(f"🔄 이슈 {i}/{len(selected_issues)} 분석 중: {issue.get('제목', 'N/A')[:50]}...")
-                
-                # 실제 산업 분석
-                related_industries = self.rag_executor.analyze_industry_for_issue(issue)
-                
-                # 실제 과거 이슈 분석
-                related_past_issues = self.rag_executor.analyze_past_issues_for_issue(issue)
-                
-                # RAG 분석 신뢰도 계산
-                rag_confidence = self._calculate_rag_confidence(related_industries, related_past_issues)
-                
-                # 기본 이슈 정보에 실제 RAG 결과 추가
-                enriched_issue = issue.copy()
-                enriched_issue["관련산업"] = related_industries
-                enriched_issue["관련과거이슈"] = related_past_issues
-                enriched_issue["RAG분석신뢰도"] = rag_confidence
-                
-                enriched_issues.append(enriched_issue)
-                
-                print(f"   ✅ 이슈 {i} RAG 분석 완료: 산업 {len(related_industries)}개, 과거이슈 {len(related_past_issues)}개, 신뢰도 {rag_confidence}")
+            # 모든 이슈의 산업/과거 이슈 벡터 검색을 한꺼번에 질의 (이슈별 검색 왕복 대신)
+            industry_candidates, past_issue_candidates = self.rag_executor.batch_vector_search(query_vectors)
+            
+            # 각 이슈별로 실제 RAG 분석 실행 (이슈들을 동시에 분석, 동기 파이프라인이므로 새 이벤트 루프에서 실행)
+            enriched_issues = asyncio.run(self._analyze_issues_concurrently(
+                selected_issues, query_vectors, industry_candidates, past_issue_candidates
+            ))
             
             rag_result = {
                 **filtering_result,  # 기존 필터링 결과 유지
@@ -623,6 +867,7 @@ class IntegratedNewsPipeline:
             
             print(f"✅ Step 3 완료: {len(enriched_issues)}개 이슈 실제 RAG 분석 완료")
             print(f"📊 평균 RAG 신뢰도: {rag_result['rag_metadata']['average_confidence']}")
+            print(f"♻️ RAG 캐시: {self.rag_executor.cache_summary()}")
             self.pipeline_results["steps_completed"].append("real_rag_analysis")
             
             return rag_result
@@ -632,6 +877,42 @@ class IntegratedNewsPipeline:
             self.pipeline_results["errors"].append(error_msg)
             raise Exception(error_msg)
 
+    async def _analyze_issues_concurrently(self, selected_issues: List[Dict],
+                                           query_vectors: List[Optional[List[float]]],
+                                           industry_candidates: List[Optional[List[Dict]]],
+                                           past_issue_candidates: List[Optional[List[Dict]]]) -> List[Dict]:
+        """이슈별 산업/과거 이슈 분석을 동시에 실행 (OpenAI rate limit 고려해 동시 이슈 수 제한)"""
+        semaphore = asyncio.Semaphore(RAG_MAX_CONCURRENCY)
+        
+        async def analyze(i: int, issue: Dict, query_vector: Optional[List[float]],
+                          industry_vector_candidates: Optional[List[Dict]],
+                          past_vector_candidates: Optional[List[Dict]]) -> Dict:
+            async with semaphore:
+                print(f"🔄 이슈 {i}/{len(selected_issues)} 분석 중: {issue.get('제목', 'N/A')[:50]}...")
+                
+                # 실제 산업 분석과 과거 이슈 분석을 동시에 실행
+                related_industries, related_past_issues = await asyncio.gather(
+                    self.rag_executor.analyze_industry_for_issue(issue, query_vector, industry_vector_candidates),
+                    self.rag_executor.analyze_past_issues_for_issue(issue, query_vector, past_vector_candidates)
+                )
+                
+                # RAG 분석 신뢰도 계산
+                rag_confidence = self._calculate_rag_confidence(related_industries, related_past_issues)
+                
+                # 기본 이슈 정보에 실제 RAG 결과 추가
+                enriched_issue = issue.copy()
+                enriched_issue["관련산업"] = related_industries
+                enriched_issue["관련과거이슈"] = related_past_issues
+                enriched_issue["RAG분석신뢰도"] = rag_confidence
+                
+                print(f"   ✅ 이슈 {i} RAG 분석 완료: 산업 {len(related_industries)}개, 과거이슈 {len(related_past_issues)}개, 신뢰도 {rag_confidence}")
+                return enriched_issue
+        
+        return list(await asyncio.gather(
+            *(analyze(i, *args)
+              for i, args in enumerate(zip(selected_issues, query_vectors, industry_candidates, past_issue_candidates), 1))
+        ))
+
     def _calculate_rag_confidence(self, industries: List[Dict], past_issues: List[Dict]) -> float:
         """RAG 분석 신뢰도 계산 (실제 점수 기반)"""
         if not industries or not past_issues:
@@ -660,8 +941,8 @@ class IntegratedNewsPipeline:
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(save_data, option=RESULT_JSON_OPTIONS))
             
             print(f"💾 실제 RAG 분석 결과 저장: {filepath}")
             return str(filepath)
@@ -755,8 +1036,8 @@ class IntegratedNewsPipeline:
                 return None
             
             # 기존 데이터 로드
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             print(f"♻️ {file_age}만큼 오래된 크롤링 데이터를 재사용합니다.")
             return data
@@ -782,8 +1063,8 @@ class IntegratedNewsPipeline:
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(save_data, option=RESULT_JSON_OPTIONS))
             
             print(f"💾 파이프라인 결과 저장: {filepath}")
             return str(filepath)
@@ -867,8 +1148,8 @@ class IntegratedNewsPipeline:
             
             latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
             
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             return data.get("api_ready_data")
             
@@ -921,8 +1202,8 @@ def get_latest_rag_enhanced_issues_for_api():
             latest_file = max(real_rag_files, key=lambda f: f.stat().st_mtime)
             print(f"✅ 실제 RAG 분석 데이터 발견: {latest_file.name}")
             
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # selected_issues 반환 (실제 RAG 결과 포함)
             selected_issues = data.get('selected_issues', [])
@@ -937,8 +1218,8 @@ def get_latest_rag_enhanced_issues_for_api():
             latest_file = max(filtered_files, key=lambda f: f.stat().st_mtime)
             print(f"📊 기존 필터링 데이터 발견: {latest_file.name}")
             
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             selected_issues = data.get('selected_issues', [])
             print(f"⚠️ RAG 분석 없는 {len(selected_issues)}개 이슈 반환 (기본 필터링만)")
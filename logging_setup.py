@@ -0,0 +1,59 @@
+"""
+큐 기반 로깅 설정
+로그 호출은 QueueHandler로 큐에 넣기만 하고, 실제 stdout/파일 출력은 QueueListener 스레드가 담당
+(이벤트 루프나 크롤링 스레드가 stdio 락/디스크 쓰기에서 막히지 않음)
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from config import LOG_LEVEL
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 명령/요청마다 로그를 남기는 라이브러리 로거 (LOG_LEVEL이 DEBUG여도 크롤링 루프에서 레코드가 쏟아지지 않도록 제한)
+NOISY_LOGGERS = ("selenium.webdriver.remote.remote_connection", "urllib3")
+NOISY_LOGGER_LEVEL = logging.WARNING
+
+# 프로세스당 하나의 리스너 (uvicorn 워커마다 별도 프로세스이므로 워커별로 생성됨)
+_listener: Optional[QueueListener] = None
+
+def setup_logging(*extra_handlers: logging.Handler) -> QueueListener:
+    """루트 로거를 QueueHandler로 설정하고 리스너 반환 (여러 번 호출해도 핸들러만 추가)"""
+    global _listener
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    
+    if _listener is None:
+        log_queue = queue.Queue(-1)
+        
+        root = logging.getLogger()
+        root.setLevel(LOG_LEVEL)
+        root.addHandler(QueueHandler(log_queue))
+        for name in NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(NOISY_LOGGER_LEVEL)
+        
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        # 리스너 스레드는 데몬이므로 종료 시 큐에 남은 로그를 비우도록 등록
+        atexit.register(stop_logging)
+    
+    for handler in extra_handlers:
+        handler.setFormatter(formatter)
+    # 리스너 스레드는 매 레코드마다 self.handlers를 순회하므로 튜플 교체로 핸들러 추가
+    _listener.handlers = _listener.handlers + tuple(extra_handlers)
+    
+    return _listener
+
+def stop_logging():
+    """남은 로그를 모두 출력한 뒤 리스너 종료 (서버 종료 시 호출)"""
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,18 +1,22 @@
 # main.py - 최종 통합 버전
+import asyncio
+import logging
+import sys
 import uvicorn
-import threading
-import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse, FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # --- 설정, API 라우터, 서비스 임포트 ---
 # config.py에서 API 기본 정보와 CORS 설정값을 가져옵니다.
-from config import API_TITLE, API_VERSION, API_DESCRIPTION, CORS_ALLOW_ORIGINS
+from config import (
+    API_TITLE, API_VERSION, API_DESCRIPTION, CORS_ALLOW_ORIGINS,
+    DATA2_DIR, PIPELINE_RUN_LOCK_FILE, RUN_SCHEDULER, WEB_CONCURRENCY
+)
 
 # api 폴더에 정의된 각 기능별 라우터들을 모두 임포트합니다.
 from api import (
@@ -26,84 +30,146 @@ from api import (
 
 # services 폴더에서 데이터베이스 서비스 모듈을 임포트합니다.
 from services import database_service
+from services.static_files import CachedStaticFiles
+from services.process_lock import acquire_file_lock, release_file_lock
 
 # 백그라운드에서 주기적으로 데이터 파이프라인을 실행할 클래스를 임포트합니다.
 from background_pipeline import BackgroundPipelineExecutor
 
+# 큐 기반 로깅 (로그 출력은 리스너 스레드가 담당하여 이벤트 루프를 막지 않습니다)
+from logging_setup import setup_logging, stop_logging
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
 # --- 전역 변수 ---
-# 백그라운드 파이프라인 실행기와 스레드를 관리하기 위한 전역 변수입니다.
+# 백그라운드 파이프라인 실행기 (무거운 초기화이므로 파이프라인 전용 워커 스레드에서 생성)
 pipeline_executor: BackgroundPipelineExecutor = None
-pipeline_thread: threading.Thread = None
+
+# 파이프라인 자동 실행 간격 (30분)
+PIPELINE_INTERVAL_SECONDS = 1800
+
+# 스케줄러 워커 선출용 락 파일 핸들 (프로세스가 살아있는 동안 열어둠)
+_scheduler_lock_file = None
+
+# --- 스케줄러 워커 선출 ---
+def acquire_scheduler_lock() -> bool:
+    """여러 uvicorn 워커 중 하나만 스케줄러를 실행하도록 파일 락 획득 (프로세스 종료 시 자동 해제)"""
+    global _scheduler_lock_file
+    
+    lock_file = acquire_file_lock(Path(__file__).parent / DATA2_DIR / ".scheduler.lock")
+    if lock_file is None:
+        return False
+    
+    _scheduler_lock_file = lock_file
+    return True
 
 # --- 백그라운드 작업 함수 ---
-def run_background_pipeline():
-    """백그라운드 스레드에서 파이프라인을 주기적으로 실행하는 함수"""
+def run_pipeline_once():
+    """파이프라인 전용 워커 스레드에서 파이프라인을 1회 실행하는 함수
+    수동 새로고침 등 다른 실행이 락을 잡고 있으면 이번 스케줄 실행은 건너뜀 (그 실행이 최신 데이터를 만듦)"""
     global pipeline_executor
     
+    run_lock = acquire_file_lock(PIPELINE_RUN_LOCK_FILE)
+    if run_lock is None:
+        logger.info("⏭️ 다른 파이프라인 실행(수동 새로고침 등)이 진행 중입니다. 이번 스케줄 실행은 건너뜁니다.")
+        return
+    
     try:
-        print("🔄 백그라운드 파이프라인 스레드 시작...")
-        pipeline_executor = BackgroundPipelineExecutor()
-        
-        # 서버 시작 시, 최신 데이터를 즉시 사용할 수 있도록 파이프라인을 1회 실행합니다.
-        print("🎬 서버 시작 시 초기 파이프라인 실행...")
+        if pipeline_executor is None:
+            logger.info("🔄 백그라운드 파이프라인 실행기 초기화...")
+            pipeline_executor = BackgroundPipelineExecutor()
         pipeline_executor.run_once()
+    finally:
+        release_file_lock(run_lock)
+
+async def scheduler_loop(executor: ThreadPoolExecutor):
+    """서버 시작 시 1회, 이후 30분마다 파이프라인을 워커 스레드에 맡기는 스케줄러 태스크"""
+    loop = asyncio.get_running_loop()
+    
+    # 서버 시작 시, 최신 데이터를 즉시 사용할 수 있도록 파이프라인을 1회 실행합니다.
+    logger.info("🎬 서버 시작 시 초기 파이프라인 실행...")
+    while True:
+        try:
+            await loop.run_in_executor(executor, run_pipeline_once)
+        except Exception as e:
+            logger.error("❌ 스케줄 실행 중 오류 발생: %s", e)
+            # 오류가 발생하더라도 스케줄링은 중단되지 않고 계속됩니다.
         
-        # 30분(1800초)마다 파이프라인을 반복 실행하는 루프입니다.
-        print("⏰ 30분 간격 스케줄러 시작...")
-        while True:
-            time.sleep(1800)
-            print("🔔 30분 경과 - 파이프라인 재실행...")
-            try:
-                pipeline_executor.run_once()
-            except Exception as e:
-                print(f"❌ 스케줄 실행 중 오류 발생: {e}")
-                # 오류가 발생하더라도 스케줄링은 중단되지 않고 계속됩니다.
-                continue
-    except Exception as e:
-        print(f"❌ 백그라운드 파이프라인 스레드를 시작하지 못했습니다: {e}")
+        logger.info("⏰ 다음 파이프라인 실행까지 30분 대기...")
+        await asyncio.sleep(PIPELINE_INTERVAL_SECONDS)
+        logger.info("🔔 30분 경과 - 파이프라인 재실행...")
 
 # --- FastAPI Lifespan 이벤트 ---
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI 앱의 시작과 종료 시점에 실행될 작업을 정의합니다."""
-    global pipeline_thread
-    
     # === 서버 시작 시 실행 (Startup) ===
-    print("🚀 서버 시작: 서비스 및 백그라운드 작업을 초기화합니다...")
+    logger.info("🚀 서버 시작: 서비스 및 백그라운드 작업을 초기화합니다...")
     
-    # 1. 각종 서비스 초기화 (DB 연결 등)
-    try:
-        from services import initialize_all_services
-        if initialize_all_services():
-            print("✅ 모든 서비스 초기화 완료")
-        else:
-            print("⚠️ 일부 서비스 초기화 실패 - 백그라운드에서 재시도됩니다.")
-    except Exception as e:
-        print(f"⚠️ 서비스 초기화 중 심각한 오류 발생: {e}")
-
-    # 2. 백그라운드 파이프라인 스레드 시작
-    pipeline_thread = threading.Thread(target=run_background_pipeline, daemon=True)
-    pipeline_thread.start()
-    print("✅ 백그라운드 파이프라인 스레드 시작됨")
+    # 1~2. MySQL 비동기 커넥션 풀 생성(서버 이벤트 루프에 바인딩)과
+    #      블로킹 서비스 초기화(RAG 모델/벡터스토어 로드 등), 과거 뉴스 CSV 파싱을 동시에 진행합니다.
+    #      무거운 초기화는 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    from services import initialize_all_services
+    db_service = database_service.get_database_service()
+    db_result, services_result, _ = await asyncio.gather(
+        db_service.initialize(),
+        asyncio.to_thread(initialize_all_services),
+        asyncio.to_thread(news_api.load_csv_data),
+        return_exceptions=True
+    )
+
+    if isinstance(db_result, BaseException):
+        logger.error("❌ MySQL 커넥션 풀 생성 실패: %s", db_result)
+    if isinstance(services_result, BaseException):
+        logger.warning("⚠️ 서비스 초기화 중 심각한 오류 발생: %s", services_result)
+    elif services_result:
+        logger.info("✅ 모든 서비스 초기화 완료")
+    else:
+        logger.warning("⚠️ 일부 서비스 초기화 실패 - 백그라운드에서 재시도됩니다.")
+
+    # 3. 백그라운드 파이프라인 스케줄러 시작 (여러 워커 중 락을 잡은 한 프로세스에서만)
+    #    스케줄 실행과 수동 새로고침은 모두 PIPELINE_RUN_LOCK_FILE 파일 락을 잡고 실행되므로,
+    #    어느 워커에서 요청되든 동시에 하나만 돌고 겹친 쪽은 시작하지 않습니다.
+    app.state.pipeline_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+    app.state.scheduler_task = None
+    if RUN_SCHEDULER and acquire_scheduler_lock():
+        app.state.scheduler_task = asyncio.create_task(scheduler_loop(app.state.pipeline_executor))
+        logger.info("✅ 백그라운드 파이프라인 스케줄러 시작됨")
+    else:
+        logger.info("ℹ️ 이 워커에서는 스케줄러를 실행하지 않습니다 (API 전용)")
     
     yield  # 이 시점에서 실제 FastAPI 서버가 실행됩니다.
     
     # === 서버 종료 시 실행 (Shutdown) ===
-    print("👋 서버를 종료합니다...")
+    logger.info("👋 서버를 종료합니다...")
+    if app.state.scheduler_task:
+        app.state.scheduler_task.cancel()
+        try:
+            await app.state.scheduler_task
+        except asyncio.CancelledError:
+            pass
+    
     if pipeline_executor:
         try:
             pipeline_executor.shutdown()
-            print("✅ 백그라운드 파이프라인 정상 종료")
+            logger.info("✅ 백그라운드 파이프라인 정상 종료")
         except Exception as e:
-            print(f"⚠️ 백그라운드 파이프라인 종료 중 오류 발생: {e}")
+            logger.warning("⚠️ 백그라운드 파이프라인 종료 중 오류 발생: %s", e)
+    
+    # 진행 중인 파이프라인 실행이 끝날 때까지 기다린 뒤 워커 스레드 정리
+    await asyncio.to_thread(app.state.pipeline_executor.shutdown, wait=True)
     
-    print("✅ 서버 종료 완료")
+    await db_service.close()
+    logger.info("✅ 서버 종료 완료")
+    stop_logging()
 
 # --- FastAPI 앱 생성 및 설정 ---
 app = FastAPI(
     title=API_TITLE,
     version=API_VERSION,
     description=API_DESCRIPTION,
+    default_response_class=ORJSONResponse,  # 큰 중첩 응답(/latest 등)을 orjson으로 빠르게 직렬화합니다.
     lifespan=lifespan  # 시작/종료 이벤트를 처리할 lifespan 함수를 등록합니다.
 )
 
@@ -127,8 +193,9 @@ app.include_router(pipeline_api.router, prefix="/api/pipeline", tags=["Pipeline
 
 # --- 정적 파일 및 루트 경로 설정 ---
 # 'static' 폴더를 정적 파일 디렉토리로 지정하여 HTML, CSS, JS 파일을 서비스합니다.
+# 작은 파일은 메모리에 올려두고 ETag/Cache-Control로 재요청을 304 처리합니다.
 static_dir = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=static_dir, html=True), name="static")
+app.mount("/static", CachedStaticFiles(directory=static_dir, html=True), name="static")
 
 # 루트 경로 ("/")로 접속 시 메인 페이지로 이동시킵니다.
 @app.get("/")
@@ -149,6 +216,7 @@ if __name__ == "__main__":
     print("📋 API 문서: http://localhost:8000/docs")
     print("🏠 프론트엔드: http://localhost:8000/static/index.html")
     print("🔄 백그라운드 파이프라인: 30분마다 자동 실행")
+    print(f"👷 워커 프로세스: {WEB_CONCURRENCY}개")
     print("=" * 50)
     
     uvicorn.run(
@@ -156,5 +224,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=False,  # 백그라운드 스레드와 충돌을 피하기 위해 reload는 False로 설정
+        workers=WEB_CONCURRENCY,  # 워커마다 별도 프로세스/이벤트 루프 (스케줄러는 한 워커에서만 실행)
+        # uvloop 이벤트 루프 + httptools 파서 (uvicorn[standard]에 포함, uvloop은 Windows 미지원)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
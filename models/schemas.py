@@ -1,20 +1,25 @@
 # models/schemas.py (누락된 모델들 추가)
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any, Literal
 
+# --- 공통 베이스 모델 ---
+class SchemaModel(BaseModel):
+    """모든 스키마의 공통 설정 (불변 + 속성 기반 생성 허용, 검증기는 클래스 정의 시 한 번만 컴파일)"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
 # --- Health Check Schemas ---
-class ComponentHealth(BaseModel):
+class ComponentHealth(SchemaModel):
     name: str
     status: Literal["ok", "degraded", "error", "disabled"]
     detail: Optional[Dict | str] = None
 
-class HealthResponse(BaseModel):
+class HealthResponse(SchemaModel):
     status: Literal["ok", "degraded", "error"]
     timestamp: str
     components: Dict[str, ComponentHealth]
 
 # --- News Schemas (추가) ---
-class NewsIssue(BaseModel):
+class NewsIssue(SchemaModel):
     """뉴스 이슈 모델"""
     id: Optional[int] = None
     issue_number: Optional[int] = None
@@ -32,33 +37,33 @@ class NewsIssue(BaseModel):
     related_industries: Optional[List[Dict]] = None
     related_past_issues: Optional[List[Dict]] = None
 
-class NewsListResponse(BaseModel):
+class NewsListResponse(SchemaModel):
     """뉴스 목록 응답 모델"""
     success: bool
     data: Dict[str, Any]
     message: Optional[str] = None
 
 # --- Analysis Schemas ---
-class AnalysisRequest(BaseModel):
+class AnalysisRequest(SchemaModel):
     content: str = Field(..., description="분석할 뉴스 기사 본문")
 
-class PastIssueInfo(BaseModel):
+class PastIssueInfo(SchemaModel):
     issue_name: str
     contents: str
     similarity_score: float
 
-class IndustryInfo(BaseModel):
+class IndustryInfo(SchemaModel):
     industry_name: str
     description: str
     similarity_score: float
 
-class FullAnalysisResponse(BaseModel):
+class FullAnalysisResponse(SchemaModel):
     explanation: str
     confidence: float
     past_issues: List[PastIssueInfo]
     industries: List[IndustryInfo]
 
-class CurrentIssue(BaseModel):
+class CurrentIssue(SchemaModel):
     이슈번호: int
     카테고리: str
     제목: str
@@ -69,18 +74,18 @@ class CurrentIssue(BaseModel):
     related_industries: Optional[List[IndustryInfo]] = None
 
 # --- Database Schemas ---
-class PastIssue(BaseModel):
+class PastIssue(SchemaModel):
     id: str
     issue_name: str
     contents: Optional[str] = None
     related_industries: Optional[str] = None
     start_date: Optional[str] = None
 
-class Industry(BaseModel):
+class Industry(SchemaModel):
     krx_name: str
     description: Optional[str] = None
 
-class DatabaseStats(BaseModel):
+class DatabaseStats(SchemaModel):
     industries: int
     past_issues: int
     current_issues: int
@@ -88,52 +93,52 @@ class DatabaseStats(BaseModel):
     db_size_mb: float
 
 # --- Simulation Schemas ---
-class StockSelection(BaseModel):
+class StockSelection(SchemaModel):
     code: str
     name: str
     allocation: float = Field(..., gt=0, le=100)
 
-class SimulationRequest(BaseModel):
+class SimulationRequest(SchemaModel):
     scenario_id: str
     investment_amount: int = Field(..., gt=0)
     investment_period: int = Field(..., ge=1, le=24, description="투자 기간(개월)")
     selected_stocks: List[StockSelection]
 
-class SimulationResult(BaseModel):
+class SimulationResult(SchemaModel):
     initial_amount: int
     final_amount: int
     total_return_pct: float
 
-class SimulationResponse(BaseModel):
+class SimulationResponse(SchemaModel):
     scenario_info: Dict
     simulation_results: SimulationResult
     market_comparison: Dict
     stock_analysis: List[Dict]
     learning_points: List[str]
 
-class Scenario(BaseModel):
+class Scenario(SchemaModel):
     id: str
     name: str
     description: str
     period: str
     related_industries: List[str]
 
-class RecommendedStockInfo(BaseModel):
+class RecommendedStockInfo(SchemaModel):
     scenario_id: str
     recommended_stocks: Dict[str, List[Dict[str, str]]]
 
-class ValidationResponse(BaseModel):
+class ValidationResponse(SchemaModel):
     valid: bool
     errors: List[str]
     warnings: List[str]
 
 # --- 상세 분석을 위한 새로운 스키마들 (추가) ---
-class DetailedSectorAnalysis(BaseModel):
+class DetailedSectorAnalysis(SchemaModel):
     섹터명: str
     영향도: str  # "높음", "중간", "낮음"
     방향: str   # "긍정적", "부정적", "중립적"
 
-class DetailedIssueAnalysis(BaseModel):
+class DetailedIssueAnalysis(SchemaModel):
     rank: int
     제목: str
     핵심영향요인: List[str]
@@ -144,13 +149,13 @@ class DetailedIssueAnalysis(BaseModel):
     리스크요인: List[str]
     신뢰도: float
 
-class MarketOutlook(BaseModel):
+class MarketOutlook(SchemaModel):
     overall_sentiment: str
     key_themes: List[str]
     attention_sectors: List[str]
     risk_factors: List[str]
 
-class EnhancedAnalysisResponse(BaseModel):
+class EnhancedAnalysisResponse(SchemaModel):
     selected_issues: List[Dict]
     detailed_analysis: List[DetailedIssueAnalysis]
     market_outlook: MarketOutlook
@@ -7,6 +7,15 @@ from langchain_openai import OpenAIEmbeddings
 
 import config
 
+# CSV에서 업로드에 쓰는 컬럼만 읽음 (없는 컬럼이 있어도 실패하지 않도록 usecols에 멤버십 함수 사용)
+INDUSTRY_COLUMNS = frozenset({'KRX 업종명', '상세내용'})
+PAST_ISSUE_COLUMNS = frozenset({'ID', 'Issue_name', 'Contents', '관련 산업', 'Start_date', 'Fin_date'})
+# 모든 값을 문자열로, 빈 칸은 NaN 대신 ''로 바로 읽음 (타입 추론과 fillna 복사본 생략, utf-8-sig로 BOM 제거)
+CSV_READ_OPTIONS = {"dtype": str, "keep_default_na": False, "encoding": "utf-8-sig"}
+
+# 비동기 upsert를 처리할 Pinecone 클라이언트 스레드 수 (다음 배치 임베딩과 업로드가 겹쳐 진행됨)
+UPSERT_POOL_THREADS = 8
+
 def initialize_pinecone():
     """Pinecone 클라이언트와 인덱스를 초기화하고 연결합니다."""
     print("🌲 Pinecone 초기화 중...")
@@ -25,7 +34,7 @@ def initialize_pinecone():
     else:
         print(f"✅ 기존 인덱스 '{index_name}'에 연결합니다.")
         
-    return pc.Index(index_name)
+    return pc.Index(index_name, pool_threads=UPSERT_POOL_THREADS)
 
 def prepare_data_for_pinecone(df: pd.DataFrame, type: str):
     """DataFrame을 Pinecone에 업로드할 형식으로 준비합니다."""
@@ -53,6 +62,10 @@ def prepare_data_for_pinecone(df: pd.DataFrame, type: str):
             # CSV의 ID 컬럼은 이미 ASCII이므로 그대로 사용
             record_id = str(row['ID'])
             
+        # langchain PineconeVectorStore는 metadata의 "text"를 page_content로 사용하므로 함께 저장
+        # (검색 측은 name/description/기간을 metadata에서 바로 읽고 본문은 파싱하지 않음)
+        metadata["text"] = text_to_embed
+        
         records.append({
             "id": record_id,
             "text": text_to_embed,
@@ -68,16 +81,25 @@ def embed_and_upsert(index, records: list, namespace: str, batch_size: int = 100
     )
     print(f"총 {len(records)}개의 레코드를 {namespace} 네임스페이스에 업로드합니다.")
     
+    pending_upserts = []
     for i in tqdm(range(0, len(records), batch_size), desc=f"Uploading to {namespace}"):
         batch = records[i : i + batch_size]
         
-        texts_to_embed = [item['text'] for item in batch]
         ids_to_upsert = [item['id'] for item in batch]
         metadata_to_upsert = [item['metadata'] for item in batch]
         
-        embeddings = embedding_model.embed_documents(texts_to_embed)
-        vectors_to_upsert = zip(ids_to_upsert, embeddings, metadata_to_upsert)
-        index.upsert(vectors=vectors_to_upsert, namespace=namespace)
+        # 배치 안에서 같은 텍스트는 한 번만 임베딩 (API 비용 절감)
+        unique_texts = list(dict.fromkeys(item['text'] for item in batch))
+        embedding_by_text = dict(zip(unique_texts, embedding_model.embed_documents(unique_texts)))
+        embeddings = [embedding_by_text[item['text']] for item in batch]
+        
+        # 업로드는 백그라운드 스레드에서 진행하고 바로 다음 배치 임베딩으로 넘어감
+        vectors_to_upsert = list(zip(ids_to_upsert, embeddings, metadata_to_upsert))
+        pending_upserts.append(index.upsert(vectors=vectors_to_upsert, namespace=namespace, async_req=True))
+    
+    # 모든 업로드 완료 대기 (실패한 배치가 있으면 여기서 예외 발생)
+    for upsert in pending_upserts:
+        upsert.get()
 
 def safe_delete_namespace(index, namespace: str):
     """네임스페이스가 존재하는 경우에만 삭제합니다."""
@@ -104,13 +126,19 @@ def main():
     safe_delete_namespace(index, 'past_issue')
 
     print("\n--- 🏭 산업 DB 처리 시작 ---")
-    df_industry = pd.read_csv(config.INDUSTRY_CSV_PATH).dropna(subset=['KRX 업종명']).fillna('')
+    df_industry = pd.read_csv(
+        config.INDUSTRY_CSV_PATH, usecols=INDUSTRY_COLUMNS.__contains__, **CSV_READ_OPTIONS
+    )
+    df_industry = df_industry[df_industry['KRX 업종명'] != '']
     industry_records = prepare_data_for_pinecone(df_industry, 'industry')
     embed_and_upsert(index, industry_records, namespace='industry')
     print("✅ 산업 DB 처리 완료.")
     
     print("\n--- 📰 과거 이슈 DB 처리 시작 ---")
-    df_past_issue = pd.read_csv(config.PAST_NEWS_CSV_PATH).dropna(subset=['ID']).fillna('')
+    df_past_issue = pd.read_csv(
+        config.PAST_NEWS_CSV_PATH, usecols=PAST_ISSUE_COLUMNS.__contains__, **CSV_READ_OPTIONS
+    )
+    df_past_issue = df_past_issue[df_past_issue['ID'] != '']
     past_issue_records = prepare_data_for_pinecone(df_past_issue, 'past_issue')
     embed_and_upsert(index, past_issue_records, namespace='past_issue')
     print("✅ 과거 이슈 DB 처리 완료.")
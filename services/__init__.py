@@ -56,12 +56,11 @@ def initialize_all_services():
         success_count = 0
         total_services = 0
         
-        # 데이터베이스 서비스 초기화
+        # 데이터베이스 서비스 등록 (비동기 커넥션 풀은 lifespan에서 생성)
         if DatabaseService and _database_service is None:
             try:
                 _database_service = get_database_service()
-                _database_service.initialize()
-                print("✅ Database Service 초기화 완료")
+                print("✅ Database Service 등록 완료")
                 success_count += 1
             except Exception as e:
                 print(f"❌ Database Service 초기화 실패: {e}")
@@ -10,21 +10,91 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import traceback
 import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from datetime import datetime
 import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    from config import JSON_INDENT_OUTPUT
+except ImportError:
+    # services/ 안에서 스크립트로 단독 실행하는 경우 (프로젝트 루트가 sys.path에 없음)
+    JSON_INDENT_OUTPUT = os.getenv("JSON_INDENT_OUTPUT", "true").lower() == "true"
+
+# 결과 JSON 직렬화 옵션 (들여쓰기는 JSON_INDENT_OUTPUT 설정에 따름)
+RESULT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+if JSON_INDENT_OUTPUT:
+    RESULT_JSON_OPTIONS |= orjson.OPT_INDENT_2
+
+# 결과 파일 쓰기 버퍼 크기 (수 MB 결과를 적은 write 호출로 기록)
+RESULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
 class BigKindsCrawler:
     """BigKinds 다중 카테고리 크롤러"""
     
     # 크롤링 대상 카테고리 (전체 제외)
     TARGET_CATEGORIES = ["정치", "경제", "사회", "문화", "국제", "지역", "IT과학"]
     
-    def __init__(self, data_dir: str = "data2", headless: bool = False, issues_per_category: int = 10):
+    # 동시에 띄울 Chrome 드라이버 수 (메모리/사이트 부하 고려)
+    MAX_PARALLEL_DRIVERS = 4
+    
+    # 이슈 슬라이드/팝업 셀렉터
+    ACTIVE_ISSUE_SELECTOR = '.swiper-slide-active .issue-item-link'
+    POPUP_TITLE_SELECTOR = 'p.issuPopTitle'
+    POPUP_CONTENT_SELECTOR = 'p.pT20.issuPopContent'
+    NEXT_SLIDE_BUTTON_SELECTOR = 'div.swiper-button-next.section2-btn.st2-sw1-next'
+    ACTIVE_SLIDE_TITLE_SELECTOR = '.swiper-slide-active .issue-title'
+    NEXT_SLIDE_SCRIPT = """
+        const btn = document.querySelector(arguments[0]);
+        if (!btn) return {status: 'missing'};
+        if (btn.getAttribute('aria-disabled') === 'true') return {status: 'end'};
+        const active = document.querySelector(arguments[1]);
+        const title = active ? active.innerText.trim() : '';
+        btn.click();
+        return {status: 'clicked', title: title};
+    """
+    ACTIVE_SLIDE_TITLE_SCRIPT = """
+        const active = document.querySelector(arguments[0]);
+        return active ? active.innerText.trim() : null;
+    """
+    READ_POPUP_SCRIPT = """
+        const title = document.querySelector(arguments[0]);
+        const content = document.querySelector(arguments[1]);
+        return {
+            title: title ? title.innerText.trim() : null,
+            content: content ? content.innerText.trim() : null
+        };
+    """
+    
+    # 사이트 접속 시 닫을 안내 팝업의 닫기 버튼 셀렉터들
+    POPUP_CLOSE_SELECTORS = ['.popup-close-btn']
+    CLOSE_POPUPS_SCRIPT = """
+        for (const selector of arguments[0]) {
+            document.querySelectorAll(selector).forEach(el => { try { el.click(); } catch (e) {} });
+        }
+    """
+    
+    # 이미지 차단 시 CDP로 막을 URL 패턴 (JS는 그대로 실행되어야 하므로 네트워크 단에서만 차단)
+    BLOCKED_IMAGE_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp"]
+    # 웹폰트도 텍스트 추출에는 필요 없으므로 이미지와 같은 조건으로 차단
+    BLOCKED_FONT_URL_PATTERNS = ["*.woff*", "*.ttf"]
+    # 분석/광고 트래커는 크롤링 결과와 무관하므로 항상 차단
+    BLOCKED_TRACKER_URL_PATTERNS = [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*hotjar.com*", "*facebook.net*"
+    ]
+    
+    # 카테고리 전환 시 기존 슬라이드가 교체되기를 기다리는 최대 시간 (기존 고정 대기 4초와 동일)
+    CATEGORY_SWITCH_TIMEOUT = 4
+    
+    def __init__(self, data_dir: str = "data2", headless: bool = False, issues_per_category: int = 10,
+                 block_images: Optional[bool] = None):
         """
         크롤러 초기화
         
@@ -32,10 +102,12 @@ class BigKindsCrawler:
             data_dir: 데이터 저장 디렉토리
             headless: 헤드리스 모드 실행 여부
             issues_per_category: 카테고리별 크롤링할 이슈 수
+            block_images: 이미지 요청 차단 여부 (None이면 헤드리스 모드에서만 차단)
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.headless = headless
+        self.block_images = headless if block_images is None else block_images
         self.issues_per_category = issues_per_category
         self.driver = None
         self.wait = None
@@ -89,47 +161,61 @@ class BigKindsCrawler:
         print(f"📊 카테고리별 이슈 수: {self.issues_per_category}개")
         print(f"🎯 예상 총 이슈 수: {len(self.TARGET_CATEGORIES) * self.issues_per_category}개")
         
+        # 드라이버를 가진 워커 풀 (카테고리마다 Chrome을 새로 띄우지 않고 워커의 드라이버를 재사용)
+        max_workers = min(len(self.TARGET_CATEGORIES), self.MAX_PARALLEL_DRIVERS)
+        workers = [
+            BigKindsCrawler(
+                data_dir=str(self.data_dir),
+                headless=self.headless,
+                issues_per_category=self.issues_per_category,
+                block_images=self.block_images
+            )
+            for _ in range(max_workers)
+        ]
+        worker_pool: "queue.Queue[BigKindsCrawler]" = queue.Queue()
+        for worker in workers:
+            worker_pool.put(worker)
+        
         try:
-            self._setup_driver()
-            
-            # 각 카테고리별 크롤링
-            for idx, category in enumerate(self.TARGET_CATEGORIES, 1):
-                print(f"\n{'='*60}")
-                print(f"📂 [{idx}/{len(self.TARGET_CATEGORIES)}] '{category}' 카테고리 크롤링 시작")
-                print(f"{'='*60}")
+            # 카테고리들을 워커 풀로 병렬 크롤링 (브라우저 수는 MAX_PARALLEL_DRIVERS로 제한)
+            print(f"🧵 병렬 크롤링: 드라이버 {max_workers}개")
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    (category, executor.submit(self._crawl_one_category, category, worker_pool))
+                    for category in self.TARGET_CATEGORIES
+                ]
                 
-                try:
-                    # <<< 💡 핵심 수정: 루프 안에서 홈페이지로 재이동하여 상태 초기화
-                    self._navigate_to_bigkinds()
-
-                    category_issues = self._crawl_category(category)
-                    self.crawling_results["categories"][category] = category_issues
-                    self.crawling_results["all_issues"].extend(category_issues)
-                    
-                    print(f"✅ '{category}' 카테고리 완료: {len(category_issues)}개 이슈")
-                    self.crawling_results["crawling_log"].append({
-                        "category": category,
-                        "status": "success",
-                        "issues_count": len(category_issues),
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    
-                    # 카테고리 간 대기 (사이트 부하 방지)
-                    if idx < len(self.TARGET_CATEGORIES):
-                        print("⏳ 다음 카테고리 대기 중... (3초)")
-                        time.sleep(3)
-                    
-                except Exception as e:
-                    error_msg = f"❌ '{category}' 카테고리 크롤링 실패: {e}"
-                    print(error_msg)
-                    self.crawling_results["crawling_log"].append({
-                        "category": category,
-                        "status": "failed",
-                        "error": str(e),
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    # 한 카테고리 실패해도 다음 카테고리 계속 진행
-                    continue
+                # 결과는 카테고리 순서대로 병합
+                for idx, (category, future) in enumerate(futures, 1):
+                    try:
+                        category_issues = future.result()
+                        self.crawling_results["categories"][category] = category_issues
+                        self.crawling_results["all_issues"].extend(category_issues)
+                        
+                        print(f"✅ [{idx}/{len(self.TARGET_CATEGORIES)}] '{category}' 카테고리 완료: {len(category_issues)}개 이슈")
+                        self.crawling_results["crawling_log"].append({
+                            "category": category,
+                            "status": "success",
+                            "issues_count": len(category_issues),
+                            "timestamp": datetime.now().strftime("%H:%M:%S")
+                        })
+                        
+                    except Exception as e:
+                        error_msg = f"❌ '{category}' 카테고리 크롤링 실패: {e}"
+                        print(error_msg)
+                        self.crawling_results["crawling_log"].append({
+                            "category": category,
+                            "status": "failed",
+                            "error": str(e),
+                            "timestamp": datetime.now().strftime("%H:%M:%S")
+                        })
+                        # 한 카테고리 실패해도 다음 카테고리 계속 진행
+                        continue
+            
+            # 워커별로 따로 매긴 이슈번호를 병합 순서대로 다시 부여
+            for number, issue in enumerate(self.crawling_results["all_issues"], 1):
+                issue["이슈번호"] = number
                 
             # 결과 정리
             self.crawling_results["total_issues"] = len(self.crawling_results["all_issues"])
@@ -151,7 +237,33 @@ class BigKindsCrawler:
             traceback.print_exc()
             raise
         finally:
-            self._cleanup_driver()
+            for worker in workers:
+                worker._cleanup_driver()
+
+    def _crawl_one_category(self, category: str, worker_pool: "queue.Queue[BigKindsCrawler]") -> List[Dict]:
+        """
+        카테고리 하나를 풀에서 꺼낸 워커의 드라이버로 크롤링 (병렬 워커용)
+        
+        driver/wait가 인스턴스 상태이므로 스레드마다 별도 크롤러 인스턴스를 사용하고,
+        드라이버는 세션이 끊긴 경우에만 새로 띄움
+        """
+        print(f"\n📂 '{category}' 카테고리 크롤링 시작")
+        
+        worker = worker_pool.get()
+        try:
+            if not worker._driver_alive():
+                worker._cleanup_driver()
+                worker._setup_driver()
+            # 이전 카테고리의 슬라이드/팝업 상태가 남지 않도록 페이지만 다시 로드
+            worker._navigate_to_bigkinds()
+            return worker._crawl_category(category)
+        except Exception:
+            # 세션이 끊긴 드라이버는 정리해 두고 다음 사용 시 다시 띄움
+            if not worker._driver_alive():
+                worker._cleanup_driver()
+            raise
+        finally:
+            worker_pool.put(worker)
 
     def _crawl_single_category(self, category: str, max_issues: int) -> Dict:
         """단일 카테고리 크롤링 (기존 방식 호환)"""
@@ -187,6 +299,8 @@ class BigKindsCrawler:
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+            # 병렬 드라이버별 메모리 절감 (GPU 비활성화, 이미지는 드라이버 생성 후 CDP로 차단)
+            options.add_argument("--disable-gpu")
         else:
             options.add_argument("--start-maximized")
         
@@ -199,13 +313,46 @@ class BigKindsCrawler:
         options.add_argument("--disable-web-security")
         options.add_argument("--allow-running-insecure-content")
 
-        self.driver = webdriver.Chrome(options=options)
+        # driver.get()이 모든 하위 리소스의 load 이벤트가 아니라 DOMContentLoaded에서 반환되도록 설정
+        # (필요한 요소는 _navigate_to_bigkinds에서 명시적으로 대기)
+        options.page_load_strategy = "eager"
+
+        # chromedriver와의 HTTP 연결을 명령마다 새로 맺지 않도록 keep-alive 명시
+        # (드라이버 하나는 한 스레드만 사용하므로 연결 풀 1개로 충분)
+        self.driver = webdriver.Chrome(options=options, keep_alive=True)
         # webdriver 속성 숨기기
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         self.wait = WebDriverWait(self.driver, 15)  # 대기 시간 증가
+        self._block_requests()
         
         print("✅ Chrome 드라이버 설정 완료")
 
+    def _blocked_url_patterns(self) -> List[str]:
+        """CDP로 차단할 요청 URL 패턴"""
+        patterns = list(self.BLOCKED_TRACKER_URL_PATTERNS)
+        if self.block_images:
+            patterns += self.BLOCKED_IMAGE_URL_PATTERNS + self.BLOCKED_FONT_URL_PATTERNS
+        return patterns
+
+    def _block_requests(self):
+        """불필요한 리소스 요청을 CDP Network.setBlockedURLs로 차단 (실패해도 크롤링은 계속)"""
+        patterns = self._blocked_url_patterns()
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as e:
+            print(f"⚠️ 리소스 차단 설정 실패: {e}")
+
+    def _driver_alive(self) -> bool:
+        """드라이버 세션이 아직 살아있는지 확인 (가벼운 명령 한 번)"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
     def _cleanup_driver(self):
         """드라이버 안전 종료"""
         if self.driver:
@@ -224,13 +371,15 @@ class BigKindsCrawler:
         
         try:
             self.driver.get("https://www.bigkinds.or.kr/")
-            time.sleep(3)  # 페이지 로딩 대기
+            # 페이지 로딩 대기 (카테고리 버튼이 나타날 때까지)
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a.issue-category'))
+            )
             
-            # 팝업 닫기 (있다면)
+            # 팝업 닫기 (있다면) - 셀렉터별 find_element 대신 JS 한 번으로 열린 팝업을 모두 닫음
             try:
-                popup_close = self.driver.find_element(By.CSS_SELECTOR, ".popup-close-btn")
-                popup_close.click()
-            except:
+                self.driver.execute_script(self.CLOSE_POPUPS_SCRIPT, self.POPUP_CLOSE_SELECTORS)
+            except WebDriverException:
                 pass
                 
             print("✅ BigKinds 사이트 접속 완료")
@@ -244,7 +393,9 @@ class BigKindsCrawler:
         """오늘의 이슈 섹션으로 스크롤"""
         try:
             self.driver.execute_script("window.scrollTo(0, 880);")
-            time.sleep(2)
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR))
+            )
             print("✅ 이슈 섹션 스크롤 완료")
         except Exception as e:
             print(f"⚠️ 스크롤 실패: {e}")
@@ -288,9 +439,23 @@ class BigKindsCrawler:
                 EC.element_to_be_clickable((By.CSS_SELECTOR, category_selector))
             )
             
+            # 클릭 전 슬라이드 요소 (카테고리가 바뀌면 교체됨)
+            previous_issues = self.driver.find_elements(By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR)
+            
             # JavaScript로 클릭 (더 안정적)
             self.driver.execute_script("arguments[0].click();", category_button)
-            time.sleep(4)  # 카테고리 변경 대기 시간 증가
+            
+            # 카테고리 변경 대기: 기존 슬라이드가 교체될 때까지 (최대 CATEGORY_SWITCH_TIMEOUT초)
+            if previous_issues:
+                try:
+                    WebDriverWait(self.driver, self.CATEGORY_SWITCH_TIMEOUT).until(
+                        EC.staleness_of(previous_issues[0])
+                    )
+                except TimeoutException:
+                    pass
+            self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR))
+            )
             
             print(f"✅ '{category}' 카테고리 선택 완료")
             
@@ -304,13 +469,14 @@ class BigKindsCrawler:
             # 카테고리 메뉴 클릭
             menu_btn = self.driver.find_element(By.CSS_SELECTOR, ".category-menu-btn")
             menu_btn.click()
-            time.sleep(1)
             
-            # 카테고리 선택
-            category_btn = self.driver.find_element(By.XPATH, 
-                f"//div[contains(@class, 'category-item') and contains(text(), '{category}')]")
+            # 카테고리 선택 (메뉴가 열려 버튼이 클릭 가능해질 때까지 대기)
+            category_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, 
+                f"//div[contains(@class, 'category-item') and contains(text(), '{category}')]")))
             category_btn.click()
-            time.sleep(2)
+            self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR))
+            )
             
             print(f"✅ '{category}' 카테고리 선택 완료")
             return True
@@ -344,7 +510,6 @@ class BigKindsCrawler:
                     print(f"    ✅ 이슈 {i} 추출 완료: {issue_data['제목'][:30]}...")
 
                 self._close_popup_and_restore()
-                time.sleep(1)
 
             except Exception as e:
                 print(f"    ❌ 이슈 {i} 처리 실패: {e}")
@@ -357,29 +522,26 @@ class BigKindsCrawler:
         슬라이드 넘기기 - 이슈 번호에 상관없이 항상 slide 이동 시도
         """
         try:
-            next_btn = self.driver.find_element(
-                By.CSS_SELECTOR,
-                'div.swiper-button-next.section2-btn.st2-sw1-next'
-            )
+            # 버튼 상태 확인 + 현재 타이틀 읽기 + 클릭을 한 번의 JS 호출로 처리
+            result = self.driver.execute_script(
+                self.NEXT_SLIDE_SCRIPT, self.NEXT_SLIDE_BUTTON_SELECTOR, self.ACTIVE_SLIDE_TITLE_SELECTOR
+            ) or {}
 
-            is_disabled = next_btn.get_attribute('aria-disabled') == 'true'
-            if is_disabled:
+            if result.get("status") == "missing":
+                print(f"    ⚠️ 슬라이드 넘기기 버튼 없음 (이슈 {issue_num})")
+                return
+            if result.get("status") == "end":
                 print(f"    ⚠️ 슬라이드 끝에 도달 (이슈 {issue_num})")
                 return
 
-            current_titles = self.driver.find_elements(By.CSS_SELECTOR, '.swiper-slide-active .issue-title')
-            current_text = current_titles[0].text.strip() if current_titles else ""
+            current_text = result.get("title") or ""
 
-            self.driver.execute_script("arguments[0].click();", next_btn)
-
-            # 타이틀이 변할 때까지 대기
+            # 타이틀이 변할 때까지 대기 (폴링마다 JS 한 번으로 활성 슬라이드 타이틀 조회)
             self.wait.until(
-                lambda d: d.find_elements(By.CSS_SELECTOR, '.swiper-slide-active .issue-title')
-                and d.find_elements(By.CSS_SELECTOR, '.swiper-slide-active .issue-title')[0].text.strip() != current_text
+                lambda d: (d.execute_script(self.ACTIVE_SLIDE_TITLE_SCRIPT, self.ACTIVE_SLIDE_TITLE_SELECTOR)
+                           or current_text) != current_text
             )
 
-            time.sleep(0.5)
-
         except Exception as e:
             print(f"    ⚠️ 슬라이드 넘기기 실패 (이슈 {issue_num}): {e}")
 
@@ -387,7 +549,7 @@ class BigKindsCrawler:
         """개별 이슈 데이터 추출 - 안정성 개선 버전"""
         try:
             # 현재 보여지는 이슈 링크 요소 찾기
-            issue_elements = self.driver.find_elements(By.CSS_SELECTOR, '.swiper-slide-active .issue-item-link')
+            issue_elements = self.driver.find_elements(By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR)
 
             if not issue_elements:
                 print(f"    ❌ 이슈 {issue_num} - swiper-slide-active 내 요소 없음")
@@ -396,20 +558,26 @@ class BigKindsCrawler:
             # 현재 보여지는 슬라이드들 중 첫 번째 요소 선택
             issue_element = issue_elements[0]
             
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", issue_element)
-            time.sleep(0.3)
-            self.driver.execute_script("arguments[0].click();", issue_element)
+            self.wait.until(EC.element_to_be_clickable(issue_element))
+            # 스크롤과 클릭을 한 번의 JS 호출로 처리
+            self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", issue_element)
 
-            # 팝업 데이터 추출 대기
-            title_elem = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.issuPopTitle'))
-            )
-            content_elem = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'p.pT20.issuPopContent'))
+            # 팝업 데이터 추출 대기 (이전 팝업이 DOM에 남아있을 수 있으므로 표시 여부로 확인)
+            self.wait.until(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, self.POPUP_TITLE_SELECTOR))
             )
 
-            title = title_elem.text.strip()
-            content = content_elem.text.strip()
+            # 제목/내용은 요소별 find/.text 왕복 대신 한 번의 JS 호출로 읽음
+            popup = self._read_popup()
+            if popup.get("content") is None:
+                # 내용이 아직 렌더링되지 않은 경우에만 추가 대기 후 다시 읽음
+                self.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.POPUP_CONTENT_SELECTOR))
+                )
+                popup = self._read_popup()
+
+            title = popup.get("title") or ""
+            content = popup.get("content") or ""
 
             unique_id = f"{category}_{issue_num}"
 
@@ -430,16 +598,26 @@ class BigKindsCrawler:
             return None
 
 
+    def _read_popup(self) -> Dict:
+        """이슈 팝업의 제목/내용 텍스트를 한 번의 DOM 조회로 반환 (요소가 없으면 None)"""
+        return self.driver.execute_script(
+            self.READ_POPUP_SCRIPT, self.POPUP_TITLE_SELECTOR, self.POPUP_CONTENT_SELECTOR
+        ) or {}
+
     def _close_popup_and_restore(self):
         """팝업 닫기 및 스크롤 위치 복원"""
         try:
             # ESC로 팝업 닫기
             ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-            time.sleep(1)
+            self.wait.until(
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, self.POPUP_TITLE_SELECTOR))
+            )
             
-            # 다시 이슈 섹션으로 스크롤
+            # 다시 이슈 섹션으로 스크롤 (다음 이슈를 클릭할 수 있을 때까지 대기)
             self.driver.execute_script("window.scrollTo(0, 880);")
-            time.sleep(1)
+            self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, self.ACTIVE_ISSUE_SELECTOR))
+            )
             
         except Exception as e:
             print(f"    ⚠️ 팝업 닫기 실패: {e}")
@@ -462,9 +640,9 @@ class BigKindsCrawler:
                 }
             }
             
-            # JSON 파일로 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # JSON 파일로 저장 (orjson bytes를 바이너리 모드로 한 번에 기록)
+            with open(filepath, 'wb', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(save_data, option=RESULT_JSON_OPTIONS))
             
             print(f"💾 크롤링 결과 저장 완료: {filepath}")
             return str(filepath)
@@ -507,8 +685,8 @@ class BigKindsCrawler:
             # 파일 수정 시간을 기준으로 가장 최신 파일 선택
             latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
             
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(latest_file, 'rb') as f:
+                data = orjson.loads(f.read())
             
             print(f"✅ 최신 다중 카테고리 데이터 로드: {latest_file.name}")
             print(f"📊 로드된 데이터: {data.get('total_issues', 0)}개 이슈")
@@ -5,17 +5,138 @@
 """
 
 import os
-import json
+import asyncio
+import logging
+import heapq
+import orjson
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import httpx
+import numpy as np
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import Runnable
 
-from .crawling_bigkinds import BigKindsCrawler
+from .crawling_bigkinds import BigKindsCrawler, RESULT_JSON_OPTIONS, RESULT_WRITE_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 LLM 호출로 함께 평가할 이슈 수 (컨텍스트/출력 길이 고려)
+RELEVANCE_BATCH_SIZE = 10
+
+# 동시에 진행할 관련성 분석 LLM 호출 수 (OpenAI rate limit 고려)
+RELEVANCE_MAX_CONCURRENCY = 4
+
+# LLM 평가 전에 임베딩 유사도로 남길 후보 수 (이보다 적게 크롤링되면 사전 필터링 생략)
+RELEVANCE_PREFILTER_SIZE = 20
+
+# 사전 필터링 기준 문장 (뉴스 제목과의 코사인 유사도 최댓값으로 주식시장 관련성을 근사)
+STOCK_RELEVANCE_PROBES = [
+    "기업 실적과 주가에 영향을 미치는 뉴스",
+    "금리, 세금, 규제 등 증시 전반에 영향을 주는 정부 정책 변화",
+    "환율, 물가, 경기 등 거시경제 지표 변동",
+    "외국인과 기관 투자자의 매수·매도 동향과 투자 심리",
+    "반도체, 2차전지, 자동차 등 특정 산업과 테마주의 업황 변화",
+    "기업 인수합병, 대규모 투자, 공급 계약 체결",
+]
+
+# 필터링 LLM 호출이 공유하는 HTTP 커넥션 풀 설정 (keep-alive로 TLS 핸드셰이크 재사용)
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0)
+
+# 주식시장 관련성 평가 system 프롬프트 (단건/일괄 분석 공용)
+RELEVANCE_SYSTEM_PROMPT = """너는 한국 주식시장 전문 애널리스트야. 
+    주어진 뉴스 이슈들을 분석하여 주식시장에 가장 큰 영향을 미칠 것으로 예상되는 이슈들을 선별해야 해.
+
+    📊 평가 기준 (각 1-10점):
+    1. **직접적 기업 영향**: 특정 기업이나 산업의 실적에 직접적인 영향을 미치는가?
+    2. **정책적 영향**: 금리, 세금, 규제 변화 등 시장 전반에 영향을 미치는 정책인가?
+    3. **시장 심리**: 투자자 신뢰도, 리스크 인식, 투자 심리에 미치는 영향은?
+    4. **거시경제**: GDP, 인플레이션, 환율 등 거시경제 지표에 미치는 영향은?
+    5. **산업 트렌드**: 새로운 기술이나 소비 패턴 변화로 인한 산업 영향은?
+
+    💡 우선순위:
+    - 단기적 주가 변동을 일으킬 가능성이 높은 이슈
+    - 특정 업종이나 테마주에 영향을 미치는 이슈
+    - 외국인 투자나 기관 투자에 영향을 미치는 이슈
+    - 정부 정책이나 규제 변화 관련 이슈
+
+    ⚠️ 중요: 각 점수에 대해 반드시 구체적인 근거를 제시해야 합니다."""
+
+# 관련성 평가 프롬프트 (일괄/단건) - 호출마다 템플릿을 다시 파싱하지 않도록 모듈 로드 시 한 번만 구성
+RELEVANCE_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", RELEVANCE_SYSTEM_PROMPT),
+    ("human", """
+    [뉴스 목록 (JSON)]
+    {issues_json}
+
+    위 {count}개 뉴스 각각의 주식시장 관련성을 분석해주세요.
+    각 뉴스마다 항목별 점수와 함께 구체적인 근거를 제시하고, 입력의 id를 그대로 돌려주세요.
+
+    출력 형식 (JSON):
+    {{
+        "results": [
+            {{
+                "id": 입력 id,
+                "직접적_기업영향": 점수,
+                "직접적_기업영향_근거": "구체적인 분석 근거 (어떤 기업에게 어떤 영향을 미치는지)",
+                "정책적_영향": 점수,
+                "정책적_영향_근거": "구체적인 분석 근거 (어떤 정책 변화가 예상되는지)",
+                "시장_심리_영향": 점수,
+                "시장_심리_영향_근거": "구체적인 분석 근거 (투자자 심리에 어떤 영향을 미치는지)",
+                "거시경제_영향": 점수,
+                "거시경제_영향_근거": "구체적인 분석 근거 (거시경제 지표에 어떤 영향을 미치는지)",
+                "산업_트렌드_영향": 점수,
+                "산업_트렌드_영향_근거": "구체적인 분석 근거 (어떤 산업 트렌드 변화가 예상되는지)",
+                "종합점수": 점수,
+                "종합점수_계산방식": "합계/평균/가중평균 중 어떤 방식으로 계산했는지",
+                "주된영향분야": ["섹터1", "섹터2"],
+                "예상영향방향": "긍정적/부정적/중립적",
+                "영향시기": "즉시/단기/중기",
+                "분석근거": "상세 분석 내용",
+                "예상시장반응": "예상되는 시장 반응 설명"
+            }}
+        ]
+    }}""")
+])
+
+RELEVANCE_SINGLE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", RELEVANCE_SYSTEM_PROMPT),
+    ("human", """
+    [뉴스 제목]
+    {title}
+
+    [뉴스 내용]  
+    {content}
+
+    위 뉴스의 주식시장 관련성을 분석해주세요.
+    각 항목별로 점수와 함께 구체적인 근거를 제시해주세요.
+
+    출력 형식 (JSON):
+    {{
+        "직접적_기업영향": 점수,
+        "직접적_기업영향_근거": "구체적인 분석 근거 (어떤 기업에게 어떤 영향을 미치는지)",
+        "정책적_영향": 점수,
+        "정책적_영향_근거": "구체적인 분석 근거 (어떤 정책 변화가 예상되는지)",
+        "시장_심리_영향": 점수,
+        "시장_심리_영향_근거": "구체적인 분석 근거 (투자자 심리에 어떤 영향을 미치는지)",
+        "거시경제_영향": 점수,
+        "거시경제_영향_근거": "구체적인 분석 근거 (거시경제 지표에 어떤 영향을 미치는지)",
+        "산업_트렌드_영향": 점수,
+        "산업_트렌드_영향_근거": "구체적인 분석 근거 (어떤 산업 트렌드 변화가 예상되는지)",
+        "종합점수": 점수,
+        "종합점수_계산방식": "합계/평균/가중평균 중 어떤 방식으로 계산했는지",
+        "주된영향분야": ["섹터1", "섹터2"],
+        "예상영향방향": "긍정적/부정적/중립적",
+        "영향시기": "즉시/단기/중기",
+        "분석근거": "상세 분석 내용",
+        "예상시장반응": "예상되는 시장 반응 설명"
+    }}""")
+])
 
 class CrawlingService:
     """크롤링 및 필터링 통합 서비스 - 원본 BigKindsCrawler 사용"""
@@ -28,16 +149,42 @@ class CrawlingService:
         load_dotenv(override=True)
         
         # AI 필터링용 LLM 초기화
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+        self.llm = self._build_llm()
+        
+        # 마지막으로 사용한 LLM에 대해 구성한 (LLM, 일괄 체인, 단건 체인) - 실행 중 호출마다 체인을 다시 만들지 않음
+        self._relevance_chains: Optional[Tuple[ChatOpenAI, Runnable, Runnable]] = None
+        
+        # 사전 필터링용 임베딩 클라이언트는 실행마다 생성 (기준 문장 임베딩 벡터만 처음 한 번 계산해 재사용)
+        self._probe_embeddings: Optional[np.ndarray] = None
         
-        print("✅ 크롤링 서비스 초기화 완료")
+        logger.info("✅ 크롤링 서비스 초기화 완료")
+    
+    def _build_llm(self, http_async_client: Optional[httpx.AsyncClient] = None) -> ChatOpenAI:
+        """필터링용 LLM 생성 (비동기 HTTP 클라이언트를 넘기면 그 커넥션 풀을 재사용)"""
+        return ChatOpenAI(model="gpt-4o-mini", temperature=0, http_async_client=http_async_client)
+    
+    def _build_embedding(self, http_async_client: Optional[httpx.AsyncClient] = None) -> OpenAIEmbeddings:
+        """사전 필터링용 임베딩 클라이언트 생성 (LLM과 같은 실행별 커넥션 풀 사용)"""
+        return OpenAIEmbeddings(
+            model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"),
+            http_async_client=http_async_client
+        )
+    
+    def _get_relevance_chains(self, llm: ChatOpenAI) -> Tuple[Runnable, Runnable]:
+        """관련성 평가 (일괄, 단건) 체인 반환 (같은 LLM이면 이전에 구성한 체인 재사용)"""
+        cached = self._relevance_chains
+        if cached is None or cached[0] is not llm:
+            parser = JsonOutputParser()
+            cached = (llm, RELEVANCE_BATCH_PROMPT | llm | parser, RELEVANCE_SINGLE_PROMPT | llm | parser)
+            self._relevance_chains = cached
+        return cached[1], cached[2]
     
-    def crawl_and_filter_news(self, 
+    async def crawl_and_filter_news(self, 
                                 issues_per_category: int = 10,
                                 target_filtered_count: int = 5) -> Dict:
-        """원본 BigKindsCrawler 사용 + 필터링"""
+        """원본 BigKindsCrawler 사용 + 필터링 (동기 코드에서는 asyncio.run으로 호출)"""
         
-        print(f"🕷️ BigKinds 크롤링 시작: 카테고리별 {issues_per_category}개씩")
+        logger.info("🕷️ BigKinds 크롤링 시작: 카테고리별 %s개씩", issues_per_category)
         
         # Step 1: 원본 BigKindsCrawler로 크롤링
         crawler = BigKindsCrawler(
@@ -46,15 +193,22 @@ class CrawlingService:
             issues_per_category=issues_per_category
         )
         
-        # 원본 메서드 그대로 호출
-        crawling_result = crawler.crawl_all_categories()
+        # 원본 메서드 그대로 호출 (Selenium은 동기이므로 스레드에서 실행)
+        crawling_result = await asyncio.to_thread(crawler.crawl_all_categories)
         
-        print(f"✅ 크롤링 완료: {crawling_result.get('total_issues', 0)}개 이슈")
+        logger.info("✅ 크롤링 완료: %s개 이슈", crawling_result.get('total_issues', 0))
         
         # Step 2: 필터링
         all_issues = crawling_result.get("all_issues", [])
         if all_issues:
-            filtering_result = self._filter_by_stock_relevance(all_issues, target_filtered_count)
+            # httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 실행마다 이 루프에서 열고 닫음
+            # (배치/단건 호출이 모두 같은 keep-alive 커넥션 풀을 공유)
+            async with httpx.AsyncClient(limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT) as http_client:
+                llm = self._build_llm(http_client)
+                embedding = self._build_embedding(http_client)
+                filtering_result = await self._filter_by_stock_relevance(
+                    all_issues, target_filtered_count, llm, embedding
+                )
         else:
             filtering_result = {
                 "selected_issues": [],
@@ -72,31 +226,51 @@ class CrawlingService:
             "filter_metadata": filtering_result["filter_metadata"]
         }
     
-    def _filter_by_stock_relevance(self, all_issues: List[Dict], target_count: int) -> Dict:
+    async def _filter_by_stock_relevance(self, all_issues: List[Dict], target_count: int,
+                                         llm: Optional[ChatOpenAI] = None,
+                                         embedding: Optional[OpenAIEmbeddings] = None) -> Dict:
         """주식시장 관련성 기반 필터링"""
+        llm = llm or self.llm
+        embedding = embedding or self._build_embedding()
         
-        print(f"🤖 AI 필터링 시작: {len(all_issues)}개 → {target_count}개 선별")
+        logger.info("🤖 AI 필터링 시작: %d개 → %s개 선별", len(all_issues), target_count)
         
-        # 각 이슈별로 주식시장 관련성 점수 계산
-        scored_issues = []
+        # 임베딩 유사도로 후보를 먼저 줄여 LLM에는 상위 후보만 전달
+        candidates = await self._prefilter_by_embedding(
+            all_issues, max(RELEVANCE_PREFILTER_SIZE, target_count), embedding
+        )
         
-        for i, issue in enumerate(all_issues, 1):
-            print(f"🔄 이슈 {i}/{len(all_issues)} 분석 중: {issue.get('제목', 'N/A')[:30]}...")
-            
-            # AI로 주식시장 관련성 분석
-            relevance_score = self._analyze_stock_market_relevance(issue)
-            
-            scored_issue = issue.copy()
-            scored_issue.update({
-                "주식시장_관련성_점수": relevance_score["종합점수"],
-                "관련성_분석": relevance_score
-            })
-            
-            scored_issues.append(scored_issue)
+        # 후보를 RELEVANCE_BATCH_SIZE개씩 묶어 한 번의 LLM 호출로 점수 계산 (배치들은 동시에 요청)
+        batches = [
+            candidates[start:start + RELEVANCE_BATCH_SIZE]
+            for start in range(0, len(candidates), RELEVANCE_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(RELEVANCE_MAX_CONCURRENCY)
         
-        # 점수순 정렬 및 상위 선별
-        scored_issues.sort(key=lambda x: x["주식시장_관련성_점수"], reverse=True)
-        selected_issues = scored_issues[:target_count]
+        async def analyze_batch(batch_no: int, batch: List[Dict]) -> List[Dict]:
+            async with semaphore:
+                logger.info("🔄 배치 %s/%d (%d개 이슈) 일괄 분석 중...", batch_no, len(batches), len(batch))
+                return await self._analyze_stock_market_relevance_batch(batch, llm)
+        
+        # AI로 주식시장 관련성 분석
+        batch_scores = await asyncio.gather(
+            *(analyze_batch(batch_no, batch) for batch_no, batch in enumerate(batches, 1))
+        )
+        
+        # 원본 이슈는 복사하지 않고 (점수, 이슈, 분석) 묶음만 만든 뒤 상위 target_count개만 새 dict로 구성
+        # (all_issues는 크롤링 결과에도 그대로 포함되므로 제자리 수정하지 않음)
+        scored = (
+            (relevance_score["종합점수"], issue, relevance_score)
+            for batch, relevance_scores in zip(batches, batch_scores)
+            for issue, relevance_score in zip(batch, relevance_scores)
+        )
+        
+        # 점수 상위 선별 (전체 정렬 없이 상위 target_count개만 힙으로 추출)
+        top_scored = heapq.nlargest(target_count, scored, key=lambda x: x[0])
+        selected_issues = [
+            {**issue, "주식시장_관련성_점수": score, "관련성_분석": relevance_score}
+            for score, issue, relevance_score in top_scored
+        ]
         
         # 순위 부여
         for rank, issue in enumerate(selected_issues, 1):
@@ -107,6 +281,7 @@ class CrawlingService:
             "filter_metadata": {
                 "filtering_method": "gpt-4o-mini_stock_relevance",
                 "original_count": len(all_issues),
+                "prefiltered_count": len(candidates),
                 "selected_count": len(selected_issues),
                 "average_score": sum(issue["주식시장_관련성_점수"] for issue in selected_issues) / len(selected_issues) if selected_issues else 0,
                 "filtered_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -116,113 +291,155 @@ class CrawlingService:
         # 필터링 결과 저장
         self._save_filtering_result(result)
         
-        print(f"✅ AI 필터링 완료: 상위 {len(selected_issues)}개 선별")
+        logger.info("✅ AI 필터링 완료: 상위 %d개 선별", len(selected_issues))
         return result
     
-    def _analyze_stock_market_relevance(self, issue: Dict) -> Dict:
-        """AI를 사용한 주식시장 관련성 분석 (근거 포함)"""
+    async def _prefilter_by_embedding(self, all_issues: List[Dict], keep: int,
+                                      embedding: OpenAIEmbeddings) -> List[Dict]:
+        """제목 임베딩과 기준 문장 임베딩의 유사도로 상위 keep개 후보만 추출 (실패 시 전체 반환)"""
+        if len(all_issues) <= keep:
+            return all_issues
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """너는 한국 주식시장 전문 애널리스트야. 
-    주어진 뉴스 이슈들을 분석하여 주식시장에 가장 큰 영향을 미칠 것으로 예상되는 이슈들을 선별해야 해.
-
-    📊 평가 기준 (각 1-10점):
-    1. **직접적 기업 영향**: 특정 기업이나 산업의 실적에 직접적인 영향을 미치는가?
-    2. **정책적 영향**: 금리, 세금, 규제 변화 등 시장 전반에 영향을 미치는 정책인가?
-    3. **시장 심리**: 투자자 신뢰도, 리스크 인식, 투자 심리에 미치는 영향은?
-    4. **거시경제**: GDP, 인플레이션, 환율 등 거시경제 지표에 미치는 영향은?
-    5. **산업 트렌드**: 새로운 기술이나 소비 패턴 변화로 인한 산업 영향은?
-
-    💡 우선순위:
-    - 단기적 주가 변동을 일으킬 가능성이 높은 이슈
-    - 특정 업종이나 테마주에 영향을 미치는 이슈
-    - 외국인 투자나 기관 투자에 영향을 미치는 이슈
-    - 정부 정책이나 규제 변화 관련 이슈
-
-    ⚠️ 중요: 각 점수에 대해 반드시 구체적인 근거를 제시해야 합니다."""),
-            ("human", """
-    [뉴스 제목]
-    {title}
-
-    [뉴스 내용]  
-    {content}
-
-    위 뉴스의 주식시장 관련성을 분석해주세요.
-    각 항목별로 점수와 함께 구체적인 근거를 제시해주세요.
-
-    출력 형식 (JSON):
-    {{
-        "직접적_기업영향": 점수,
-        "직접적_기업영향_근거": "구체적인 분석 근거 (어떤 기업에게 어떤 영향을 미치는지)",
-        "정책적_영향": 점수,
-        "정책적_영향_근거": "구체적인 분석 근거 (어떤 정책 변화가 예상되는지)",
-        "시장_심리_영향": 점수,
-        "시장_심리_영향_근거": "구체적인 분석 근거 (투자자 심리에 어떤 영향을 미치는지)",
-        "거시경제_영향": 점수,
-        "거시경제_영향_근거": "구체적인 분석 근거 (거시경제 지표에 어떤 영향을 미치는지)",
-        "산업_트렌드_영향": 점수,
-        "산업_트렌드_영향_근거": "구체적인 분석 근거 (어떤 산업 트렌드 변화가 예상되는지)",
-        "종합점수": 점수,
-        "종합점수_계산방식": "합계/평균/가중평균 중 어떤 방식으로 계산했는지",
-        "주된영향분야": ["섹터1", "섹터2"],
-        "예상영향방향": "긍정적/부정적/중립적",
-        "영향시기": "즉시/단기/중기",
-        "분석근거": "상세 분석 내용",
-        "예상시장반응": "예상되는 시장 반응 설명"
-    }}""")
-        ])
+        try:
+            if self._probe_embeddings is None:
+                self._probe_embeddings = np.asarray(
+                    await embedding.aembed_documents(STOCK_RELEVANCE_PROBES), dtype=np.float32
+                )
+            
+            title_embeddings = np.asarray(
+                await embedding.aembed_documents([issue.get("제목", "") for issue in all_issues]),
+                dtype=np.float32
+            )
+        except Exception as e:
+            logger.warning("⚠️ 임베딩 사전 필터링 실패 - 전체 이슈를 AI 분석: %s", e)
+            return all_issues
+        
+        # OpenAI 임베딩은 정규화되어 있으므로 내적 = 코사인 유사도, 기준 문장 중 최댓값을 점수로 사용
+        scores = np.einsum("ij,kj->ik", title_embeddings, self._probe_embeddings).max(axis=1)
+        top_indices = np.argpartition(-scores, keep - 1)[:keep]
+        # 크롤링 순서(카테고리/순위)를 유지해 배치 구성이 기존과 같도록 인덱스 정렬
+        candidates = [all_issues[idx] for idx in sorted(top_indices)]
+        
+        logger.info("🧮 임베딩 사전 필터링: %d개 → %d개 후보", len(all_issues), len(candidates))
+        return candidates
+    
+    async def _analyze_stock_market_relevance_batch(self, issues: List[Dict],
+                                                    llm: Optional[ChatOpenAI] = None) -> List[Dict]:
+        """여러 이슈를 한 번의 LLM 호출로 분석 (응답에서 빠진 이슈만 단건 분석으로 보완)"""
+        llm = llm or self.llm
+        
+        chain, _ = self._get_relevance_chains(llm)
+        
+        issues_json = orjson.dumps(
+            [{"id": idx, "제목": issue.get("제목", ""), "내용": issue.get("내용", "")}
+             for idx, issue in enumerate(issues)]
+        ).decode()
         
-        parser = JsonOutputParser()
-        chain = prompt | self.llm | parser
+        try:
+            response = await chain.ainvoke({"issues_json": issues_json, "count": len(issues)})
+            items = response.get("results", []) if isinstance(response, dict) else response
+            # 모델이 id를 문자열로 돌려주는 경우도 있어 문자열 키로 통일
+            results_by_id = {str(item.get("id")): item for item in items if isinstance(item, dict)}
+        except Exception as e:
+            logger.warning("⚠️ 일괄 AI 분석 실패 - 이슈별 분석으로 전환: %s", e)
+            results_by_id = {}
+        
+        scores = [
+            self._normalize_relevance_result(result) if result is not None else None
+            for result in (results_by_id.get(str(idx)) for idx in range(len(issues)))
+        ]
+        missing = [idx for idx, result in enumerate(scores) if result is None]
+        if missing:
+            # 응답에서 빠진 이슈들만 단건 체인 abatch로 동시에 분석 (동시 요청 수 제한, 실패한 이슈는 기본값)
+            fallback = await self._analyze_stock_market_relevance_many([issues[idx] for idx in missing], llm)
+            for idx, result in zip(missing, fallback):
+                scores[idx] = result
+        return scores
+    
+    async def _analyze_stock_market_relevance(self, issue: Dict,
+                                              llm: Optional[ChatOpenAI] = None) -> Dict:
+        """AI를 사용한 주식시장 관련성 분석 (근거 포함)"""
+        llm = llm or self.llm
+        
+        _, chain = self._get_relevance_chains(llm)
         
         try:
-            result = chain.invoke({
+            result = await chain.ainvoke({
                 "title": issue.get("제목", ""),
                 "content": issue.get("내용", "")
             })
             
-            # 🔥 수정된 반환 데이터 - 근거 포함
-            return {
-                "직접적_기업영향": result.get("직접적_기업영향", 5),
-                "직접적_기업영향_근거": result.get("직접적_기업영향_근거", "분석 근거 미제공"),
-                "정책적_영향": result.get("정책적_영향", 5),
-                "정책적_영향_근거": result.get("정책적_영향_근거", "분석 근거 미제공"),
-                "시장_심리_영향": result.get("시장_심리_영향", 5),
-                "시장_심리_영향_근거": result.get("시장_심리_영향_근거", "분석 근거 미제공"),
-                "거시경제_영향": result.get("거시경제_영향", 5),
-                "거시경제_영향_근거": result.get("거시경제_영향_근거", "분석 근거 미제공"),
-                "산업_트렌드_영향": result.get("산업_트렌드_영향", 5),
-                "산업_트렌드_영향_근거": result.get("산업_트렌드_영향_근거", "분석 근거 미제공"),
-                "종합점수": result.get("종합점수", 5),
-                "종합점수_계산방식": result.get("종합점수_계산방식", "AI 자체 계산"),
-                "주된영향분야": result.get("주된영향분야", []),
-                "예상영향방향": result.get("예상영향방향", "중립적"),
-                "영향시기": result.get("영향시기", "단기"),
-                "분석근거": result.get("분석근거", "AI 분석 완료"),
-                "예상시장반응": result.get("예상시장반응", "")
-            }
+            return self._normalize_relevance_result(result)
             
         except Exception as e:
-            print(f"❌ AI 분석 실패: {e}")
-            return {
-                "직접적_기업영향": 5, 
-                "직접적_기업영향_근거": f"AI 분석 실패: {e}",
-                "정책적_영향": 5, 
-                "정책적_영향_근거": f"AI 분석 실패: {e}",
-                "시장_심리_영향": 5,
-                "시장_심리_영향_근거": f"AI 분석 실패: {e}",
-                "거시경제_영향": 5, 
-                "거시경제_영향_근거": f"AI 분석 실패: {e}",
-                "산업_트렌드_영향": 5, 
-                "산업_트렌드_영향_근거": f"AI 분석 실패: {e}",
-                "종합점수": 5,
-                "종합점수_계산방식": "오류로 인한 기본값",
-                "주된영향분야": [], 
-                "예상영향방향": "중립적", 
-                "영향시기": "단기",
-                "분석근거": f"AI 분석 실패: {e}", 
-                "예상시장반응": ""
-            }
+            logger.error("❌ AI 분석 실패: %s", e)
+            return self._default_relevance_result(e)
+    
+    async def _analyze_stock_market_relevance_many(self, issues: List[Dict],
+                                                   llm: Optional[ChatOpenAI] = None) -> List[Dict]:
+        """여러 이슈를 단건 프롬프트로 동시에 분석 (Runnable.abatch, 실패한 이슈는 기본값)"""
+        llm = llm or self.llm
+        _, chain = self._get_relevance_chains(llm)
+        
+        results = await chain.abatch(
+            [{"title": issue.get("제목", ""), "content": issue.get("내용", "")} for issue in issues],
+            config={"max_concurrency": RELEVANCE_MAX_CONCURRENCY},
+            return_exceptions=True
+        )
+        
+        normalized = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("❌ AI 분석 실패: %s", result)
+                normalized.append(self._default_relevance_result(result))
+            else:
+                normalized.append(self._normalize_relevance_result(result))
+        return normalized
+    
+    def _default_relevance_result(self, e: Exception) -> Dict:
+        """AI 분석 실패 시 중립 점수(5점)로 채운 관련성 분석 결과"""
+        return {
+            "직접적_기업영향": 5,
+            "직접적_기업영향_근거": f"AI 분석 실패: {e}",
+            "정책적_영향": 5,
+            "정책적_영향_근거": f"AI 분석 실패: {e}",
+            "시장_심리_영향": 5,
+            "시장_심리_영향_근거": f"AI 분석 실패: {e}",
+            "거시경제_영향": 5,
+            "거시경제_영향_근거": f"AI 분석 실패: {e}",
+            "산업_트렌드_영향": 5,
+            "산업_트렌드_영향_근거": f"AI 분석 실패: {e}",
+            "종합점수": 5,
+            "종합점수_계산방식": "오류로 인한 기본값",
+            "주된영향분야": [],
+            "예상영향방향": "중립적",
+            "영향시기": "단기",
+            "분석근거": f"AI 분석 실패: {e}",
+            "예상시장반응": ""
+        }
+    
+    def _normalize_relevance_result(self, result: Dict) -> Dict:
+        """LLM 응답을 표준 관련성 분석 구조로 변환 (누락 항목은 기본값)"""
+        # 🔥 수정된 반환 데이터 - 근거 포함
+        return {
+            "직접적_기업영향": result.get("직접적_기업영향", 5),
+            "직접적_기업영향_근거": result.get("직접적_기업영향_근거", "분석 근거 미제공"),
+            "정책적_영향": result.get("정책적_영향", 5),
+            "정책적_영향_근거": result.get("정책적_영향_근거", "분석 근거 미제공"),
+            "시장_심리_영향": result.get("시장_심리_영향", 5),
+            "시장_심리_영향_근거": result.get("시장_심리_영향_근거", "분석 근거 미제공"),
+            "거시경제_영향": result.get("거시경제_영향", 5),
+            "거시경제_영향_근거": result.get("거시경제_영향_근거", "분석 근거 미제공"),
+            "산업_트렌드_영향": result.get("산업_트렌드_영향", 5),
+            "산업_트렌드_영향_근거": result.get("산업_트렌드_영향_근거", "분석 근거 미제공"),
+            "종합점수": result.get("종합점수", 5),
+            "종합점수_계산방식": result.get("종합점수_계산방식", "AI 자체 계산"),
+            "주된영향분야": result.get("주된영향분야", []),
+            "예상영향방향": result.get("예상영향방향", "중립적"),
+            "영향시기": result.get("영향시기", "단기"),
+            "분석근거": result.get("분석근거", "AI 분석 완료"),
+            "예상시장반응": result.get("예상시장반응", "")
+        }
 
     def _save_filtering_result(self, result: Dict):
         """필터링 결과 저장"""
@@ -239,7 +456,8 @@ class CrawlingService:
             }
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        # orjson은 UTF-8 bytes를 바로 만들어 주므로 큰 버퍼의 바이너리 모드로 한 번에 기록 (한글 이스케이프 없음)
+        with open(filepath, 'wb', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(save_data, option=RESULT_JSON_OPTIONS))
         
-        print(f"💾 필터링 결과 저장 (근거 포함): {filepath}")
\ No newline at end of file
+        logger.info("💾 필터링 결과 저장 (근거 포함): %s", filepath)
\ No newline at end of file
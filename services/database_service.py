@@ -3,61 +3,124 @@ MySQL 데이터베이스 서비스 - 간단한 버전
 백그라운드 파이프라인 결과 저장 + API 조회용
 """
 
-import mysql.connector
-from mysql.connector import Error
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+import aiomysql
+import orjson
+from aiomysql import Error
 from typing import List, Dict, Optional
-import json
 from datetime import datetime
-from config import DATABASE_CONFIG
+from config import DATABASE_CONFIG, DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE
+
+# 헬스체크가 항상 커넥션을 얻을 수 있도록 일반 쿼리에서 비워 두는 풀 슬롯 수
+HEALTH_CHECK_RESERVED_CONNECTIONS = 2
+
+# 관련 산업/과거 이슈 INSERT (executemany 시 aiomysql이 다중 VALUES 한 문장으로 묶어 전송)
+INSERT_RELATED_INDUSTRY_SQL = """
+INSERT INTO related_industries 
+(news_issue_id, industry_name, final_score, ai_reason)
+VALUES (%s, %s, %s, %s)
+"""
+
+INSERT_RELATED_PAST_ISSUE_SQL = """
+INSERT INTO related_past_issues 
+(news_issue_id, issue_name, final_score, period, ai_reason)
+VALUES (%s, %s, %s, %s, %s)
+"""
+
+# 조회 쿼리의 ORDER BY (+ LIMIT)를 정렬 없이 인덱스 순서대로 읽기 위한 보조 인덱스 (인덱스명, 테이블, 컬럼)
+# MySQL은 CREATE INDEX IF NOT EXISTS를 지원하지 않아 이미 있으면(1061) 건너뜀
+TABLE_INDEXES = [
+    ("idx_pipeline_logs_created_at", "pipeline_logs", "created_at"),
+    ("idx_news_issues_ranking", "news_issues", "ranking"),
+    ("idx_related_industries_issue_score", "related_industries", "news_issue_id, final_score DESC"),
+    ("idx_related_past_issues_issue_score", "related_past_issues", "news_issue_id, final_score DESC"),
+]
+DUPLICATE_KEY_NAME_ERROR = 1061
+
+# executemany 한 번에 묶을 행 수 (ai_reason 같은 긴 텍스트로 문장이 max_allowed_packet을 넘지 않도록 제한)
+BULK_INSERT_BATCH = 50
+
+def _build_pool_kwargs() -> Dict:
+    """DATABASE_CONFIG를 aiomysql 인자 형식으로 변환 (database -> db)"""
+    kwargs = dict(DATABASE_CONFIG)
+    kwargs["db"] = kwargs.pop("database")
+    return kwargs
 
 class DatabaseService:
-    """MySQL 기반 데이터베이스 서비스"""
+    """MySQL 기반 데이터베이스 서비스 (aiomysql 비동기 커넥션 풀)"""
     
-    def __init__(self):
-        self.connection = None
+    def __init__(self, minsize: int = DATABASE_POOL_MIN_SIZE, maxsize: int = DATABASE_POOL_MAX_SIZE):
+        self.pool = None
+        self.minsize = minsize
+        self.maxsize = maxsize
+        # 일반 쿼리 동시 실행 상한 (풀 슬롯 2개는 헬스체크용으로 남겨 둠)
+        self._query_semaphore = asyncio.Semaphore(max(1, maxsize - HEALTH_CHECK_RESERVED_CONNECTIONS))
         self._initialized = False
     
-    def initialize(self):
-        """MySQL 연결 초기화"""
+    async def initialize(self):
+        """MySQL 커넥션 풀 초기화 (풀을 만든 이벤트 루프에서만 사용 가능)"""
+        if self._initialized:
+            return
+        
         try:
-            self.connection = mysql.connector.connect(**DATABASE_CONFIG)
-            if self.connection.is_connected():
-                self._initialized = True
-                print(f"✅ MySQL 연결 성공 (포트: {DATABASE_CONFIG['port']})")
-                self._create_tables()
+            self.pool = await aiomysql.create_pool(
+                minsize=self.minsize,
+                maxsize=self.maxsize,
+                **_build_pool_kwargs()
+            )
+            self._initialized = True
+            print(f"✅ MySQL 커넥션 풀 생성 성공 (포트: {DATABASE_CONFIG['port']}, 크기: {self.minsize}~{self.maxsize})")
+            await self._create_tables()
         except Error as e:
             print(f"❌ MySQL 연결 실패: {e}")
-            self._initialized = False
+            await self.close()
+    
+    async def close(self):
+        """커넥션 풀 종료"""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            print("✅ MySQL 커넥션 풀 종료")
+        self.pool = None
+        self._initialized = False
     
     def is_initialized(self) -> bool:
         """연결 상태 확인"""
-        try:
-            return (self._initialized and 
-                   self.connection and 
-                   self.connection.is_connected())
-        except:
-            return False
+        return self._initialized and self.pool is not None
+    
+    @asynccontextmanager
+    async def _acquire(self):
+        """세마포어로 동시 사용량을 제한하며 풀에서 커넥션 대여 (풀 고갈 방지)"""
+        async with self._query_semaphore:
+            async with self.pool.acquire() as connection:
+                yield connection
     
     async def test_connection(self):
         """연결 테스트"""
         if not self.is_initialized():
             raise Exception("데이터베이스가 연결되지 않았습니다.")
         
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            return True
-        finally:
-            cursor.close()
+        # 헬스체크는 세마포어를 거치지 않음 (예약된 풀 슬롯 사용)
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT 1")
+                await cursor.fetchone()
+                return True
     
-    def _create_tables(self):
+    async def _create_tables(self):
         """필요한 테이블 생성"""
-        cursor = self.connection.cursor()
-        
+        async with self._acquire() as connection:
+            async with connection.cursor() as cursor:
+                await self._create_tables_with_cursor(cursor)
+    
+    async def _create_tables_with_cursor(self, cursor):
+        """필요한 테이블 생성 (커서 단위)"""
         try:
             # 뉴스 이슈 테이블
-            cursor.execute("""
+            await cursor.execute("""
             CREATE TABLE IF NOT EXISTS news_issues (
                 id INT PRIMARY KEY AUTO_INCREMENT,
                 issue_number INT,
@@ -74,7 +137,7 @@ class DatabaseService:
             """)
             
             # 관련 산업 테이블
-            cursor.execute("""
+            await cursor.execute("""
             CREATE TABLE IF NOT EXISTS related_industries (
                 id INT PRIMARY KEY AUTO_INCREMENT,
                 news_issue_id INT NOT NULL,
@@ -86,7 +149,7 @@ class DatabaseService:
             """)
             
             # 관련 과거 이슈 테이블
-            cursor.execute("""
+            await cursor.execute("""
             CREATE TABLE IF NOT EXISTS related_past_issues (
                 id INT PRIMARY KEY AUTO_INCREMENT,
                 news_issue_id INT NOT NULL,
@@ -99,7 +162,7 @@ class DatabaseService:
             """)
             
             # 파이프라인 로그 테이블
-            cursor.execute("""
+            await cursor.execute("""
             CREATE TABLE IF NOT EXISTS pipeline_logs (
                 id INT PRIMARY KEY AUTO_INCREMENT,
                 pipeline_id VARCHAR(50),
@@ -112,14 +175,19 @@ class DatabaseService:
             ) ENGINE=InnoDB CHARSET=utf8mb4
             """)
             
-            self.connection.commit()
+            # 조회용 인덱스 (기존 테이블에도 적용되도록 CREATE TABLE과 별도로 생성)
+            for index_name, table, columns in TABLE_INDEXES:
+                try:
+                    await cursor.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+                except Error as e:
+                    if not e.args or e.args[0] != DUPLICATE_KEY_NAME_ERROR:
+                        raise
+            
             print("✅ MySQL 테이블 생성 완료")
             
         except Error as e:
             print(f"❌ 테이블 생성 실패: {e}")
             raise
-        finally:
-            cursor.close()
     
     # ========================================================================
     # 파이프라인 결과 저장
@@ -130,47 +198,57 @@ class DatabaseService:
         if not self.is_initialized():
             raise Exception("데이터베이스가 연결되지 않았습니다.")
         
-        cursor = self.connection.cursor()
-        
-        try:
-            print("💾 MySQL에 파이프라인 결과 저장 중...")
-            
-            # 기존 데이터 삭제 (최신 상태 유지)
-            cursor.execute("DELETE FROM related_past_issues")
-            cursor.execute("DELETE FROM related_industries")
-            cursor.execute("DELETE FROM news_issues")
-            
-            # API 데이터 추출
-            api_data = result.get("api_ready_data", {})
-            selected_issues = api_data.get("data", {}).get("selected_issues", [])
-            
-            # 새 뉴스 이슈들 저장
-            for issue_data in selected_issues:
-                # 1. 뉴스 이슈 저장
-                issue_id = self._save_news_issue(cursor, issue_data)
-                
-                # 2. 관련 산업 저장
-                for industry in issue_data.get("관련산업", []):
-                    self._save_related_industry(cursor, issue_id, industry)
-                
-                # 3. 관련 과거 이슈 저장
-                for past_issue in issue_data.get("관련과거이슈", []):
-                    self._save_related_past_issue(cursor, issue_id, past_issue)
-            
-            # 파이프라인 로그 저장
-            self._save_pipeline_log(cursor, result, api_data)
-            
-            self.connection.commit()
-            print(f"✅ MySQL 저장 완료: {len(selected_issues)}개 이슈")
-            
-        except Error as e:
-            self.connection.rollback()
-            print(f"❌ MySQL 저장 실패: {e}")
-            raise
-        finally:
-            cursor.close()
+        async with self._acquire() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    print("💾 MySQL에 파이프라인 결과 저장 중...")
+                    
+                    # 삭제 + 저장을 하나의 트랜잭션으로 처리 (autocommit 풀에서도 원자성 유지)
+                    await connection.begin()
+                    
+                    # 기존 데이터 삭제 (최신 상태 유지)
+                    await cursor.execute("DELETE FROM related_past_issues")
+                    await cursor.execute("DELETE FROM related_industries")
+                    await cursor.execute("DELETE FROM news_issues")
+                    
+                    # API 데이터 추출
+                    api_data = result.get("api_ready_data", {})
+                    selected_issues = api_data.get("data", {}).get("selected_issues", [])
+                    
+                    # 새 뉴스 이슈들 저장 (관련 행은 튜플로 모아 두었다가 테이블별로 한 번에 INSERT)
+                    industry_rows = []
+                    past_issue_rows = []
+                    for issue_data in selected_issues:
+                        # 1. 뉴스 이슈 저장 (하위 행이 참조할 id가 필요하므로 이슈별 INSERT)
+                        issue_id = await self._save_news_issue(cursor, issue_data)
+                        
+                        # 2. 관련 산업 행 준비
+                        industry_rows.extend(
+                            self._related_industry_row(issue_id, industry)
+                            for industry in issue_data.get("관련산업", [])
+                        )
+                        
+                        # 3. 관련 과거 이슈 행 준비
+                        past_issue_rows.extend(
+                            self._related_past_issue_row(issue_id, past_issue)
+                            for past_issue in issue_data.get("관련과거이슈", [])
+                        )
+                    
+                    await self._executemany_in_batches(cursor, INSERT_RELATED_INDUSTRY_SQL, industry_rows)
+                    await self._executemany_in_batches(cursor, INSERT_RELATED_PAST_ISSUE_SQL, past_issue_rows)
+                    
+                    # 파이프라인 로그 저장
+                    await self._save_pipeline_log(cursor, result, api_data)
+                    
+                    await connection.commit()
+                    print(f"✅ MySQL 저장 완료: {len(selected_issues)}개 이슈")
+                    
+                except Error as e:
+                    await connection.rollback()
+                    print(f"❌ MySQL 저장 실패: {e}")
+                    raise
     
-    def _save_news_issue(self, cursor, issue_data: Dict) -> int:
+    async def _save_news_issue(self, cursor, issue_data: Dict) -> int:
         """뉴스 이슈 저장"""
         query = """
         INSERT INTO news_issues 
@@ -198,45 +276,37 @@ class DatabaseService:
             float(issue_data.get("RAG분석신뢰도", 0))
         )
         
-        cursor.execute(query, values)
+        await cursor.execute(query, values)
         return cursor.lastrowid
     
-    def _save_related_industry(self, cursor, news_issue_id: int, industry: Dict):
-        """관련 산업 저장"""
-        query = """
-        INSERT INTO related_industries 
-        (news_issue_id, industry_name, final_score, ai_reason)
-        VALUES (%s, %s, %s, %s)
-        """
-        
-        values = (
+    @staticmethod
+    async def _executemany_in_batches(cursor, query: str, rows: List[tuple]):
+        """BULK_INSERT_BATCH행씩 나누어 executemany 실행 (같은 트랜잭션 안에서 호출)"""
+        for start in range(0, len(rows), BULK_INSERT_BATCH):
+            await cursor.executemany(query, rows[start:start + BULK_INSERT_BATCH])
+    
+    @staticmethod
+    def _related_industry_row(news_issue_id: int, industry: Dict) -> tuple:
+        """관련 산업 INSERT 파라미터"""
+        return (
             news_issue_id,
             industry.get("name", "")[:200],
             float(industry.get("final_score", 0)),
             industry.get("ai_reason", "")
         )
-        
-        cursor.execute(query, values)
     
-    def _save_related_past_issue(self, cursor, news_issue_id: int, past_issue: Dict):
-        """관련 과거 이슈 저장"""
-        query = """
-        INSERT INTO related_past_issues 
-        (news_issue_id, issue_name, final_score, period, ai_reason)
-        VALUES (%s, %s, %s, %s, %s)
-        """
-        
-        values = (
+    @staticmethod
+    def _related_past_issue_row(news_issue_id: int, past_issue: Dict) -> tuple:
+        """관련 과거 이슈 INSERT 파라미터"""
+        return (
             news_issue_id,
             past_issue.get("name", "")[:200],
             float(past_issue.get("final_score", 0)),
             past_issue.get("period", ""),
             past_issue.get("ai_reason", "")
         )
-        
-        cursor.execute(query, values)
     
-    def _save_pipeline_log(self, cursor, result: Dict, api_data: Dict):
+    async def _save_pipeline_log(self, cursor, result: Dict, api_data: Dict):
         """파이프라인 로그 저장"""
         query = """
         INSERT INTO pipeline_logs 
@@ -261,48 +331,60 @@ class DatabaseService:
             api_data.get("data", {}).get("selected_count", 0)
         )
         
-        cursor.execute(query, values)
+        await cursor.execute(query, values)
     
     # ========================================================================
     # 데이터 조회 (API용)
     # ========================================================================
     
-    async def get_latest_news_issues(self) -> List[Dict]:
-        """최신 뉴스 이슈들 조회"""
+    async def _fetch_all(self, query: str, params: tuple = ()) -> List[Dict]:
+        """풀에서 커넥션을 따로 빌려 쿼리 하나 실행 (동시 실행용)"""
+        async with self._acquire() as connection:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params)
+                return list(await cursor.fetchall())
+    
+    async def get_latest_news_issues(self, raise_errors: bool = False) -> List[Dict]:
+        """최신 뉴스 이슈들 조회 (이슈 / 관련 산업 / 관련 과거 이슈 3개 쿼리를 동시에 실행)
+        raise_errors=True면 DB 오류를 빈 목록 대신 그대로 전달 (캐시 fallback을 쓰는 API용)"""
         if not self.is_initialized():
             return []
         
-        cursor = self.connection.cursor(dictionary=True)
-        
         try:
-            # 뉴스 이슈 조회
-            cursor.execute("""
-            SELECT * FROM news_issues 
-            ORDER BY ranking ASC
-            """)
-            news_issues = cursor.fetchall()
-            
-            # 각 이슈에 관련 정보 추가
-            for issue in news_issues:
-                issue_id = issue['id']
-                
-                # 관련 산업 조회
-                cursor.execute("""
-                SELECT industry_name, final_score, ai_reason
+            # 이슈별 N+1 조회 대신 테이블 단위로 한 번씩만 조회
+            news_issues, industries, past_issues = await asyncio.gather(
+                self._fetch_all("""
+                SELECT * FROM news_issues 
+                ORDER BY ranking ASC
+                """),
+                self._fetch_all("""
+                SELECT news_issue_id, industry_name, final_score, ai_reason
                 FROM related_industries 
-                WHERE news_issue_id = %s 
+                WHERE news_issue_id IN (SELECT id FROM news_issues)
                 ORDER BY final_score DESC
-                """, (issue_id,))
-                issue['related_industries'] = cursor.fetchall()
-                
-                # 관련 과거 이슈 조회
-                cursor.execute("""
-                SELECT issue_name, final_score, period, ai_reason
+                """),
+                self._fetch_all("""
+                SELECT news_issue_id, issue_name, final_score, period, ai_reason
                 FROM related_past_issues 
-                WHERE news_issue_id = %s 
+                WHERE news_issue_id IN (SELECT id FROM news_issues)
                 ORDER BY final_score DESC
-                """, (issue_id,))
-                issue['related_past_issues'] = cursor.fetchall()
+                """)
+            )
+            
+            # 이슈 id 기준으로 관련 정보 묶기 (점수 내림차순 유지)
+            industries_by_issue = defaultdict(list)
+            for industry in industries:
+                industries_by_issue[industry.pop('news_issue_id')].append(industry)
+            
+            past_issues_by_issue = defaultdict(list)
+            for past_issue in past_issues:
+                past_issues_by_issue[past_issue.pop('news_issue_id')].append(past_issue)
+            
+            # 각 이슈에 관련 정보 추가
+            for issue in news_issues:
+                issue_id = issue['id']
+                issue['related_industries'] = industries_by_issue.get(issue_id, [])
+                issue['related_past_issues'] = past_issues_by_issue.get(issue_id, [])
                 
                 # 날짜 형식 변환
                 if issue.get('extracted_at'):
@@ -314,61 +396,68 @@ class DatabaseService:
             
         except Error as e:
             print(f"❌ 뉴스 조회 실패: {e}")
+            if raise_errors:
+                raise
             return []
-        finally:
-            cursor.close()
     
     async def get_issue_with_relations(self, issue_id: int) -> Optional[Dict]:
-        """특정 이슈 상세 조회"""
+        """특정 이슈 상세 조회 (관련 산업/과거 이슈를 JSON_ARRAYAGG로 묶어 1회 왕복)"""
         if not self.is_initialized():
             return None
         
-        cursor = self.connection.cursor(dictionary=True)
-        
         try:
-            # 뉴스 이슈 기본 정보
-            cursor.execute("SELECT * FROM news_issues WHERE id = %s", (issue_id,))
-            issue = cursor.fetchone()
+            async with self._acquire() as connection:
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute("""
+                    SELECT i.*,
+                        (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                                'industry_name', ri.industry_name,
+                                'final_score', ri.final_score,
+                                'ai_reason', ri.ai_reason))
+                         FROM related_industries ri
+                         WHERE ri.news_issue_id = i.id) AS related_industries_json,
+                        (SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                                'issue_name', rp.issue_name,
+                                'final_score', rp.final_score,
+                                'period', rp.period,
+                                'ai_reason', rp.ai_reason))
+                         FROM related_past_issues rp
+                         WHERE rp.news_issue_id = i.id) AS related_past_issues_json
+                    FROM news_issues i
+                    WHERE i.id = %s
+                    """, (issue_id,))
+                    issue = await cursor.fetchone()
             
             if not issue:
                 return None
             
-            # 관련 산업
-            cursor.execute("""
-            SELECT industry_name, final_score, ai_reason
-            FROM related_industries WHERE news_issue_id = %s
-            """, (issue_id,))
-            issue['related_industries'] = cursor.fetchall()
-            
-            # 관련 과거 이슈
-            cursor.execute("""
-            SELECT issue_name, final_score, period, ai_reason
-            FROM related_past_issues WHERE news_issue_id = %s
-            """, (issue_id,))
-            issue['related_past_issues'] = cursor.fetchall()
+            # JSON 문자열 컬럼을 리스트로 변환 (관련 항목이 없으면 NULL)
+            industries_json = issue.pop('related_industries_json')
+            past_issues_json = issue.pop('related_past_issues_json')
+            issue['related_industries'] = orjson.loads(industries_json) if industries_json else []
+            issue['related_past_issues'] = orjson.loads(past_issues_json) if past_issues_json else []
             
             return issue
             
         except Error as e:
             print(f"❌ 이슈 상세 조회 실패: {e}")
             return None
-        finally:
-            cursor.close()
     
-    async def get_latest_pipeline_log(self) -> Optional[Dict]:
-        """최근 파이프라인 로그 조회"""
+    async def get_latest_pipeline_log(self, raise_errors: bool = False) -> Optional[Dict]:
+        """최근 파이프라인 로그 조회
+        raise_errors=True면 DB 오류를 None 대신 그대로 전달 (캐시 fallback을 쓰는 API용)"""
         if not self.is_initialized():
             return None
         
-        cursor = self.connection.cursor(dictionary=True)
-        
         try:
-            cursor.execute("""
-            SELECT * FROM pipeline_logs 
-            ORDER BY created_at DESC 
-            LIMIT 1
-            """)
-            result = cursor.fetchone()
+            async with self._acquire() as connection:
+                async with connection.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute("""
+                    SELECT * FROM pipeline_logs 
+                    ORDER BY created_at DESC 
+                    LIMIT 1
+                    """)
+                    result = await cursor.fetchone()
             
             if result:
                 # 날짜 형식 변환
@@ -380,15 +469,23 @@ class DatabaseService:
             
         except Error as e:
             print(f"❌ 파이프라인 로그 조회 실패: {e}")
+            if raise_errors:
+                raise
             return None
-        finally:
-            cursor.close()
 
-# 전역 인스턴스
+# 전역 인스턴스 (프로세스 전체에서 하나의 커넥션 풀을 공유)
 _database_service = None
+_database_service_lock = threading.Lock()
 
 def get_database_service() -> DatabaseService:
+    """DatabaseService 싱글톤 반환"""
     global _database_service
     if _database_service is None:
-        _database_service = DatabaseService()
-    return _database_service
\ No newline at end of file
+        with _database_service_lock:
+            if _database_service is None:
+                _database_service = DatabaseService()
+    return _database_service
+
+def get_db() -> DatabaseService:
+    """FastAPI Depends용 DB 서비스 주입 함수 (요청마다 새로 만들지 않음)"""
+    return get_database_service()
@@ -4,13 +4,16 @@ integrated_pipeline.py의 IntegratedNewsPipeline 로직 이관 (수정 사항 
 완전 안전 버전 - 다양한 데이터 구조 처리
 """
 
-import json
+import asyncio
+import orjson
 import traceback  # 오류 추적을 위해 추가
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
+from .crawling_bigkinds import RESULT_JSON_OPTIONS, RESULT_WRITE_BUFFER_SIZE
 from .crawling_service import CrawlingService
 from .rag_service import RAGService
+from .result_files import find_latest_result_file, load_result_file
 
 class PipelineService:
     """전체 파이프라인 통합 서비스"""
@@ -25,13 +28,14 @@ class PipelineService:
         
         print("✅ 파이프라인 서비스 초기화 완료")
     
-    def execute_full_pipeline(self, 
+    async def execute_full_pipeline(self, 
                                 issues_per_category: int = 10,
                                 target_filtered_count: int = 5) -> Dict:
         """전체 파이프라인 실행: 크롤링 → 필터링 → RAG 분석 (오류 처리 강화)"""
         
-        pipeline_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 시작 시각은 한 번만 읽어 pipeline_id와 started_at에 함께 사용
         started_at = datetime.now()
+        pipeline_id = started_at.strftime("%Y%m%d_%H%M%S")
         
         print(f"🚀 파이프라인 실행 시작 (ID: {pipeline_id})")
         print(f"📋 설정: 카테고리별 {issues_per_category}개, 최종 선별 {target_filtered_count}개")
@@ -52,7 +56,7 @@ class PipelineService:
             print(f"📡 Step 1: 크롤링 + 주식시장 필터링")
             print(f"{'='*60}")
             
-            crawling_result = self.crawling_service.crawl_and_filter_news(
+            crawling_result = await self.crawling_service.crawl_and_filter_news(
                 issues_per_category, target_filtered_count
             )
             
@@ -86,6 +90,7 @@ class PipelineService:
                 else:
                     # 문자열 배열 → 딕셔너리 배열 변환: ["텍스트1", "텍스트2", ...]
                     print("⚙️ 문자열 배열을 딕셔너리 배열로 변환...")
+                    extracted_at = datetime.now().isoformat()
                     filtered_issues = []
                     for i, text in enumerate(raw_filtered):
                         filtered_issues.append({
@@ -94,7 +99,7 @@ class PipelineService:
                             "내용": str(text),
                             "원본내용": str(text),
                             "카테고리": "자동변환",
-                            "추출시간": datetime.now().isoformat(),
+                            "추출시간": extracted_at,
                             "주식시장_관련성_점수": 5.0,
                             "rank": i + 1
                         })
@@ -107,7 +112,7 @@ class PipelineService:
             
             # RAG 분석 실행
             print(f"🔍 RAG 분석 시작 - {len(filtered_issues)}개 이슈 처리...")
-            enriched_issues = self.rag_service.analyze_issues_with_rag(filtered_issues)
+            enriched_issues = await self.rag_service.analyze_issues_with_rag(filtered_issues)
             print(f"✅ RAG 분석 완료 - {len(enriched_issues)}개 이슈 처리됨")
             
             # 🔥 [수정] 안전한 평균 신뢰도 계산
@@ -129,7 +134,7 @@ class PipelineService:
             print(f"🌐 Step 3: API 응답 데이터 준비")
             print(f"{'='*60}")
             
-            api_data = self._prepare_api_data(crawling_result, enriched_issues)
+            api_data = self._prepare_api_data(crawling_result, enriched_issues, average_confidence)
             result["api_ready_data"] = api_data
             result["steps_completed"].append("api_preparation")
             
@@ -154,7 +159,7 @@ class PipelineService:
             })
             
             # 결과 저장
-            saved_file = self._save_pipeline_result(result, enriched_issues)
+            saved_file = self._save_pipeline_result(result, enriched_issues, average_confidence, completed_at)
             result["saved_file"] = saved_file
             
             print(f"\n🎉 파이프라인 실행 완료!")
@@ -181,8 +186,9 @@ class PipelineService:
             # 에러를 발생시켜 상위 호출자에게 전파
             raise Exception(error_msg)
 
-    def _prepare_api_data(self, crawling_result: Dict, enriched_issues: List[Dict]) -> Dict:
-        """API 응답용 데이터 구성"""
+    def _prepare_api_data(self, crawling_result: Dict, enriched_issues: List[Dict],
+                          average_confidence: float) -> Dict:
+        """API 응답용 데이터 구성 (평균 신뢰도는 호출자가 한 번 계산한 값 재사용)"""
         
         api_data = {
             "success": True,
@@ -199,7 +205,7 @@ class PipelineService:
                 "rag_analysis_applied": True,
                 "filter_model": "gpt-4o-mini",
                 "rag_model": "gpt-4o-mini",
-                "rag_confidence": self._calculate_average_confidence(enriched_issues)
+                "rag_confidence": average_confidence
             }
         }
         
@@ -233,7 +239,9 @@ class PipelineService:
         if not enriched_issues:
             return 0.0
         
-        confidences = []
+        # 중간 리스트 없이 한 번 순회하며 합계/개수만 누적
+        total = 0.0
+        count = 0
         
         for issue in enriched_issues:
             rag_confidence = issue.get("RAG분석신뢰도")
@@ -244,34 +252,36 @@ class PipelineService:
             # 🔥 오류 수정: 딕셔너리와 숫자 타입 모두 처리
             if isinstance(rag_confidence, dict):
                 # 새로운 다차원 신뢰도 구조
-                consistency_score = rag_confidence.get("consistency_score", 0)
-                confidences.append(float(consistency_score))
+                total += float(rag_confidence.get("consistency_score", 0))
             elif isinstance(rag_confidence, (int, float)):
                 # 기존 단일 숫자 구조
-                confidences.append(float(rag_confidence))
+                total += float(rag_confidence)
             else:
                 # 예상치 못한 타입은 건너뛰기
                 print(f"⚠️ 예상치 못한 RAG 신뢰도 타입: {type(rag_confidence)}, 값: {rag_confidence}")
                 continue
+            count += 1
         
-        if not confidences:
+        if not count:
             return 0.0
             
-        return round(sum(confidences) / len(confidences), 2)
+        return round(total / count, 2)
 
-    def _save_pipeline_result(self, result: Dict, enriched_issues: List[Dict]) -> str:
-        """파이프라인 실행 결과 저장 (향상된 버전)"""
+    def _save_pipeline_result(self, result: Dict, enriched_issues: List[Dict],
+                              average_confidence: float, saved_at: datetime) -> str:
+        """파이프라인 실행 결과 저장 (향상된 버전, 저장 시각은 호출자가 넘긴 완료 시각 사용)"""
         try:
-            timestamp = datetime.now().strftime("%Y.%m.%d_%H.%M.%S")
+            timestamp = saved_at.strftime("%Y.%m.%d_%H.%M.%S")
+            saved_at_iso = saved_at.isoformat()
             filename = f"{timestamp}_Pipeline_Results.json"
             filepath = self.data_dir / filename
             
             # 🔥 향상된 저장 데이터 구조
             save_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": saved_at_iso,
                 "total_issues": len(enriched_issues),
                 "selected_issues": enriched_issues,  # 핵심: enriched_issues 직접 저장
-                "average_confidence": self._calculate_average_confidence(enriched_issues),
+                "average_confidence": average_confidence,
                 "processing_time": result.get("execution_time", ""),
                 "pipeline_metadata": {
                     "pipeline_id": result.get("pipeline_id", ""),
@@ -281,13 +291,14 @@ class PipelineService:
                 },
                 "file_info": {
                     "filename": filename,
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": saved_at_iso,
                     "format_version": "2.0"
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # orjson은 UTF-8 bytes를 바로 만들어 주므로 바이너리 모드로 한 번에 기록 (한글 이스케이프 없음)
+            with open(filepath, 'wb', buffering=RESULT_WRITE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(save_data, option=RESULT_JSON_OPTIONS))
             
             print(f"💾 파이프라인 결과 저장: {filepath}")
             return str(filepath)
@@ -298,29 +309,26 @@ class PipelineService:
             traceback.print_exc()
             return ""
 
-    def get_latest_analyzed_issues(self) -> List[Dict]:
+    async def get_latest_analyzed_issues(self) -> List[Dict]:
         """최신 분석된 이슈들 조회 (API용) - 향상된 버전"""
         try:
-            # 1. MySQL에서 먼저 조회 시도
+            # 1. MySQL에서 먼저 조회 시도 (앱 전역 커넥션 풀 재사용)
             try:
-                from .database_service import DatabaseService
-                db_service = DatabaseService()
+                from .database_service import get_database_service
+                db_service = get_database_service()
                 
                 if db_service.is_initialized():
-                    mysql_data = db_service.get_latest_news_issues()
+                    mysql_data = await db_service.get_latest_news_issues()
                     if mysql_data:
                         print(f"📊 MySQL에서 {len(mysql_data)}개 이슈 조회")
                         return mysql_data
             except Exception as db_error:
                 print(f"⚠️ MySQL 조회 실패: {db_error}")
             
-            # 2. MySQL에 데이터가 없으면 최신 파일에서 조회
-            pipeline_files = list(self.data_dir.glob("*_Pipeline_Results.json"))
-            if pipeline_files:
-                latest_file = max(pipeline_files, key=lambda f: f.stat().st_mtime)
-                
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            # 2. MySQL에 데이터가 없으면 최신 파일에서 조회 (scandir 한 번으로 탐색, 파싱 결과는 캐시되므로 읽기 전용)
+            latest_file = await asyncio.to_thread(find_latest_result_file, self.data_dir)
+            if latest_file is not None:
+                data = await asyncio.to_thread(load_result_file, latest_file)
                 
                 # 🔥 다양한 파일 구조 처리
                 issues = []
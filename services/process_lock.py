@@ -0,0 +1,76 @@
+"""
+프로세스 간 파일 락
+uvicorn 워커는 각각 별도 프로세스이므로 스레드 락으로는 서로를 막지 못함
+data2/ 의 락 파일에 OS 파일 락(fcntl/msvcrt)을 걸어 스케줄러 선출과 파이프라인 실행을 워커 전체에서 직렬화
+(프로세스가 죽으면 OS가 락을 자동으로 해제)
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import IO, Optional
+
+def _lock(lock_file: IO):
+    """열린 락 파일에 non-blocking 배타 락 (이미 잠겨 있으면 OSError)"""
+    if sys.platform == "win32":
+        import msvcrt
+        # 핸들마다 같은 영역(첫 1바이트)을 잠가야 서로 충돌함
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+def acquire_file_lock(path) -> Optional[IO]:
+    """락 획득 시 열린 파일 핸들 반환 (다른 프로세스/핸들이 잡고 있으면 None)
+    핸들을 닫거나 release_file_lock을 호출할 때까지 락이 유지됨"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(path, "a+")
+    try:
+        _lock(lock_file)
+    except OSError:
+        lock_file.close()
+        return None
+
+    # 잠긴 동안에는 보유 프로세스 pid를 기록 (is_file_locked가 락을 건드리지 않고 확인하는 용도)
+    lock_file.truncate(0)
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    return lock_file
+
+def release_file_lock(lock_file: IO):
+    """기록한 pid를 지우고 락 해제"""
+    try:
+        lock_file.truncate(0)
+        lock_file.flush()
+        if sys.platform == "win32":
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+    finally:
+        lock_file.close()
+
+def is_file_locked(path) -> bool:
+    """다른 실행이 락을 잡고 있는지 확인 (상태 조회용)
+    평소에는 파일 내용만 읽어 판단하므로 조회가 실제 락 획득과 경합하지 않음"""
+    try:
+        with open(path, "r") as f:
+            holder = f.read().strip()
+    except FileNotFoundError:
+        return False
+    except OSError:
+        # Windows에서는 잠긴 영역을 다른 핸들로 읽을 수 없음 = 잠겨 있음
+        return True
+
+    if not holder:
+        return False
+
+    # pid가 남아 있으면 실제로 잠겨 있는지 확인 (보유 프로세스가 비정상 종료한 경우 정리)
+    lock_file = acquire_file_lock(path)
+    if lock_file is None:
+        return True
+    release_file_lock(lock_file)
+    return False
@@ -6,20 +6,82 @@ RAG 분석 서비스 - 최종 개선 버전
 - 오류 처리 강화
 """
 
+import asyncio
+import copy
+import hashlib
 import os
-import json
+import logging
+from collections import OrderedDict
+import orjson
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers import BaseOutputParser
 from pinecone import Pinecone
 
 # .env 파일에서 환경 변수 로드
 load_dotenv(override=True)
 
+# 진행 로그는 지연 포맷팅(%s)으로 남겨 레벨이 꺼져 있으면 문자열을 만들지 않음
+logger = logging.getLogger(__name__)
+
+# 동시에 RAG 분석할 이슈 수 (이슈당 임베딩 1회 + 검색/재평가/검증 LLM 호출이 함께 나감)
+RAG_MAX_CONCURRENCY = 3
+
+# 내용 해시 기준 캐시 크기 (임베딩 벡터 / 이슈별 RAG 분석 결과)
+RAG_EMBEDDING_CACHE_SIZE = 1024
+RAG_RESULT_CACHE_SIZE = 256
+
+# 실행마다 새로 여는 OpenAI 비동기 HTTP 커넥션 풀 설정 (분석/검증/임베딩 호출이 함께 공유)
+RAG_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+RAG_HTTP_TIMEOUT = httpx.Timeout(60.0)
+
+def _content_key(text: str) -> str:
+    """캐시 키용 내용 해시 (blake2b 128bit)"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+class _LRUCache:
+    """최근 사용 순서를 유지하는 크기 제한 dict (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, object]" = OrderedDict()
+
+    def get(self, key: str):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+class _OrjsonParser(BaseOutputParser):
+    """JSON 모드 LLM 응답을 orjson으로 파싱 (마크다운 코드블록 처리 없이 본문을 바로 디코딩)"""
+    
+    def parse(self, text: str):
+        return orjson.loads(text)
+    
+    @property
+    def _type(self) -> str:
+        return "orjson"
+
+class _RunClients(NamedTuple):
+    """한 번의 분석 실행(이벤트 루프)에서만 쓰는 OpenAI 클라이언트 묶음"""
+    analyzer_llm: object
+    verifier_llm: object
+    embedding: OpenAIEmbeddings
+
 class RAGService:
     """RAG 분석 서비스 (검증 및 오류 처리 강화 버전)"""
     
@@ -29,152 +91,200 @@ class RAGService:
         self.INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "ordaproject")
         self.PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
         
-        # LLM 초기화 (분석용, 검증용)
-        self.analyzer_llm = ChatOpenAI(model="gpt-4o", temperature=0)
-        self.verifier_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0) # 검증은 더 빠르고 저렴한 모델 사용
-        self.embedding = OpenAIEmbeddings(model=self.EMBEDDING_MODEL)
+        # LLM/임베딩 클라이언트는 실행마다 그 이벤트 루프에서 생성 (_build_clients 참고)
+        self._json_parser = _OrjsonParser()
         
         # Pinecone 클라이언트 초기화
         self.pc = Pinecone(api_key=self.PINECONE_API_KEY)
         self.index = self.pc.Index(self.INDEX_NAME)
         
+        # 같은 뉴스 본문의 재분석 방지용 캐시 (임베딩은 결과와 따로 보관해 프롬프트가 바뀌어도 재사용)
+        self._embedding_cache = _LRUCache(RAG_EMBEDDING_CACHE_SIZE)
+        self._result_cache = _LRUCache(RAG_RESULT_CACHE_SIZE)
+        
         # 데이터베이스 로딩
         self._load_databases()
         
-        print("✅ RAG 분석 서비스 초기화 완료 (검증 레이어 및 오류 처리 강화)")
+        logger.info("✅ RAG 분석 서비스 초기화 완료 (검증 레이어 및 오류 처리 강화)")
     
     def _load_databases(self):
         """산업 DB 및 과거 이슈 DB 로딩"""
         try:
             # 산업 DB 로딩
-            self.industry_df = pd.read_csv("data/산업DB.v.0.3.csv")
-            self.industry_dict = dict(zip(self.industry_df["KRX 업종명"], self.industry_df["상세내용"]))
-            print(f"✅ 산업 DB 로드: {len(self.industry_dict)}개 업종")
+            # 필요한 컬럼만 읽고 DataFrame은 dict를 만든 뒤 버림 (utf-8-sig: 첫 컬럼명 앞의 BOM 제거)
+            industry_df = pd.read_csv("data/산업DB.v.0.3.csv", usecols=["KRX 업종명", "상세내용"], encoding="utf-8-sig")
+            self.industry_dict = dict(zip(industry_df["KRX 업종명"], industry_df["상세내용"]))
+            logger.info("✅ 산업 DB 로드: %d개 업종", len(self.industry_dict))
             
             # 과거 이슈 DB 로딩
-            self.past_df = pd.read_csv("data/Past_news.csv")
+            past_df = pd.read_csv("data/Past_news.csv", usecols=["Issue_name", "Contents", "Contentes(Spec)"])
             self.issue_dict = dict(zip(
-                self.past_df["Issue_name"], 
-                self.past_df["Contents"] + "\n\n상세: " + self.past_df["Contentes(Spec)"]
+                past_df["Issue_name"], 
+                past_df["Contents"] + "\n\n상세: " + past_df["Contentes(Spec)"]
             ))
-            print(f"✅ 과거 이슈 DB 로드: {len(self.issue_dict)}개 이슈")
+            logger.info("✅ 과거 이슈 DB 로드: %d개 이슈", len(self.issue_dict))
             
         except Exception as e:
-            print(f"⚠️ DB 로드 실패: {e}")
+            logger.warning("⚠️ DB 로드 실패: %s", e)
             self.industry_dict = {}
             self.issue_dict = {}
 
-    def analyze_issues_with_rag(self, filtered_issues: List[Dict]) -> List[Dict]:
-        """필터링된 이슈들에 대해 RAG 분석 수행 (오류 방지 강화)"""
-        print(f"🔍 RAG 분석 시작: {len(filtered_issues)}개 이슈")
-        enriched_issues = []
+    def clear_caches(self, keep_embeddings: bool = True):
+        """RAG 분석 결과 캐시 비우기 (새 분석이 꼭 필요할 때 호출, 임베딩은 기본적으로 유지)"""
+        self._result_cache.clear()
+        if not keep_embeddings:
+            self._embedding_cache.clear()
+
+    def _build_clients(self, http_client: httpx.AsyncClient) -> _RunClients:
+        """실행용 LLM/임베딩 클라이언트 생성
+        (AsyncOpenAI 커넥션은 만들어진 이벤트 루프에 묶이므로 싱글톤에 보관하지 않고 실행마다 생성)"""
+        return _RunClients(
+            # 분석용, 검증용 - 두 체인 모두 JSON만 받으므로 JSON 모드로 고정
+            analyzer_llm=ChatOpenAI(
+                model="gpt-4o", temperature=0, http_async_client=http_client
+            ).bind(response_format={"type": "json_object"}),
+            # 검증은 더 빠르고 저렴한 모델 사용
+            verifier_llm=ChatOpenAI(
+                model="gpt-4o-mini", temperature=0, http_async_client=http_client
+            ).bind(response_format={"type": "json_object"}),
+            embedding=OpenAIEmbeddings(model=self.EMBEDDING_MODEL, http_async_client=http_client)
+        )
+
+    async def _embed_query(self, clients: _RunClients, query: str) -> List[float]:
+        """쿼리 임베딩 (내용 해시 기준 캐시)"""
+        key = _content_key(query)
+        vector = self._embedding_cache.get(key)
+        if vector is None:
+            vector = await clients.embedding.aembed_query(query)
+            self._embedding_cache.set(key, vector)
+        return vector
+
+    async def analyze_issues_with_rag(self, filtered_issues: List[Dict]) -> List[Dict]:
+        """필터링된 이슈들에 대해 RAG 분석 수행 (오류 방지 강화, 이슈들은 동시에 분석)"""
+        logger.info("🔍 RAG 분석 시작: %d개 이슈", len(filtered_issues))
+        semaphore = asyncio.Semaphore(RAG_MAX_CONCURRENCY)
+
+        # 파이프라인 실행마다 이벤트 루프가 새로 만들어지므로 HTTP 풀과 클라이언트도 이 루프에서 열고 닫음
+        async with httpx.AsyncClient(limits=RAG_HTTP_LIMITS, timeout=RAG_HTTP_TIMEOUT) as http_client:
+            clients = self._build_clients(http_client)
+
+            async def analyze(i: int, issue: Dict) -> Dict:
+                async with semaphore:
+                    return await self._analyze_single_issue(clients, i, len(filtered_issues), issue)
+
+            enriched_issues = list(await asyncio.gather(
+                *(analyze(i, issue) for i, issue in enumerate(filtered_issues, 1))
+            ))
         
-        for i, issue in enumerate(filtered_issues, 1):
-            print(f"🔄 이슈 {i}/{len(filtered_issues)} RAG 분석 중: {issue.get('제목', 'N/A')[:50]}...")
+        avg_confidence = self._calculate_average_confidence(enriched_issues)
+        logger.info("✅ RAG 분석 완료: 전체 평균 일관성 점수 %s", avg_confidence)
+        
+        return enriched_issues
+
+    async def _analyze_single_issue(self, clients: _RunClients, i: int, total: int, issue: Dict) -> Dict:
+        """이슈 하나에 대한 RAG 분석 (실패해도 기본 구조 유지)"""
+        logger.info("🔄 이슈 %d/%d RAG 분석 중: %.50s...", i, total, issue.get('제목', 'N/A'))
+        
+        try:
+            query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
+            result_key = _content_key(query)
+            cached = self._result_cache.get(result_key)
             
-            try:
-                # 관련 산업 분석
-                related_industries = self._analyze_industry_for_issue(issue)
+            if cached is not None:
+                # 같은 본문은 이전 분석 결과 재사용 (호출자가 수정해도 캐시가 변하지 않도록 복사)
+                related_industries, related_past_issues, rag_confidence = copy.deepcopy(cached)
+                logger.info("  ♻️ 이슈 %d RAG 캐시 사용", i)
+            else:
+                # 산업/과거 이슈 검색은 같은 쿼리를 쓰므로 임베딩은 한 번만 계산
+                query_embedding = await self._embed_query(clients, query)
                 
-                # 관련 과거 이슈 분석
-                related_past_issues = self._analyze_past_issues_for_issue(issue)
+                # 관련 산업 분석과 관련 과거 이슈 분석을 동시에 실행
+                related_industries, related_past_issues = await asyncio.gather(
+                    self._analyze_related_for_issue(clients, query, query_embedding, "industry"),
+                    self._analyze_related_for_issue(clients, query, query_embedding, "past_issue")
+                )
                 
                 # 안전한 RAG 다차원 신뢰도 계산
                 rag_confidence = self._calculate_rag_confidence(related_industries, related_past_issues)
                 
-                # 기본 이슈에 RAG 결과 추가
-                enriched_issue = issue.copy()
-                enriched_issue.update({
-                    "관련산업": related_industries,
-                    "관련과거이슈": related_past_issues,
-                    "RAG분석신뢰도": rag_confidence
-                })
-                enriched_issues.append(enriched_issue)
-                
-                confidence_display = self._format_confidence_for_display(rag_confidence)
-                print(f"  ✅ 이슈 {i} RAG 완료: 신뢰도 {confidence_display}")
-                
-            except Exception as e:
-                print(f"  ❌ 이슈 {i} RAG 분석 실패: {e}")
-                # 실패한 경우에도 기본 구조 유지하며 다음 이슈로 진행
-                enriched_issue = issue.copy()
-                enriched_issue.update({
-                    "관련산업": [],
-                    "관련과거이슈": [],
-                    "RAG분석신뢰도": {"consistency_score": 0.0, "peak_relevance_score": 0.0},
-                    "error": str(e)
-                })
-                enriched_issues.append(enriched_issue)
-        
-        avg_confidence = self._calculate_average_confidence(enriched_issues)
-        print(f"✅ RAG 분석 완료: 전체 평균 일관성 점수 {avg_confidence}")
-        
-        return enriched_issues
+                # 검색 실패 등으로 빈 결과가 나온 경우는 캐시하지 않음 (다음 실행에서 재시도)
+                if related_industries and related_past_issues:
+                    self._result_cache.set(
+                        result_key, copy.deepcopy((related_industries, related_past_issues, rag_confidence))
+                    )
+            
+            # 기본 이슈에 RAG 결과 추가
+            enriched_issue = issue.copy()
+            enriched_issue.update({
+                "관련산업": related_industries,
+                "관련과거이슈": related_past_issues,
+                "RAG분석신뢰도": rag_confidence
+            })
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("  ✅ 이슈 %d RAG 완료: 신뢰도 %s", i, self._format_confidence_for_display(rag_confidence))
+            return enriched_issue
+            
+        except Exception as e:
+            logger.error("  ❌ 이슈 %d RAG 분석 실패: %s", i, e)
+            # 실패한 경우에도 기본 구조 유지하며 다음 이슈로 진행
+            enriched_issue = issue.copy()
+            enriched_issue.update({
+                "관련산업": [],
+                "관련과거이슈": [],
+                "RAG분석신뢰도": {"consistency_score": 0.0, "peak_relevance_score": 0.0},
+                "error": str(e)
+            })
+            return enriched_issue
 
-    def _analyze_industry_for_issue(self, issue: Dict) -> List[Dict]:
-        """특정 이슈에 대한 관련 산업 분석 (검증 레이어 포함)"""
-        query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
-        
+    async def _analyze_related_for_issue(self, clients: _RunClients, query: str,
+                                         query_embedding: List[float], mode: str) -> List[Dict]:
+        """특정 이슈에 대한 관련 산업/과거 이슈 분석 (검증 레이어 포함)"""
         # Step 1: 벡터 검색으로 1차 후보군 추출
-        vector_candidates = self._vector_search(query, namespace="industry")
+        vector_candidates = await self._vector_search(query_embedding, namespace=mode)
         
         # Step 2: AI Agent가 1차 후보군을 재평가(Rerank)
-        ai_candidates = self._ai_rerank_candidates(query, vector_candidates, "industry")
+        ai_candidates = await self._ai_rerank_candidates(clients, query, vector_candidates, mode)
         
         # Step 3: 결과 통합 및 정렬
-        combined_candidates = self._combine_results(vector_candidates, ai_candidates, "industry")
+        combined_candidates = self._combine_results(vector_candidates, ai_candidates, mode)
         
         # Step 4: 검증 레이어 (상위 3개 후보에 대해 수행)
-        verified_candidates = self._apply_verification_layer(query, combined_candidates)
+        verified_candidates = await self._apply_verification_layer(clients, query, combined_candidates)
         
         # Step 5: 최종 정렬 후 반환
         return sorted(verified_candidates, key=lambda x: x["final_score"], reverse=True)
-
-    def _analyze_past_issues_for_issue(self, issue: Dict) -> List[Dict]:
-        """특정 이슈에 대한 관련 과거 이슈 분석 (검증 레이어 포함)"""
-        query = f"{issue.get('제목', '')}\n{issue.get('원본내용', issue.get('내용', ''))}"
-        
-        # Step 1: 벡터 검색으로 1차 후보군 추출
-        vector_candidates = self._vector_search(query, namespace="past_issue")
-
-        # Step 2: AI Agent가 1차 후보군을 재평가(Rerank)
-        ai_candidates = self._ai_rerank_candidates(query, vector_candidates, "past_issue")
-        
-        # Step 3: 결과 통합 및 정렬
-        combined_candidates = self._combine_results(vector_candidates, ai_candidates, "past_issue")
-        
-        # Step 4: 검증 레이어 (상위 3개 후보에 대해 수행)
-        verified_candidates = self._apply_verification_layer(query, combined_candidates)
-
-        # Step 5: 최종 정렬 후 반환
-        return sorted(verified_candidates, key=lambda x: x["final_score"], reverse=True)
     
-    def _vector_search(self, query: str, namespace: str, top_k: int = 10) -> List[Dict]:
-        """Pinecone 벡터 검색 수행"""
+    async def _vector_search(self, query_embedding: List[float], namespace: str, top_k: int = 10) -> List[Dict]:
+        """Pinecone 벡터 검색 수행 (미리 계산한 임베딩 사용)"""
         try:
-            query_embedding = self.embedding.embed_query(query)
-            search_results = self.index.query(
+            # Pinecone 클라이언트는 동기 방식이라 스레드에서 실행해 다른 검색과 겹치게 함
+            search_results = await asyncio.to_thread(
+                self.index.query,
                 vector=query_embedding, top_k=top_k, include_metadata=True, namespace=namespace
             )
             
             candidates = []
+            seen_names = set()  # 중복 체크용 (리스트 전체를 훑지 않도록 이름 집합 유지)
             for match in search_results.matches:
                 meta = match.metadata or {}
                 name = meta.get("name")
-                if name and not any(c["name"] == name for c in candidates):
+                if name and name not in seen_names:
+                    seen_names.add(name)
                     candidates.append({
                         "name": name,
                         "similarity": round(match.score * 100, 1),
                         "description": meta.get("description", ""),
                         "period": f"{meta.get('start_date', '')} ~ {meta.get('end_date', '')}" if namespace == 'past_issue' else None
                     })
-            print(f"  📊 {namespace} 벡터 검색: {len(candidates)}개 후보 발견")
+            logger.debug("  📊 %s 벡터 검색: %d개 후보 발견", namespace, len(candidates))
             return candidates
         except Exception as e:
-            print(f"❌ {namespace} 벡터 검색 실패: {e}")
+            logger.error("❌ %s 벡터 검색 실패: %s", namespace, e)
             return []
 
-    def _ai_rerank_candidates(self, news_content: str, vector_candidates: List[Dict], mode: str) -> List[Dict]:
+    async def _ai_rerank_candidates(self, clients: _RunClients, news_content: str,
+                                    vector_candidates: List[Dict], mode: str) -> List[Dict]:
         """AI Agent가 벡터 검색 후보군을 재평가하여 순위, 점수, 이유 부여"""
         if not vector_candidates: return []
         
@@ -204,22 +314,21 @@ class RAGService:
 }}""")
         ])
         
-        parser = JsonOutputParser()
-        chain = prompt | self.analyzer_llm | parser
+        chain = prompt | clients.analyzer_llm | self._json_parser
         
         candidate_names = [c['name'] for c in vector_candidates]
         
         try:
-            result = chain.invoke({
+            result = await chain.ainvoke({
                 "news": news_content, 
                 "candidate_list": ", ".join(candidate_names),
                 "field": field_name
             })
             candidates = result.get("candidates", [])
-            print(f"  🤖 AI {mode} 재평가: {len(candidates)}개 후보 생성")
+            logger.debug("  🤖 AI %s 재평가: %d개 후보 생성", mode, len(candidates))
             return candidates
         except Exception as e:
-            print(f"❌ AI {mode} 후보 추출 실패: {e}")
+            logger.error("❌ AI %s 후보 추출 실패: %s", mode, e)
             return []
 
     def _combine_results(self, vector_candidates: List[Dict], ai_candidates: List[Dict], mode: str) -> List[Dict]:
@@ -250,27 +359,37 @@ class RAGService:
         
         return sorted(all_candidates.values(), key=lambda x: x.get("final_score", 0), reverse=True)
 
-    def _apply_verification_layer(self, news_content: str, candidates: List[Dict], top_k: int = 3) -> List[Dict]:
-        """상위 후보군에 대해 검증 레이어 적용"""
-        verified_candidates = []
-        for candidate in candidates[:top_k]:
-            print(f"  🔍 검증 시작: {candidate['name']}")
-            verification_result = self._verify_reasoning(
+    async def _apply_verification_layer(self, clients: _RunClients, news_content: str,
+                                        candidates: List[Dict], top_k: int = 3) -> List[Dict]:
+        """상위 후보군에 대해 검증 레이어 적용 (후보별 검증 호출은 동시에 실행)"""
+        top_candidates = candidates[:top_k]
+        if logger.isEnabledFor(logging.DEBUG):
+            for candidate in top_candidates:
+                logger.debug("  🔍 검증 시작: %s", candidate['name'])
+        
+        verification_results = await asyncio.gather(*(
+            self._verify_reasoning(
+                clients,
                 news_content=news_content,
                 item_name=candidate['name'],
                 reason=candidate.get('ai_reason', '')
             )
+            for candidate in top_candidates
+        ))
+        
+        verified_candidates = []
+        for candidate, verification_result in zip(top_candidates, verification_results):
             candidate['verification'] = verification_result
             if not verification_result.get('is_grounded'):
                 candidate['final_score'] = round(candidate['final_score'] * 0.5, 1) # 검증 실패 시 50% 페널티
-                print(f"    ❌ 검증 실패: {candidate['name']}")
+                logger.debug("    ❌ 검증 실패: %s", candidate['name'])
             else:
-                print(f"    ✅ 검증 성공: {candidate['name']}")
+                logger.debug("    ✅ 검증 성공: %s", candidate['name'])
             verified_candidates.append(candidate)
         
         return verified_candidates
         
-    def _verify_reasoning(self, news_content: str, item_name: str, reason: str) -> dict:
+    async def _verify_reasoning(self, clients: _RunClients, news_content: str, item_name: str, reason: str) -> dict:
         """AI가 생성한 분석 근거가 원본 뉴스에 기반하는지 검증 (실패 이유 포함)"""
         if not reason:
             return {"is_grounded": False, "supporting_quote": "", "unverified_reason": "AI가 분석 근거를 생성하지 않음"}
@@ -295,13 +414,12 @@ JSON 출력 형식:
     "unverified_reason": "실패 이유"
 }}
 """)
-        parser = JsonOutputParser()
-        chain = prompt | self.verifier_llm | parser
+        chain = prompt | clients.verifier_llm | self._json_parser
 
         try:
-            return chain.invoke({ "news": news_content, "item": item_name, "reason": reason })
+            return await chain.ainvoke({ "news": news_content, "item": item_name, "reason": reason })
         except Exception as e:
-            print(f"⚠️ 검증 레이어 실패: {e}")
+            logger.warning("⚠️ 검증 레이어 실패: %s", e)
             # 🔥 [수정] 예외 발생 시 반환값에 unverified_reason 추가
             return {"is_grounded": False, "supporting_quote": "", "unverified_reason": "검증 중 오류 발생"}
 
@@ -368,7 +486,7 @@ JSON 출력 형식:
             
             return round(sum(confidences) / len(confidences), 2) if confidences else 0.0
         except Exception as e:
-            print(f"⚠️ 평균 신뢰도 계산 오류: {e}")
+            logger.warning("⚠️ 평균 신뢰도 계산 오류: %s", e)
             return 0.0
 
     def _format_confidence_for_display(self, rag_confidence) -> str:
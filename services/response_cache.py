@@ -0,0 +1,108 @@
+"""
+API 응답 캐시 서비스
+백그라운드 파이프라인이 돌 때만 바뀌는 조회 응답을 짧은 TTL로 메모리에 보관
+DB 오류 시에는 만료된(stale) 응답이라도 돌려주기 위해 마지막 값을 유지
+캐시는 워커 프로세스마다 따로 있으므로 무효화는 CACHE_VERSION_FILE의 mtime으로 다른 워커에 전달
+"""
+
+import asyncio
+import hashlib
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from config import CACHE_TTL_LATEST_NEWS, CACHE_VERSION_FILE, DATA2_DIR
+from .result_files import find_latest_result_file
+
+# 조건부 GET 응답에 붙일 캐시 정책 (브라우저/프록시는 max-age 이후 ETag로 재검증)
+CACHE_CONTROL_HEADER = f"max-age={CACHE_TTL_LATEST_NEWS}, must-revalidate"
+
+class ResponseCache:
+    """키별 (저장 시각, 응답 본문)을 보관하는 간단한 TTL 캐시"""
+
+    def __init__(self, version_file=CACHE_VERSION_FILE):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._version_file = Path(version_file)
+        self._seen_version = self._read_version()
+
+    def _read_version(self) -> int:
+        """무효화 신호 파일의 mtime (파일이 없으면 0)"""
+        try:
+            return self._version_file.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _sync_version(self):
+        """다른 프로세스가 무효화했으면 이 프로세스의 캐시도 만료 (stat 한 번)"""
+        version = self._read_version()
+        if version != self._seen_version:
+            self._seen_version = version
+            self._expire_all()
+
+    def get_fresh(self, key: str, ttl: float) -> Optional[Any]:
+        """TTL 안에 저장된 응답만 반환"""
+        self._sync_version()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        generated_at, body = entry
+        if time.monotonic() - generated_at > ttl:
+            return None
+        return body
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """만료 여부와 관계없이 마지막 응답 반환 (장애 시 fallback용)"""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: str, body: Any):
+        """응답 저장"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), body)
+
+    def invalidate(self):
+        """전체 캐시 만료 처리 (파이프라인 결과 갱신 시 호출, stale 값은 유지)
+        신호 파일을 갱신해 같은 data2/를 보는 다른 워커 프로세스도 다음 조회 때 만료"""
+        try:
+            self._version_file.parent.mkdir(parents=True, exist_ok=True)
+            self._version_file.touch()
+        except OSError as e:
+            print(f"⚠️ 캐시 무효화 신호 파일 갱신 실패 (다른 워커는 TTL 만료 후 갱신): {e}")
+        self._seen_version = self._read_version()
+        self._expire_all()
+
+    def _expire_all(self):
+        """이 프로세스의 모든 항목을 만료 처리 (stale 값은 유지)"""
+        with self._lock:
+            self._entries = {
+                key: (float("-inf"), body) for key, (_, body) in self._entries.items()
+            }
+
+# 전역 인스턴스
+response_cache = ResponseCache()
+
+def make_etag(*parts) -> str:
+    """데이터 버전 값들로 약한(weak) ETag 생성"""
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    if not if_none_match or not etag:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+async def compute_data_etag(db_service) -> Optional[str]:
+    """파이프라인 데이터 버전 ETag 계산 (1행 조회, 없으면 최신 결과 파일 기준)"""
+    latest_log = await db_service.get_latest_pipeline_log()
+    if latest_log:
+        return make_etag("db", latest_log.get("id"), latest_log.get("created_at"))
+
+    latest_file = await asyncio.to_thread(find_latest_result_file, DATA2_DIR)
+    if latest_file is not None:
+        return make_etag("file", latest_file.name, latest_file.stat().st_mtime_ns)
+    return None
@@ -0,0 +1,56 @@
+"""
+파이프라인 결과 파일 조회 유틸리티
+data2/ 의 최신 *Pipeline_Results.json 파일 탐색 + 파싱 결과 캐시
+"""
+
+import functools
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+PIPELINE_RESULTS_SUFFIX = "Pipeline_Results.json"
+
+# (디렉토리, 접미사) -> (디렉토리 mtime_ns, 최신 파일 경로)
+_LATEST_FILE_CACHE: Dict[Tuple[str, str], Tuple[int, Optional[Path]]] = {}
+
+def find_latest_result_file(data_dir, suffix: str = PIPELINE_RESULTS_SUFFIX) -> Optional[Path]:
+    """가장 최근 결과 파일 경로 반환 (디렉토리 mtime이 그대로면 재탐색하지 않음)"""
+    data_dir = Path(data_dir)
+    try:
+        dir_mtime = data_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cache_key = (str(data_dir), suffix)
+    cached = _LATEST_FILE_CACHE.get(cache_key)
+    if cached and cached[0] == dir_mtime:
+        return cached[1]
+
+    # glob 대신 scandir 한 번으로 이름 필터 + mtime 비교 (Path 객체는 최종 결과에만 생성)
+    with os.scandir(data_dir) as entries:
+        latest = max(
+            ((entry.stat().st_mtime, entry.path) for entry in entries
+             if entry.name.endswith(suffix) and entry.is_file()),
+            default=None
+        )
+    latest_file = Path(latest[1]) if latest else None
+
+    _LATEST_FILE_CACHE[cache_key] = (dir_mtime, latest_file)
+    return latest_file
+
+@functools.lru_cache(maxsize=4)
+def _parse_result_file(path: str, mtime_ns: int) -> Dict:
+    """결과 파일 파싱 (경로 + 파일 mtime 기준 캐시, 반환값은 수정하지 말 것)"""
+    # 읽기 전용 mmap을 바로 파싱해 파일 크기만큼의 중간 bytes 복사를 피함
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+def load_result_file(path: Path) -> Dict:
+    """결과 파일 로드 (파일이 다시 쓰이면 mtime이 바뀌어 새로 파싱)
+    동기 함수이므로 async 핸들러에서는 asyncio.to_thread로 호출할 것"""
+    return _parse_result_file(str(path), path.stat().st_mtime_ns)
@@ -1,13 +1,17 @@
 # services/simulation_service.py
 
 import os
-import json
 import io
 import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 import openai
+import numpy as np
+import orjson
 import yfinance as yf
 import pandas as pd
 import matplotlib
@@ -16,6 +20,13 @@ import matplotlib.font_manager as fm
 
 # --- 설정 ---
 matplotlib.use('Agg')
+
+# 과거 구간 종가 캐시 위치와 캐시에 없는 종목을 동시에 받을 최대 스레드 수
+PRICE_CACHE_DIR = Path("data/yf_cache")
+PRICE_FETCH_MAX_WORKERS = 8
+
+# 코멘터리 프롬프트용 결과 직렬화 옵션 (pandas/yfinance 값이 numpy 스칼라로 섞여 들어와도 처리)
+COMMENTARY_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
 try:
@@ -25,6 +36,57 @@ try:
 except FileNotFoundError:
     print("경고: 맑은 고딕 폰트를 찾을 수 없습니다.")
 
+def _price_cache_path(ticker: str, start: str, end: str) -> Path:
+    """(종목, 시작일, 종료일) 종가 캐시 파일 경로"""
+    digest = hashlib.sha1(f"{ticker}|{start}|{end}".encode("utf-8")).hexdigest()
+    return PRICE_CACHE_DIR / f"{digest}.pkl"
+
+def _read_price_cache(ticker: str, start: str, end: str) -> Optional[pd.Series]:
+    """캐시된 종가 시계열 로드 (없거나 읽기 실패 시 None)"""
+    path = _price_cache_path(ticker, start, end)
+    if not path.exists():
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception as e:
+        print(f"⚠️ 주가 캐시 로드 실패 {ticker}: {e}")
+        return None
+
+def _write_price_cache(ticker: str, start: str, end: str, close: pd.Series):
+    """종가 시계열을 캐시에 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = _price_cache_path(ticker, start, end)
+    tmp_path = path.with_suffix(".pkl.tmp")
+    try:
+        PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        close.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ 주가 캐시 저장 실패 {ticker}: {e}")
+
+def _fetch_close_series(ticker: str, start: str, end: str) -> Optional[pd.Series]:
+    """종목 하나의 종가 시계열 다운로드 (스레드에서 동시에 호출되므로 전역 상태를 쓰는 yf.download 대신 Ticker.history 사용)"""
+    try:
+        data = yf.Ticker(ticker).history(start=start, end=end, auto_adjust=False)
+    except Exception as e:
+        print(f"❌ 주가 다운로드 오류 {ticker}: {e}")
+        return None
+    if data.empty:
+        return None
+    close = data['Close'].dropna()
+    # timezone 처리를 단순화 (거래소 현지 날짜 기준으로 timezone 제거)
+    close.index = pd.to_datetime(close.index).tz_localize(None)
+    return close.rename(ticker)
+
+def _edge_prices(values: np.ndarray, valid: np.ndarray, dates: np.ndarray, last: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(날짜 x 종목) 종가 배열에서 종목(열)별 첫/마지막 유효 종가와 그 날짜, 유효값 존재 여부를 반환"""
+    n_rows, n_cols = values.shape
+    if n_rows == 0:
+        return np.full(n_cols, np.nan), np.full(n_cols, np.datetime64('NaT'), dtype='datetime64[ns]'), np.zeros(n_cols, dtype=bool)
+    
+    rows = n_rows - 1 - valid[::-1].argmax(axis=0) if last else valid.argmax(axis=0)
+    cols = np.arange(n_cols)
+    return values[rows, cols], dates[rows], valid.any(axis=0)
+
 class SimulationService:
     def __init__(self):
         self.client = openai.OpenAI()
@@ -55,7 +117,7 @@ class SimulationService:
                 messages=[{"role": "system", "content": "당신은 한국 경제사와 주식시장 역사에 정통한 전문가입니다."}, {"role": "user", "content": prompt}],
                 response_format={"type": "json_object"}, temperature=0.1
             )
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
         except Exception as e:
             print(f"AI 산업 분석 오류: {e}")
             return None
@@ -94,7 +156,7 @@ class SimulationService:
                 messages=[{"role": "system", "content": "당신은 특정 산업과 이벤트에 대한 종목 분석 전문가입니다."}, {"role": "user", "content": prompt}],
                 response_format={"type": "json_object"}, temperature=0.3
             )
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
         except Exception as e:
             print(f"AI 종목 분석 오류: {e}")
             return None
@@ -108,7 +170,7 @@ class SimulationService:
         {issue_name}
 
         [사용자의 예측 및 실제 결과]
-        {json.dumps(results, indent=2, ensure_ascii=False)}
+        {orjson.dumps(results, option=COMMENTARY_JSON_OPTIONS).decode()}
 
         [피드백 요청]
         위 결과를 바탕으로, 다음 항목을 포함하여 사용자에게 유익한 분석 코멘트를 마크다운 형식으로 작성해주세요.
@@ -137,10 +199,11 @@ class SimulationService:
             fig, ax = plt.subplots(figsize=(12, 6))
             ax.axvline(x=event_date, color='red', linestyle='--', linewidth=1.5, label=f'이벤트 시점 ({event_date_str})')
 
+            close = self._download_close_prices(list(tickers), start_date, end_date)
             for ticker, name in tickers.items():
-                data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-                if not data.empty:
-                    ax.plot(data.index, data['Close'], label=f'{name} ({ticker})', linewidth=2, alpha=0.8)
+                if ticker in close:
+                    data = close[ticker].dropna()
+                    ax.plot(data.index, data, label=f'{name} ({ticker})', linewidth=2, alpha=0.8)
 
             ax.set_title("과거 사례 주가 변동 추이", fontsize=16, weight='bold')
             ax.legend()
@@ -155,6 +218,38 @@ class SimulationService:
             print(f"차트 생성 오류: {e}")
             return ""
 
+    def _download_close_prices(self, tickers: List[str], start, end) -> pd.DataFrame:
+        """여러 종목의 종가를 (날짜 x 종목) DataFrame으로 반환
+        이미 지난 구간은 디스크 캐시를 재사용하고, 캐시에 없는 종목만 종목별로 동시에 다운로드"""
+        start_str = pd.Timestamp(start).strftime('%Y-%m-%d')
+        end_str = pd.Timestamp(end).strftime('%Y-%m-%d')
+        # 조회 구간 끝이 오늘 이후면 아직 데이터가 덜 쌓였으므로 캐시하지 않음
+        cacheable = pd.Timestamp(end_str) < pd.Timestamp.now().normalize()
+        
+        series = {}
+        missing = []
+        for ticker in tickers:
+            cached = _read_price_cache(ticker, start_str, end_str) if cacheable else None
+            if cached is None:
+                missing.append(ticker)
+            else:
+                series[ticker] = cached
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(PRICE_FETCH_MAX_WORKERS, len(missing))) as executor:
+                fetched = list(executor.map(lambda ticker: _fetch_close_series(ticker, start_str, end_str), missing))
+            for ticker, close in zip(missing, fetched):
+                if close is None:
+                    continue
+                series[ticker] = close
+                if cacheable:
+                    _write_price_cache(ticker, start_str, end_str, close)
+        
+        if not series:
+            return pd.DataFrame(index=pd.DatetimeIndex([]))
+        # 요청한 종목 순서대로 열을 모아 DataFrame을 한 번에 구성 (열을 하나씩 추가하거나 나중에 재정렬하지 않음)
+        return pd.concat({ticker: series[ticker] for ticker in tickers if ticker in series}, axis=1).sort_index()
+
     def get_investment_results(self, event_date_str: str, tickers: Dict, investments: Dict) -> Dict:
         """사용자의 투자를 기반으로 실제 수익률 및 손익을 계산"""
         try:
@@ -166,110 +261,89 @@ class SimulationService:
         # 데이터 다운로드 기간을 충분히 확보
         start_date_for_download = event_date - timedelta(days=30)
         end_date_for_download = event_date + timedelta(days=30)
+        ticker_list = list(tickers.keys())
         results = {}
         
-        for ticker in tickers.keys():
-            try:
-                print(f"처리 중: {ticker}")
-                
-                # yfinance에서 데이터 다운로드
-                data = yf.download(ticker, start=start_date_for_download, end=end_date_for_download, progress=False)
-                
-                if data.empty:
-                    raise ValueError(f"{ticker}: yfinance에서 데이터를 가져오지 못했습니다.")
-                
-                # 데이터가 있는지 확인
-                print(f"{ticker} 데이터 수: {len(data)}")
-                print(f"{ticker} 날짜 범위: {data.index[0]} ~ {data.index[-1]}")
-                
-                # timezone 처리를 단순화
-                # yfinance 데이터는 보통 timezone이 없거나 UTC
-                data.index = pd.to_datetime(data.index).tz_localize(None)
-                event_date_normalized = pd.Timestamp(event_date).tz_localize(None)
-                
-                # 이벤트 날짜 또는 그 이전의 가장 가까운 거래일 찾기
-                before_event = data[data.index <= event_date_normalized]
-                if before_event.empty:
-                    raise ValueError(f"{ticker}: 이벤트 날짜 이전 데이터가 없습니다.")
-                
-                # 시작 가격 (이벤트 날짜 또는 그 직전 거래일의 종가)
-                start_idx = -1  # 마지막 거래일
-                start_price = float(before_event['Close'].iloc[start_idx])
-                start_date_actual = before_event.index[start_idx]
-                
-                print(f"{ticker} 시작 가격: {start_price} (날짜: {start_date_actual})")
-                
-                # 이벤트 이후 14일 이내의 데이터 찾기
-                after_event = data[data.index > event_date_normalized]
-                if after_event.empty:
-                    raise ValueError(f"{ticker}: 이벤트 이후 데이터가 없습니다.")
-                
-                # 14일 후 또는 가장 가까운 거래일 찾기
-                target_end_date = event_date_normalized + timedelta(days=14)
-                after_event_in_range = after_event[after_event.index <= target_end_date]
-                
-                if after_event_in_range.empty:
-                    # 14일 이내에 거래일이 없으면 그 이후 첫 거래일 사용
-                    print(f"{ticker}: 14일 이내 거래일이 없어 직후 거래일 사용")
-                    end_idx = 0  # 이벤트 이후 첫 거래일
-                    end_price = float(after_event['Close'].iloc[end_idx])
-                    end_date_actual = after_event.index[end_idx]
-                else:
-                    # 14일 이내 마지막 거래일 사용
-                    end_idx = -1
-                    end_price = float(after_event_in_range['Close'].iloc[end_idx])
-                    end_date_actual = after_event_in_range.index[end_idx]
-                
-                print(f"{ticker} 종료 가격: {end_price} (날짜: {end_date_actual})")
-                
-                # 수익률 계산
-                return_rate = ((end_price - start_price) / start_price) * 100
-                investment = investments.get(ticker, 0)
-                
-                # 투자금이 0인 경우 처리
-                if investment == 0:
-                    final_value = 0
-                    profit_loss = 0
-                else:
-                    final_value = investment * (1 + return_rate / 100)
-                    profit_loss = final_value - investment
-                
-                # 상태 결정
-                if return_rate > 0.1:  # 0.1% 이상 상승
-                    status = 'up'
-                elif return_rate < -0.1:  # 0.1% 이상 하락
-                    status = 'down'
-                else:
-                    status = 'flat'  # 거의 변동 없음
-                
-                results[ticker] = {
-                    'status': status,
-                    'return_rate': round(return_rate, 2),
-                    'investment': investment,
-                    'final_value': round(final_value, 2),
-                    'profit_loss': round(profit_loss, 2),
-                    'start_price': round(start_price, 2),
-                    'end_price': round(end_price, 2),
-                    'start_date': start_date_actual.strftime('%Y-%m-%d'),
-                    'end_date': end_date_actual.strftime('%Y-%m-%d')
-                }
-                
-                print(f"{ticker} 결과: 수익률 {return_rate:.2f}%, 상태: {status}")
-                
-            except Exception as e:
-                print(f"❌ 결과 계산 오류 {ticker}: {str(e)}")
+        try:
+            # 전체 종목을 한 번에 받아 (날짜 x 종목) 종가 행렬로 계산
+            close = self._download_close_prices(ticker_list, start_date_for_download, end_date_for_download)
+        except Exception as e:
+            print(f"❌ 주가 다운로드 오류: {e}")
+            close = pd.DataFrame(index=pd.DatetimeIndex([]))
+        if list(close.columns) != ticker_list:
+            # 데이터를 받지 못한 종목이 있을 때만 빈 열을 채워 종목 순서를 맞춤
+            close = close.reindex(columns=ticker_list)
+        
+        event_date_normalized = pd.Timestamp(event_date)
+        target_end_date = event_date_normalized + timedelta(days=14)
+        # 날짜순 인덱스에서 이벤트/14일 후 위치를 이진 탐색해 행 범위로 자름 (불리언 마스크마다 복사본을 만들지 않음)
+        event_pos = close.index.searchsorted(event_date_normalized, side='right')
+        range_end_pos = close.index.searchsorted(target_end_date, side='right')
+        
+        # 종가 행렬은 연속된 float64 배열로 한 번만 변환하고, 구간별 계산은 그 배열의 행 슬라이스(view)로 수행
+        values = np.ascontiguousarray(close.to_numpy(dtype=np.float64))
+        valid = ~np.isnan(values)
+        dates = close.index.to_numpy(dtype='datetime64[ns]')
+        
+        # 시작 가격: 이벤트 날짜 또는 그 직전 거래일의 종가
+        start_prices, start_dates, has_start = _edge_prices(
+            values[:event_pos], valid[:event_pos], dates[:event_pos], last=True)
+        # 종료 가격: 14일 이내 마지막 거래일, 없으면 이벤트 이후 첫 거래일
+        range_prices, range_dates, has_range = _edge_prices(
+            values[event_pos:range_end_pos], valid[event_pos:range_end_pos], dates[event_pos:range_end_pos], last=True)
+        first_prices, first_dates, has_after = _edge_prices(
+            values[event_pos:], valid[event_pos:], dates[event_pos:], last=False)
+        end_prices = np.where(has_range, range_prices, first_prices)
+        end_dates = np.where(has_range, range_dates, first_dates)
+        
+        # 수익률/평가금액/손익/상태를 종목 벡터로 한 번에 계산 (투자금 0이면 평가금액·손익 0)
+        # 종목별 투자금은 한 번만 조회해 벡터 계산과 결과 dict 구성에 같이 사용
+        invested = [investments.get(ticker, 0) for ticker in ticker_list]
+        investment_values = np.array(invested, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return_rates = (end_prices - start_prices) / start_prices * 100
+        final_values = np.where(investment_values == 0, 0.0, investment_values * (1 + return_rates / 100))
+        profit_losses = final_values - investment_values
+        statuses = np.select([return_rates > 0.1, return_rates < -0.1], ['up', 'down'], default='flat')
+        
+        has_data = valid.any(axis=0)
+        for i, ticker in enumerate(ticker_list):
+            if not has_data[i]:
+                error = f"{ticker}: yfinance에서 데이터를 가져오지 못했습니다."
+            elif not has_start[i]:
+                error = f"{ticker}: 이벤트 날짜 이전 데이터가 없습니다."
+            elif not has_after[i]:
+                error = f"{ticker}: 이벤트 이후 데이터가 없습니다."
+            else:
+                error = None
+            
+            if error:
+                print(f"❌ 결과 계산 오류 {ticker}: {error}")
                 results[ticker] = {
                     'status': 'error',
                     'return_rate': 0,
-                    'investment': investments.get(ticker, 0),
+                    'investment': invested[i],
                     'profit_loss': 0,
-                    'final_value': investments.get(ticker, 0),
-                    'message': str(e),
+                    'final_value': invested[i],
+                    'message': error,
                     'start_price': 0,
                     'end_price': 0,
                     'start_date': '',
                     'end_date': ''
                 }
+                continue
+            
+            results[ticker] = {
+                'status': str(statuses[i]),
+                'return_rate': round(float(return_rates[i]), 2),
+                'investment': invested[i],
+                'final_value': round(float(final_values[i]), 2),
+                'profit_loss': round(float(profit_losses[i]), 2),
+                'start_price': round(float(start_prices[i]), 2),
+                'end_price': round(float(end_prices[i]), 2),
+                'start_date': pd.Timestamp(start_dates[i]).strftime('%Y-%m-%d'),
+                'end_date': pd.Timestamp(end_dates[i]).strftime('%Y-%m-%d')
+            }
         
         print(f"최종 결과: {results}")
         return results
@@ -0,0 +1,85 @@
+"""
+메모리 캐시 정적 파일 서비스
+static/ 의 작은 파일을 시작 시 메모리에 올려 요청마다 stat/read 하지 않고,
+Cache-Control + 강한 ETag로 브라우저 재요청은 304로 응답
+(파일을 수정하면 서버를 재시작해야 반영됨)
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, Tuple
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse, Response
+
+from config import STATIC_CACHE_MAX_AGE
+
+# 이 크기 이하의 파일만 메모리에 보관 (큰 파일은 기존 StaticFiles 경로로 전송)
+MAX_PRELOAD_BYTES = 256 * 1024
+
+# 파일명에 콘텐츠 해시가 포함된 경우 (예: app.3f9a1c2b.js) 내용이 바뀌면 이름도 바뀌므로 영구 캐시
+_HASHED_NAME_PATTERN = re.compile(r"\.[0-9a-f]{8,}\.")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = f"public, max-age={STATIC_CACHE_MAX_AGE}, must-revalidate"
+
+def _cache_control_for(path: str) -> str:
+    """파일명 패턴에 따른 Cache-Control 값"""
+    if _HASHED_NAME_PATTERN.search(os.path.basename(path)):
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+class CachedStaticFiles(StaticFiles):
+    """작은 정적 파일을 메모리에서 바로 응답하는 StaticFiles"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 상대 경로 -> (본문, ETag, media type)
+        self._mem: Dict[str, Tuple[bytes, str, str]] = {}
+        self._preload()
+
+    def _preload(self):
+        """디렉토리를 훑어 작은 파일을 메모리에 적재"""
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                if os.path.getsize(full_path) > MAX_PRELOAD_BYTES:
+                    continue
+
+                with open(full_path, "rb") as f:
+                    body = f.read()
+                etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                media_type = mimetypes.guess_type(name)[0] or "text/plain"
+                # get_path()가 만드는 경로와 같은 형식(os 구분자, 정규화)으로 저장
+                rel_path = os.path.normpath(os.path.relpath(full_path, self.directory))
+                self._mem[rel_path] = (body, etag, media_type)
+
+        print(f"✅ 정적 파일 {len(self._mem)}개 메모리 적재 완료")
+
+    async def get_response(self, path: str, scope) -> Response:
+        # StaticFiles와 같이 GET/HEAD 외의 메서드는 메모리 캐시를 보기 전에 405 반환
+        if scope["method"] not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405)
+
+        cached = self._mem.get(os.path.normpath(path))
+        if cached is None:
+            # 디렉토리 index, 큰 파일, 404 등은 기존 동작 그대로 + 캐시 헤더만 추가
+            response = await super().get_response(path, scope)
+            if response.status_code == 200:
+                response.headers.setdefault("Cache-Control", _cache_control_for(path))
+            return response
+
+        body, etag, media_type = cached
+        headers = {"ETag": etag, "Cache-Control": _cache_control_for(path)}
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        return Response(body, media_type=media_type, headers=headers)
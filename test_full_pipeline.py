@@ -1,7 +1,12 @@
 # test_rag_correct.py
+import asyncio
 import json
+from logging_setup import setup_logging
 from services.rag_service import RAGService
 
+# RAG 서비스 진행 로그를 콘솔에 출력
+setup_logging()
+
 try:
     print("📊 올바른 구조로 RAG 분석 테스트...")
     
@@ -20,7 +25,7 @@ try:
     # RAG 분석 실행
     rag = RAGService()
     print("🔍 RAG 분석 시작...")
-    enriched_issues = rag.analyze_issues_with_rag(filtered_issues)
+    enriched_issues = asyncio.run(rag.analyze_issues_with_rag(filtered_issues))
     print(f"✅ RAG 분석 성공! 결과: {len(enriched_issues)}개")
     
     # 결과 저장 (Pipeline_Results 형태로)